@@ -4,11 +4,21 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from exports.db_clients.lifespan import lifespan as shared_lifespan
+from exports.schema.constants import IMAGE_EMBEDDING_CACHE_SIZE
 from exports.utils.logger import get_logger
 
+from .frame_timelines import FrameTimelineCache
+from .health_monitor import ServiceHealthMonitor, default_probes
+from .ingest_jobs import IngestJobStore, IngestWorkerPool
+from .ingest_pipeline import IngestServices, run_ingest_job
+from .query_embeddings import QueryEmbeddingCache
+from .search_cursors import SearchCursorStore
+from .search_log import SearchQueryLog
+from .search_results import SearchResultCache
 from .routes.upload_route import router as upload_router
 from .routes.search_route import router as search_router
 from .routes.health_route import router as health_router
+from .routes.jobs_route import router as jobs_router
 from .service_clients.media_processor_client import MediaProcessorClient
 from .service_clients.embedder_client import EmbedderClient
 from .service_clients.indexer_client import IndexerClient
@@ -26,10 +36,17 @@ async def lifespan(app: FastAPI):
     long-lived HTTP client per downstream service, exposed on `app.state`:
 
         app.state.media_processor : MediaProcessorClient
-        app.state.embedder        : EmbedderClient
+        app.state.embedder        : EmbedderClient (owns the query embedding cache)
         app.state.indexer         : IndexerClient
         app.state.transcribe      : TranscribeClient
         app.state.caption         : CaptionClient
+        app.state.frame_timelines : FrameTimelineCache (search preview frames)
+        app.state.search_results  : SearchResultCache (per index generation)
+        app.state.search_cursors  : SearchCursorStore (paginated search candidate sets)
+        app.state.search_log      : SearchQueryLog (batched search_queries writer)
+        app.state.health_monitor  : ServiceHealthMonitor (cached /health/all probes)
+        app.state.ingest_jobs     : IngestJobStore (durable /upload/video job queue)
+        app.state.ingest_workers  : IngestWorkerPool (runs queued ingest jobs)
 
     Routes pull these out of `request.app.state` instead of opening a
     fresh `httpx.AsyncClient` per request.
@@ -37,7 +54,12 @@ async def lifespan(app: FastAPI):
     async with shared_lifespan(app):
         logger.info("Connecting downstream service clients...")
         media_processor = await MediaProcessorClient().connect()
-        embedder = await EmbedderClient().connect()
+        query_cache = QueryEmbeddingCache()
+        query_cache.load()
+        image_cache = QueryEmbeddingCache(max_entries=IMAGE_EMBEDDING_CACHE_SIZE, path=None)
+        embedder = await EmbedderClient(
+            query_cache=query_cache, image_cache=image_cache
+        ).connect()
         indexer = await IndexerClient().connect()
         transcribe = await TranscribeClient().connect()
         caption = await CaptionClient().connect()
@@ -47,6 +69,33 @@ async def lifespan(app: FastAPI):
         app.state.indexer = indexer
         app.state.transcribe = transcribe
         app.state.caption = caption
+        app.state.frame_timelines = FrameTimelineCache()
+        app.state.search_results = SearchResultCache()
+        app.state.search_cursors = SearchCursorStore()
+        search_log = SearchQueryLog(app.state.supabase).start()
+        app.state.search_log = search_log
+        health_monitor = ServiceHealthMonitor(
+            default_probes(media_processor, embedder, indexer, transcribe, caption)
+        ).start()
+        app.state.health_monitor = health_monitor
+        ingest_jobs = IngestJobStore()
+        ingest_jobs.load()
+        app.state.ingest_jobs = ingest_jobs
+        ingest_services = IngestServices(
+            supabase=app.state.supabase,
+            media_processor=media_processor,
+            embedder=embedder,
+            indexer=indexer,
+            transcribe=transcribe,
+            caption=caption,
+            frame_timelines=app.state.frame_timelines,
+            search_results=app.state.search_results,
+        )
+        ingest_workers = IngestWorkerPool(
+            ingest_jobs,
+            lambda job, progress: run_ingest_job(ingest_services, job, progress),
+        ).start()
+        app.state.ingest_workers = ingest_workers
         logger.info("✅ Downstream service clients ready.")
 
         try:
@@ -57,8 +106,14 @@ async def lifespan(app: FastAPI):
             yield
         finally:
             logger.info("Closing downstream service clients...")
+            # Jobs interrupted here stay "running" and are re-queued on next start.
+            await ingest_workers.close()
+            ingest_jobs.close()
+            await health_monitor.close()
+            await search_log.close()
             await media_processor.close()
             await embedder.close()
+            query_cache.close()
             await indexer.close()
             await transcribe.close()
             await caption.close()
@@ -67,6 +122,13 @@ async def lifespan(app: FastAPI):
             app.state.indexer = None
             app.state.transcribe = None
             app.state.caption = None
+            app.state.frame_timelines = None
+            app.state.search_results = None
+            app.state.search_cursors = None
+            app.state.search_log = None
+            app.state.health_monitor = None
+            app.state.ingest_jobs = None
+            app.state.ingest_workers = None
             logger.info("✅ Downstream service clients closed.")
 
 
@@ -101,6 +163,7 @@ app.add_middleware(
 app.include_router(upload_router, prefix="/upload", tags=["Upload"])
 app.include_router(search_router, prefix="/search", tags=["Search"])
 app.include_router(health_router, tags=["Health"])
+app.include_router(jobs_router, prefix="/jobs", tags=["Jobs"])
 
 
 # -------------------------------
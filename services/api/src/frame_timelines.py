@@ -0,0 +1,101 @@
+"""In-process LRU cache of per-media frame timelines for nearest-frame lookups.
+
+Search hydration needs the frame closest to a transcript/caption midpoint.
+Each cached ``FrameTimeline`` holds one media's frames as parallel arrays
+sorted by timestamp, so a lookup is a bisect with no network I/O once the
+media is warm. Entries remember the media status they were built under and
+are dropped when that status changes (``invalidate`` or a status mismatch
+seen by ``get_many``).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from uuid import UUID
+
+from exports.db_clients.supabaseDB import SupabaseDB
+from exports.schema.constants import FRAME_TIMELINE_CACHE_SIZE, MediaStatus
+from exports.schema.models import FrameTimestampRow
+
+
+@dataclass(frozen=True)
+class FrameTimeline:
+    status: MediaStatus
+    timestamps: Tuple[float, ...]
+    frame_ids: Tuple[UUID, ...]
+    frame_urls: Tuple[str, ...]
+
+    @classmethod
+    def from_rows(
+        cls, status: MediaStatus, rows: Iterable[FrameTimestampRow]
+    ) -> "FrameTimeline":
+        ordered = sorted(rows, key=lambda row: row.timestamp)
+        return cls(
+            status=status,
+            timestamps=tuple(row.timestamp for row in ordered),
+            frame_ids=tuple(row.id for row in ordered),
+            frame_urls=tuple(row.frame_url for row in ordered),
+        )
+
+    def nearest(self, timestamp: float) -> Optional[Tuple[UUID, str]]:
+        """``(frame_id, frame_url)`` closest to ``timestamp``; ties keep the earlier frame."""
+        n = len(self.timestamps)
+        if n == 0:
+            return None
+        i = bisect_left(self.timestamps, timestamp)
+        if i == n:
+            i = n - 1
+        elif i > 0 and timestamp - self.timestamps[i - 1] <= self.timestamps[i] - timestamp:
+            i -= 1
+        return self.frame_ids[i], self.frame_urls[i]
+
+
+class FrameTimelineCache:
+    """LRU of ``media_id -> FrameTimeline``; misses are filled in one batched query."""
+
+    def __init__(self, max_media: int = FRAME_TIMELINE_CACHE_SIZE) -> None:
+        self._max_media = max(1, max_media)
+        self._entries: OrderedDict[UUID, FrameTimeline] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, media_id: UUID | str) -> None:
+        self._entries.pop(UUID(str(media_id)), None)
+
+    async def get_many(
+        self,
+        supabase: SupabaseDB,
+        statuses: Mapping[UUID, MediaStatus],
+    ) -> Dict[UUID, FrameTimeline]:
+        """Timelines for every media in ``statuses`` (its current status per media)."""
+        found: Dict[UUID, FrameTimeline] = {}
+        missing: List[UUID] = []
+        for media_id, status in statuses.items():
+            timeline = self._entries.get(media_id)
+            if timeline is not None and timeline.status == status:
+                self._entries.move_to_end(media_id)
+                found[media_id] = timeline
+            else:
+                missing.append(media_id)
+
+        if missing:
+            rows_by_media: Dict[UUID, List[FrameTimestampRow]] = defaultdict(list)
+            for row in await supabase.get_frame_timestamps_by_media_ids(list(missing)):
+                rows_by_media[row.media_id].append(row)
+            for media_id in missing:
+                timeline = FrameTimeline.from_rows(
+                    statuses[media_id], rows_by_media.get(media_id, [])
+                )
+                found[media_id] = timeline
+                self._put(media_id, timeline)
+        return found
+
+    def _put(self, media_id: UUID, timeline: FrameTimeline) -> None:
+        self._entries[media_id] = timeline
+        self._entries.move_to_end(media_id)
+        while len(self._entries) > self._max_media:
+            self._entries.popitem(last=False)
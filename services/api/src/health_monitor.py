@@ -0,0 +1,176 @@
+"""Background health probing of the downstream services.
+
+``/health/all`` used to call each service in turn through clients whose
+timeouts run to many minutes, so one hung service stalled the endpoint.
+The monitor instead probes every service concurrently, each under its own
+``HEALTH_PROBE_TIMEOUT`` deadline, every ``HEALTH_REFRESH_SECONDS``, and
+the route serves the last snapshot. Load-balancer polling therefore never
+triggers downstream calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Mapping, Optional
+
+from exports.schema.constants import HEALTH_PROBE_TIMEOUT, HEALTH_REFRESH_SECONDS
+from exports.utils.logger import get_logger
+
+logger = get_logger()
+
+Probe = Callable[[], Awaitable[dict]]
+
+
+def _live_entry(*, live: bool, error: str | None = None, **extra) -> dict:
+    entry: dict = {"live": live, **extra}
+    if error:
+        entry["error"] = error
+    return entry
+
+
+def _service_status(live: bool, ready: bool | None = None) -> str:
+    if not live:
+        return "unhealthy"
+    if ready is False:
+        return "degraded"
+    return "healthy"
+
+
+def default_probes(media_processor, embedder, indexer, transcribe, caption) -> Dict[str, Probe]:
+    """One probe per downstream service; each returns that service's entry."""
+
+    async def probe_media_processor() -> dict:
+        await media_processor.health_check()
+        return _live_entry(live=True, ready=True)
+
+    async def probe_embedder() -> dict:
+        ready_payload = await embedder.get_ready()
+        return _live_entry(
+            live=True,
+            ready=bool(ready_payload.get("model_loaded")),
+            model_loaded=ready_payload.get("model_loaded"),
+            model_name=ready_payload.get("model_name"),
+        )
+
+    async def probe_indexer() -> dict:
+        stats = await indexer.get_index_stats()
+        return _live_entry(
+            live=True,
+            ready=bool(stats.get("index_loaded")),
+            index_loaded=stats.get("index_loaded"),
+            ntotal=stats.get("ntotal"),
+            ntotal_sum=stats.get("ntotal_sum"),
+            max_id=stats.get("max_id"),
+            disk_ntotal=stats.get("disk_ntotal"),
+            memory_disk_drift=stats.get("memory_disk_drift"),
+        )
+
+    async def probe_transcribe() -> dict:
+        ready_payload = await transcribe.get_ready()
+        return _live_entry(
+            live=True,
+            ready=bool(ready_payload.get("model_loaded")),
+            model_loaded=ready_payload.get("model_loaded"),
+            model_name=ready_payload.get("model_name"),
+        )
+
+    async def probe_caption() -> dict:
+        await caption.health_check()
+        return _live_entry(live=True, ready=True)
+
+    return {
+        "media_processor": probe_media_processor,
+        "embedder": probe_embedder,
+        "indexer": probe_indexer,
+        "transcribe": probe_transcribe,
+        "caption": probe_caption,
+    }
+
+
+class ServiceHealthMonitor:
+    """Periodic concurrent prober owned by the API lifespan (``start`` / ``close``)."""
+
+    def __init__(
+        self,
+        probes: Mapping[str, Probe],
+        *,
+        probe_timeout: float = HEALTH_PROBE_TIMEOUT,
+        refresh_seconds: float = HEALTH_REFRESH_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._probes = dict(probes)
+        self._probe_timeout = probe_timeout
+        self._refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._services: Dict[str, dict] = {
+            name: {"live": False, "ready": None, "status": "unknown"}
+            for name in self._probes
+        }
+        self._checked_at: Optional[float] = None
+        self._refreshing: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> "ServiceHealthMonitor":
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    async def close(self) -> None:
+        for task in (self._task, self._refreshing):
+            if task is not None:
+                task.cancel()
+        for task in (self._task, self._refreshing):
+            if task is not None:
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._task = None
+        self._refreshing = None
+
+    async def refresh(self) -> None:
+        """Probe everything now; concurrent callers share one round of probes."""
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._probe_all())
+        await asyncio.shield(self._refreshing)
+
+    def snapshot(self) -> Dict[str, object]:
+        """Last probe results (copies), when they were taken and how old they are."""
+        checked_at = self._checked_at
+        return {
+            "services": {name: dict(entry) for name, entry in self._services.items()},
+            "checked_at": checked_at,
+            "age_seconds": (
+                self._clock() - checked_at if checked_at is not None else None
+            ),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Health probe round failed")
+            await asyncio.sleep(self._refresh_seconds)
+
+    async def _probe_all(self) -> None:
+        names = list(self._probes)
+        entries = await asyncio.gather(*(self._probe(name) for name in names))
+        self._services = dict(zip(names, entries))
+        self._checked_at = self._clock()
+
+    async def _probe(self, name: str) -> dict:
+        try:
+            entry = await asyncio.wait_for(self._probes[name](), self._probe_timeout)
+        except asyncio.TimeoutError:
+            entry = _live_entry(
+                live=False, error=f"no response within {self._probe_timeout:g}s"
+            )
+        except Exception as exc:
+            entry = _live_entry(live=False, error=str(exc))
+        ready = entry.get("ready")
+        entry["status"] = _service_status(
+            bool(entry.get("live")), ready if isinstance(ready, bool) else None
+        )
+        return entry
@@ -0,0 +1,392 @@
+"""Durable ingest job queue (SQLite) and the API's worker pool.
+
+``/upload/video`` streams the file to MinIO, enqueues a job and returns its
+id; workers claim queued jobs and drive the ingest stages, recording
+per-stage status and timing that ``GET /jobs/{id}`` reports.
+
+Jobs survive restarts: on ``load()`` any job left ``running`` by a stopped
+process is queued again (or failed once it has used
+``INGEST_JOB_MAX_ATTEMPTS``). A failed attempt is retried from the first
+stage with a new media row; the previous attempt's row is marked failed
+(see ``run_ingest_job``) and its already-indexed vectors, which FAISS
+cannot delete, are dropped by search since it only serves ``ready`` media.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from exports.schema.constants import (
+    INGEST_JOB_DB_PATH,
+    INGEST_JOB_MAX_ATTEMPTS,
+    INGEST_POLL_SECONDS,
+    INGEST_WORKERS,
+)
+from exports.utils.logger import get_logger
+
+logger = get_logger()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    stages TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    media_id TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+)
+"""
+
+
+class JobState(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class StageState(str, Enum):
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class IngestJob:
+    id: str
+    state: JobState
+    payload: Dict[str, object]
+    stages: Dict[str, Dict[str, object]] = field(default_factory=dict)
+    attempts: int = 0
+    media_id: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+
+class IngestJobStore:
+    """``ingest_jobs`` table in a local SQLite file (``path=None`` keeps it in memory)."""
+
+    def __init__(
+        self,
+        path: Optional[str] = INGEST_JOB_DB_PATH or None,
+        *,
+        max_attempts: int = INGEST_JOB_MAX_ATTEMPTS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._path = path
+        self._max_attempts = max(1, max_attempts)
+        self._clock = clock
+        self._db: Optional[sqlite3.Connection] = None
+
+    def load(self) -> None:
+        """Open the store and re-queue jobs interrupted by the last shutdown."""
+        if self._db is not None:
+            return
+        if self._path:
+            parent = os.path.dirname(self._path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+        db = sqlite3.connect(
+            self._path or ":memory:", isolation_level=None, check_same_thread=False
+        )
+        db.row_factory = sqlite3.Row
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(_SCHEMA)
+        self._db = db
+        now = self._clock()
+        failed = db.execute(
+            "UPDATE ingest_jobs SET state = ?, error = ?, finished_at = ?, updated_at = ? "
+            "WHERE state = ? AND attempts >= ?",
+            (
+                JobState.FAILED.value,
+                "interrupted by shutdown on its last attempt",
+                now,
+                now,
+                JobState.RUNNING.value,
+                self._max_attempts,
+            ),
+        ).rowcount
+        requeued = db.execute(
+            "UPDATE ingest_jobs SET state = ?, updated_at = ? WHERE state = ?",
+            (JobState.QUEUED.value, now, JobState.RUNNING.value),
+        ).rowcount
+        if failed or requeued:
+            logger.info(
+                "Ingest jobs interrupted by shutdown: %s re-queued, %s failed",
+                requeued,
+                failed,
+            )
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def enqueue(self, payload: Dict[str, object]) -> IngestJob:
+        now = self._clock()
+        job = IngestJob(
+            id=str(uuid.uuid4()),
+            state=JobState.QUEUED,
+            payload=payload,
+            created_at=now,
+            updated_at=now,
+        )
+        self._conn().execute(
+            "INSERT INTO ingest_jobs (id, state, payload, stages, attempts, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, 0, ?, ?)",
+            (job.id, job.state.value, json.dumps(payload), "{}", now, now),
+        )
+        return job
+
+    def claim(self) -> Optional[IngestJob]:
+        """Oldest queued job, marked running with its attempt counted."""
+        db = self._conn()
+        now = self._clock()
+        row = db.execute(
+            "UPDATE ingest_jobs SET state = ?, attempts = attempts + 1, stages = '{}', "
+            "started_at = ?, updated_at = ? WHERE id = ("
+            "SELECT id FROM ingest_jobs WHERE state = ? ORDER BY created_at, rowid LIMIT 1"
+            ") RETURNING *",
+            (JobState.RUNNING.value, now, now, JobState.QUEUED.value),
+        ).fetchone()
+        return _job_from_row(row) if row is not None else None
+
+    def get(self, job_id: str) -> Optional[IngestJob]:
+        row = self._conn().execute(
+            "SELECT * FROM ingest_jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return _job_from_row(row) if row is not None else None
+
+    def update_stage(self, job_id: str, stage: str, **fields: object) -> None:
+        db = self._conn()
+        row = db.execute(
+            "SELECT stages FROM ingest_jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            return
+        stages = json.loads(row["stages"])
+        stages.setdefault(stage, {}).update(fields)
+        db.execute(
+            "UPDATE ingest_jobs SET stages = ?, updated_at = ? WHERE id = ?",
+            (json.dumps(stages), self._clock(), job_id),
+        )
+
+    def set_media_id(self, job_id: str, media_id: str) -> None:
+        self._conn().execute(
+            "UPDATE ingest_jobs SET media_id = ?, updated_at = ? WHERE id = ?",
+            (media_id, self._clock(), job_id),
+        )
+
+    def finish(self, job_id: str, error: Optional[str] = None) -> JobState:
+        """Record the attempt's outcome; a failure is re-queued while attempts remain."""
+        db = self._conn()
+        now = self._clock()
+        if error is None:
+            state = JobState.SUCCEEDED
+        else:
+            row = db.execute(
+                "SELECT attempts FROM ingest_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            retry = row is not None and row["attempts"] < self._max_attempts
+            state = JobState.QUEUED if retry else JobState.FAILED
+        db.execute(
+            "UPDATE ingest_jobs SET state = ?, error = ?, updated_at = ?, "
+            "finished_at = ? WHERE id = ?",
+            (
+                state.value,
+                error,
+                now,
+                None if state == JobState.QUEUED else now,
+                job_id,
+            ),
+        )
+        return state
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._conn().execute(
+            "SELECT state, COUNT(*) AS n FROM ingest_jobs GROUP BY state"
+        ).fetchall()
+        counts = {state.value: 0 for state in JobState}
+        counts.update({row["state"]: row["n"] for row in rows})
+        return counts
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            raise RuntimeError("Ingest job store is not loaded.")
+        return self._db
+
+
+def _job_from_row(row: sqlite3.Row) -> IngestJob:
+    return IngestJob(
+        id=row["id"],
+        state=JobState(row["state"]),
+        payload=json.loads(row["payload"]),
+        stages=json.loads(row["stages"]),
+        attempts=row["attempts"],
+        media_id=row["media_id"],
+        error=row["error"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+        started_at=row["started_at"],
+        finished_at=row["finished_at"],
+    )
+
+
+class JobProgress:
+    """Per-stage status and timing for one running job, written through to the store."""
+
+    def __init__(
+        self,
+        store: IngestJobStore,
+        job_id: str,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._store = store
+        self._job_id = job_id
+        self._clock = clock
+
+    @property
+    def job_id(self) -> str:
+        return self._job_id
+
+    def set_media_id(self, media_id: str) -> None:
+        self._store.set_media_id(self._job_id, media_id)
+
+    @asynccontextmanager
+    async def stage(self, name: str) -> AsyncIterator[Dict[str, object]]:
+        """Time a stage; the yielded dict is stored as the stage's ``detail``."""
+        detail: Dict[str, object] = {}
+        started = self._clock()
+        self._store.update_stage(
+            self._job_id, name, state=StageState.RUNNING.value, started_at=started
+        )
+        try:
+            yield detail
+        except BaseException as exc:
+            finished = self._clock()
+            self._store.update_stage(
+                self._job_id,
+                name,
+                state=StageState.FAILED.value,
+                finished_at=finished,
+                duration_seconds=finished - started,
+                error=str(exc) or type(exc).__name__,
+                detail=detail,
+            )
+            raise
+        finished = self._clock()
+        self._store.update_stage(
+            self._job_id,
+            name,
+            state=StageState.DONE.value,
+            finished_at=finished,
+            duration_seconds=finished - started,
+            detail=detail,
+        )
+
+    def skip(self, name: str, reason: str) -> None:
+        self._store.update_stage(
+            self._job_id, name, state=StageState.SKIPPED.value, detail={"reason": reason}
+        )
+
+
+JobRunner = Callable[[IngestJob, JobProgress], Awaitable[None]]
+
+
+class IngestWorkerPool:
+    """``workers`` asyncio tasks that claim and run jobs (``start`` / ``close``).
+
+    Workers wake on ``notify()`` (called after ``enqueue``) and otherwise
+    poll every ``INGEST_POLL_SECONDS``, which also picks up retries.
+    Jobs still running at ``close`` stay ``running`` in the store and are
+    re-queued by the next ``load``.
+    """
+
+    def __init__(
+        self,
+        store: IngestJobStore,
+        runner: JobRunner,
+        *,
+        workers: int = INGEST_WORKERS,
+        poll_seconds: float = INGEST_POLL_SECONDS,
+    ) -> None:
+        self._store = store
+        self._runner = runner
+        self._workers = max(1, workers)
+        self._poll_seconds = poll_seconds
+        self._wake = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self.active = 0
+
+    def start(self) -> "IngestWorkerPool":
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._run()) for _ in range(self._workers)
+            ]
+        return self
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "workers": self._workers,
+            "active": self.active,
+            "jobs": self._store.counts(),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            job = self._store.claim()
+            if job is None:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self._poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run_job(job)
+
+    async def _run_job(self, job: IngestJob) -> None:
+        self.active += 1
+        logger.info("Ingest job %s started (attempt %s)", job.id, job.attempts)
+        try:
+            await self._runner(job, JobProgress(self._store, job.id))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.exception("Ingest job %s failed", job.id)
+            state = self._store.finish(job.id, str(exc) or type(exc).__name__)
+            if state == JobState.QUEUED:
+                self._wake.set()
+        else:
+            self._store.finish(job.id)
+            logger.info("Ingest job %s succeeded", job.id)
+        finally:
+            self.active -= 1
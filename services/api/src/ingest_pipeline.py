@@ -0,0 +1,403 @@
+"""Stages of one video ingest job, run by the ingest worker pool.
+
+The stages form a small graph::
+
+    extract ─┬─ embed_frames ─ index_frames ─┬─ finalize
+             ├─ transcribe ──────────────────┤
+             └─ caption ─────────────────────┘
+
+Transcription and captioning only need the object key and the media id,
+so they start as soon as extraction returns and run alongside frame
+embedding; wall-clock time is roughly that of the slowest branch.
+
+Calls to each downstream service go through a shared per-stage slot
+(``StageLimits``), so concurrent jobs cannot oversubscribe the GPU-heavy
+embedder, transcriber and captioner. Transcript and caption vectors are
+optional (their stages may fail without failing the job). Any other
+failure cancels the remaining branches, marks the media row ``failed``
+and fails the attempt.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Mapping, Optional
+
+from exports.db_clients.supabaseDB import SupabaseDB
+from exports.schema.constants import (
+    INGEST_CAPTION_CONCURRENCY,
+    INGEST_EMBED_CONCURRENCY,
+    INGEST_EXTRACT_CONCURRENCY,
+    INGEST_INDEX_CONCURRENCY,
+    INGEST_TRANSCRIBE_CONCURRENCY,
+    MediaStatus,
+    MediaType,
+    VectorType,
+)
+from exports.schema.models import (
+    AddVectorItem,
+    EmbedCaptionItem,
+    EmbedImageItem,
+    EmbedTextItem,
+    ExtractFramesResponse,
+    FrameData,
+    IndexedMedia,
+    MediaUpdate,
+    VectorMetadata,
+)
+from exports.utils.logger import get_logger
+
+from src.frame_timelines import FrameTimelineCache
+from src.ingest_jobs import IngestJob, JobProgress
+from src.search_results import SearchResultCache
+from src.service_clients.caption_client import CaptionClient
+from src.service_clients.embedder_client import EmbedderClient
+from src.service_clients.indexer_client import IndexerClient
+from src.service_clients.media_processor_client import MediaProcessorClient
+from src.service_clients.transcribe_client import TranscribeClient
+
+logger = get_logger()
+
+
+class StageLimits:
+    """Process-wide cap on concurrent calls per stage, shared by all ingest jobs."""
+
+    def __init__(self, limits: Optional[Mapping[str, int]] = None) -> None:
+        if limits is None:
+            limits = {
+                "extract": INGEST_EXTRACT_CONCURRENCY,
+                "embed": INGEST_EMBED_CONCURRENCY,
+                "index": INGEST_INDEX_CONCURRENCY,
+                "transcribe": INGEST_TRANSCRIBE_CONCURRENCY,
+                "caption": INGEST_CAPTION_CONCURRENCY,
+            }
+        self._limits = {name: max(1, limit) for name, limit in limits.items()}
+        self._semaphores = {
+            name: asyncio.Semaphore(limit) for name, limit in self._limits.items()
+        }
+        self._in_use: Dict[str, int] = {name: 0 for name in self._limits}
+
+    @asynccontextmanager
+    async def slot(self, name: str) -> AsyncIterator[None]:
+        async with self._semaphores[name]:
+            self._in_use[name] += 1
+            try:
+                yield
+            finally:
+                self._in_use[name] -= 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            name: {"limit": limit, "in_use": self._in_use[name]}
+            for name, limit in self._limits.items()
+        }
+
+
+@dataclass
+class IngestServices:
+    """Long-lived clients the pipeline needs (taken from ``app.state``)."""
+
+    supabase: SupabaseDB
+    media_processor: MediaProcessorClient
+    embedder: EmbedderClient
+    indexer: IndexerClient
+    transcribe: TranscribeClient
+    caption: CaptionClient
+    frame_timelines: Optional[FrameTimelineCache] = None
+    search_results: Optional[SearchResultCache] = None
+    limits: StageLimits = field(default_factory=StageLimits)
+
+
+def _nearest_extracted_frame(
+    frames: List[FrameData], timestamps: List[float], timestamp: float
+) -> Optional[FrameData]:
+    """Closest frame to ``timestamp``; ``frames`` sorted by time, ``timestamps`` parallel."""
+    if not frames:
+        return None
+    i = bisect_left(timestamps, timestamp)
+    if i == 0:
+        return frames[0]
+    if i == len(frames):
+        return frames[-1]
+    before, after = frames[i - 1], frames[i]
+    return before if timestamp - before.timestamp <= after.timestamp - timestamp else after
+
+
+def _segment_metadata(
+    frames: List[FrameData],
+    timestamps: List[float],
+    start_time: float,
+    end_time: float,
+    text: str,
+) -> VectorMetadata:
+    """Sidecar fields for a transcript/caption vector, with its preview frame."""
+    midpoint = (start_time + end_time) / 2.0
+    preview = _nearest_extracted_frame(frames, timestamps, midpoint)
+    return VectorMetadata(
+        timestamp=midpoint,
+        start_time=start_time,
+        end_time=end_time,
+        frame_id=preview.frame_id if preview else None,
+        frame_url=preview.frame_url if preview else None,
+        text=text,
+    )
+
+
+async def run_ingest_job(
+    services: IngestServices, job: IngestJob, progress: JobProgress
+) -> None:
+    """Drive one queued ``/upload/video`` job through the stage graph."""
+    payload = job.payload
+    object_name = str(payload["object_name"])
+    file_url = str(payload["file_url"])
+    limits = services.limits
+    media_id: str | None = None
+
+    if job.media_id is not None:
+        # A retry starts over with a new media row. Retire the previous
+        # attempt's row too: an attempt cut short by a shutdown left it
+        # ``processing``. Search only serves ``ready`` media.
+        await _try_mark_failed(services.supabase, job.media_id)
+        _invalidate_search_caches(services, job.media_id)
+
+    try:
+        # ---- Extract frames (also inserts media + frames rows) ---------
+        async with progress.stage("extract") as detail:
+            async with limits.slot("extract"):
+                extracted = await services.media_processor.extract_frames_hybrid(
+                    video_object_key=object_name,
+                    file_url=file_url,
+                    file_name=object_name,
+                    threshold=float(payload["threshold"]),
+                )
+            media_id = str(extracted.media_id)
+            progress.set_media_id(media_id)
+            detail.update(frames=extracted.frame_count, duration=extracted.duration)
+        logger.info(
+            f"Extracted {extracted.frame_count} frames "
+            f"(media_id={media_id}, duration={extracted.duration:.2f}s)"
+        )
+
+        context = _IngestContext(
+            services=services,
+            progress=progress,
+            object_name=object_name,
+            extracted=extracted,
+            # Denormalized into the indexer's hit-metadata sidecar so searches
+            # come back pre-hydrated.
+            indexed_media=IndexedMedia(
+                media_type=MediaType.VIDEO,
+                file_name=object_name,
+                file_url=file_url,
+            ),
+        )
+
+        # ---- Frames, transcript and caption branches run concurrently --
+        # A frames failure cancels the other branches; theirs are non-fatal.
+        async with asyncio.TaskGroup() as branches:
+            branches.create_task(_frames_branch(context))
+            branches.create_task(_transcript_branch(context))
+            branches.create_task(_caption_branch(context))
+
+        # ---- Flip status to ready --------------------------------------
+        async with progress.stage("finalize"):
+            await services.supabase.update_media(
+                media_id, MediaUpdate(status=MediaStatus.READY)
+            )
+        _invalidate_search_caches(services, media_id)
+
+    except BaseException as exc:
+        await _try_mark_failed(services.supabase, media_id)
+        _invalidate_search_caches(services, media_id)
+        if isinstance(exc, BaseExceptionGroup) and len(exc.exceptions) == 1:
+            raise exc.exceptions[0] from None
+        raise
+
+
+@dataclass
+class _IngestContext:
+    """What every branch needs once extraction has produced the media id."""
+
+    services: IngestServices
+    progress: JobProgress
+    object_name: str
+    extracted: ExtractFramesResponse
+    indexed_media: IndexedMedia
+    frames_by_time: List[FrameData] = field(init=False)
+    frame_timestamps: List[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.frames_by_time = sorted(self.extracted.frames, key=lambda f: f.timestamp)
+        self.frame_timestamps = [f.timestamp for f in self.frames_by_time]
+
+    def segment_metadata(
+        self, start_time: float, end_time: float, text: str
+    ) -> VectorMetadata:
+        return _segment_metadata(
+            self.frames_by_time, self.frame_timestamps, start_time, end_time, text
+        )
+
+
+async def _frames_branch(context: _IngestContext) -> None:
+    services, progress, limits = context.services, context.progress, context.services.limits
+    extracted = context.extracted
+    frames_by_id = {f.frame_id: f for f in extracted.frames}
+
+    # ---- Embed frames ----------------------------------------------
+    async with progress.stage("embed_frames") as detail:
+        async with limits.slot("embed"):
+            embeddings = await services.embedder.embed_images(
+                [
+                    EmbedImageItem(frame_id=f.frame_id, frame_data=f.frame_data)
+                    for f in extracted.frames
+                ]
+            )
+        detail.update(vectors=len(embeddings))
+
+    # ---- Index vectors (indexer also writes embeddings rows) -------
+    async with progress.stage("index_frames") as detail:
+        async with limits.slot("index"):
+            index_result = await services.indexer.add_vectors(
+                media_id=extracted.media_id,
+                vectors=[
+                    AddVectorItem(
+                        frame_id=e.frame_id,
+                        embedding=e.embedding,
+                        vector_type=VectorType.IMAGE,
+                        metadata=VectorMetadata(
+                            timestamp=frames_by_id[e.frame_id].timestamp,
+                            frame_url=frames_by_id[e.frame_id].frame_url,
+                        ),
+                    )
+                    for e in embeddings
+                ],
+                media=context.indexed_media,
+            )
+        detail.update(vectors=index_result.count)
+
+
+async def _transcript_branch(context: _IngestContext) -> None:
+    """Transcribe + index transcript vectors (non-fatal)."""
+    services, progress, limits = context.services, context.progress, context.services.limits
+    media_id = context.extracted.media_id
+    try:
+        async with progress.stage("transcribe") as detail:
+            async with limits.slot("transcribe"):
+                transcribed = await services.transcribe.transcribe(
+                    video_object_key=context.object_name,
+                    media_id=media_id,
+                    file_name=context.object_name,
+                )
+            detail.update(segments=len(transcribed.segments), vectors=0)
+            if not transcribed.segments:
+                return
+            async with limits.slot("embed"):
+                text_embeddings = await services.embedder.embed_texts(
+                    [
+                        EmbedTextItem(transcript_id=seg.id, text=seg.text)
+                        for seg in transcribed.segments
+                    ]
+                )
+            segments_by_id = {seg.id: seg for seg in transcribed.segments}
+            async with limits.slot("index"):
+                transcript_index_result = await services.indexer.add_vectors(
+                    media_id=media_id,
+                    vectors=[
+                        AddVectorItem(
+                            transcript_id=result.transcript_id,
+                            embedding=result.embedding,
+                            vector_type=VectorType.TEXT,
+                            metadata=context.segment_metadata(
+                                segments_by_id[result.transcript_id].start_time,
+                                segments_by_id[result.transcript_id].end_time,
+                                segments_by_id[result.transcript_id].text,
+                            ),
+                        )
+                        for result in text_embeddings
+                    ],
+                    media=context.indexed_media,
+                )
+            detail.update(vectors=transcript_index_result.count)
+    except Exception:
+        logger.exception(
+            "Transcription pipeline failed (non-fatal); media_id=%s",
+            media_id,
+        )
+
+
+async def _caption_branch(context: _IngestContext) -> None:
+    """Caption + index caption vectors (non-fatal)."""
+    services, progress, limits = context.services, context.progress, context.services.limits
+    media_id = context.extracted.media_id
+    try:
+        async with progress.stage("caption") as detail:
+            async with limits.slot("caption"):
+                captioned = await services.caption.caption(
+                    video_object_key=context.object_name,
+                    media_id=media_id,
+                    file_name=context.object_name,
+                )
+            detail.update(segments=len(captioned.segments), vectors=0)
+            if not captioned.segments:
+                return
+            async with limits.slot("embed"):
+                caption_embeddings = await services.embedder.embed_captions(
+                    [
+                        EmbedCaptionItem(caption_id=seg.id, text=seg.text)
+                        for seg in captioned.segments
+                    ]
+                )
+            captions_by_id = {seg.id: seg for seg in captioned.segments}
+            async with limits.slot("index"):
+                caption_index_result = await services.indexer.add_vectors(
+                    media_id=media_id,
+                    vectors=[
+                        AddVectorItem(
+                            caption_id=result.caption_id,
+                            embedding=result.embedding,
+                            vector_type=VectorType.CAPTION,
+                            metadata=context.segment_metadata(
+                                captions_by_id[result.caption_id].start_time,
+                                captions_by_id[result.caption_id].end_time,
+                                captions_by_id[result.caption_id].text,
+                            ),
+                        )
+                        for result in caption_embeddings
+                    ],
+                    media=context.indexed_media,
+                )
+            detail.update(vectors=caption_index_result.count)
+    except Exception:
+        logger.exception(
+            "Captioning pipeline failed (non-fatal); media_id=%s",
+            media_id,
+        )
+
+
+async def _try_mark_failed(supabase: SupabaseDB, media_id: str | None) -> None:
+    """Best-effort flip of media status to failed after a pipeline error."""
+    if media_id is None:
+        return
+    try:
+        await supabase.update_media(
+            media_id, MediaUpdate(status=MediaStatus.FAILED)
+        )
+    except Exception:
+        logger.exception(f"Failed to mark media {media_id} as 'failed'")
+
+
+def _invalidate_search_caches(services: IngestServices, media_id: str | None) -> None:
+    """Drop cached search state for a media whose status just changed.
+
+    Finished results are dropped too: they were ranked while the media was
+    not ``ready`` and would hide (or keep serving) it until the TTL.
+    """
+    if media_id is None:
+        return
+    if services.frame_timelines is not None:
+        services.frame_timelines.invalidate(media_id)
+    if services.search_results is not None:
+        services.search_results.invalidate()
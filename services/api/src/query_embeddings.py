@@ -0,0 +1,164 @@
+"""In-process LRU + TTL cache of search-query text -> CLIP text embedding.
+
+Users repeat queries constantly while paging and refining, and every miss
+costs an embedder round trip plus a CLIP forward pass. Keys are normalized
+the way CLIP's tokenizer already treats text (lowercased, whitespace
+collapsed), so the cached vector is exactly what the embedder would return.
+The API keeps a second, memory-only instance for query images keyed by
+their SHA-256.
+
+With a ``path`` the cache writes through to a small SQLite file and warms
+itself from it on ``load()``, so entries survive API restarts. Rows are
+tagged with the CLIP model name and ignored if the model changes.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from exports.schema.constants import (
+    CLIP_MODEL,
+    QUERY_EMBEDDING_CACHE_PATH,
+    QUERY_EMBEDDING_CACHE_SIZE,
+    QUERY_EMBEDDING_CACHE_TTL,
+)
+from exports.utils.logger import get_logger
+
+logger = get_logger()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_embeddings (
+    model TEXT NOT NULL,
+    query TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, query)
+)
+"""
+
+
+def normalize_query(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+class QueryEmbeddingCache:
+    """Bounded ``normalized query -> embedding`` map with expiry and hit counters.
+
+    Vectors are held as packed float32 (``array('f')``); embeddings arrive as
+    float32 from the embedder, so the round trip is lossless.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = QUERY_EMBEDDING_CACHE_SIZE,
+        ttl_seconds: float = QUERY_EMBEDDING_CACHE_TTL,
+        path: Optional[str] = QUERY_EMBEDDING_CACHE_PATH or None,
+        *,
+        model: str = CLIP_MODEL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self._path = path
+        self._model = model
+        self._clock = clock
+        self._entries: OrderedDict[str, Tuple[float, array]] = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> None:
+        """Open the on-disk store (if configured), prune it, and warm memory from it."""
+        if not self._path or self._db is not None:
+            return
+        try:
+            parent = os.path.dirname(self._path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            db = sqlite3.connect(self._path, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(_SCHEMA)
+            db.execute(
+                "DELETE FROM query_embeddings WHERE model != ? OR created_at < ?",
+                (self._model, self._clock() - self._ttl),
+            )
+            rows = db.execute(
+                "SELECT query, created_at, vector FROM query_embeddings "
+                "ORDER BY created_at DESC LIMIT ?",
+                (self._max_entries,),
+            ).fetchall()
+            db.execute(
+                "DELETE FROM query_embeddings WHERE rowid NOT IN ("
+                "SELECT rowid FROM query_embeddings ORDER BY created_at DESC LIMIT ?)",
+                (self._max_entries,),
+            )
+        except sqlite3.Error:
+            logger.exception("Query embedding cache store unavailable: %s", self._path)
+            return
+        self._db = db
+        for query, created_at, blob in reversed(rows):
+            vector = array("f")
+            vector.frombytes(blob)
+            self._entries[query] = (created_at, vector)
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Embedding for a normalized query, or ``None`` (counted as a miss)."""
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() - entry[0] > self._ttl:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1].tolist()
+
+    def put(self, key: str, embedding: List[float]) -> None:
+        created_at = self._clock()
+        vector = array("f", embedding)
+        self._entries[key] = (created_at, vector)
+        self._entries.move_to_end(key)
+        evicted = []
+        while len(self._entries) > self._max_entries:
+            evicted.append(self._entries.popitem(last=False)[0])
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO query_embeddings VALUES (?, ?, ?, ?)",
+                (self._model, key, created_at, vector.tobytes()),
+            )
+            if evicted:
+                self._db.executemany(
+                    "DELETE FROM query_embeddings WHERE model = ? AND query = ?",
+                    [(self._model, query) for query in evicted],
+                )
+        except sqlite3.Error:
+            logger.exception("Query embedding cache write failed")
+
+    def stats(self) -> Dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl,
+            "persistent": self._db is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+        }
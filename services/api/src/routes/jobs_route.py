@@ -0,0 +1,27 @@
+from fastapi import APIRouter, HTTPException, Request
+
+from src.ingest_jobs import IngestJobStore
+from src.schema.responses import IngestJobResponse, IngestStage
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=IngestJobResponse)
+async def get_job(request: Request, job_id: str) -> IngestJobResponse:
+    """State, attempts and per-stage progress/timing of an ingest job."""
+    jobs: IngestJobStore = request.app.state.ingest_jobs
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Ingest job not found.")
+    return IngestJobResponse(
+        job_id=job.id,
+        state=job.state.value,
+        attempts=job.attempts,
+        media_id=job.media_id,
+        error=job.error,
+        stages={name: IngestStage(**stage) for name, stage in job.stages.items()},
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
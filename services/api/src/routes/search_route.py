@@ -1,11 +1,13 @@
-"""Search endpoints: text search wired; other modalities still stubs."""
+"""Search endpoints: text, image, video-clip and "more like this" search wired;
+multimodal still a stub."""
 
-import asyncio
+import math
+import time
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 import httpx
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 
 from exports.db_clients.supabaseDB import IdLike, SupabaseDB
 from exports.fusion import (
@@ -15,21 +17,40 @@ from exports.fusion import (
     fuse_and_rank,
     group_by_timestamp,
     normalize_scores_by_type,
+    rank_with_alignment,
 )
 from exports.fusion.types import FusionHit, MomentGroup
-from exports.schema.constants import DEFAULT_TOP_K, QueryType, VectorType
+from exports.schema.constants import (
+    DEFAULT_TOP_K,
+    INDEXER_MAX_TOP_K,
+    SEARCH_IMAGE_MAX_BYTES,
+    SEARCH_PAGE_MAX_DEPTH,
+    SEARCH_VIDEO_MAX_BYTES,
+    SEARCH_VIDEO_MAX_FRAMES,
+    MediaStatus,
+    QueryType,
+    VectorType,
+)
 from exports.schema.models import (
-    FrameRow,
+    EmbeddingResult,
+    EmbedImageItem,
     IndexerVectorHit,
     SearchQueryCreate,
     SearchRequest,
+    SimilarSearchRequest,
     TextSearchRequest,
 )
 from exports.utils.logger import get_logger
 
+from src.frame_timelines import FrameTimelineCache
+from src.query_embeddings import normalize_query
+from src.search_cursors import SearchCursorStore
+from src.search_log import SearchQueryLog
+from src.search_results import SearchCacheKey, SearchResultCache
 from src.schema.responses import SearchResponse, SearchResult, SignalMatch
 from ..service_clients.embedder_client import EmbedderClient
 from ..service_clients.indexer_client import IndexerClient
+from ..service_clients.media_processor_client import MediaProcessorClient
 
 router = APIRouter()
 logger = get_logger()
@@ -44,12 +65,6 @@ def _effective_top_k(requested: Optional[int]) -> int:
     return min(k, DEFAULT_TOP_K)
 
 
-def _nearest_frame(frames: List[FrameRow], timestamp: float) -> Optional[FrameRow]:
-    if not frames:
-        return None
-    return min(frames, key=lambda frame: abs(frame.timestamp - timestamp))
-
-
 def _signal_match_from_hit(hit: FusionHit, *, use_normalized: bool) -> SignalMatch:
     similarity = hit.normalized_score if use_normalized else hit.raw_score
     return SignalMatch(
@@ -139,11 +154,83 @@ def _search_result_from_single_hit(hit: FusionHit) -> SearchResult:
     )
 
 
+def _fusion_hit_from_metadata(hit: IndexerVectorHit) -> Optional[FusionHit]:
+    """Build a fusion row from the indexer's sidecar, or None if it lacks fields."""
+    meta = hit.metadata
+    if meta is None or meta.media is None:
+        return None
+    return FusionHit(
+        faiss_index_id=hit.faiss_index_id,
+        vector_type=hit.vector_type,
+        raw_score=hit.similarity_score,
+        media_id=meta.media_id,
+        timestamp=meta.timestamp,
+        media_type=meta.media.media_type,
+        file_name=meta.media.file_name,
+        file_url=meta.media.file_url,
+        frame_id=meta.frame_id,
+        frame_url=meta.frame_url,
+        transcript_text=meta.text if hit.vector_type == VectorType.TEXT else None,
+        caption_text=meta.text if hit.vector_type == VectorType.CAPTION else None,
+        start_time=meta.start_time,
+        end_time=meta.end_time,
+    )
+
+
 async def _hydrate_fusion_hits(
     supabase: SupabaseDB,
+    timelines: FrameTimelineCache,
     hits: List[IndexerVectorHit],
 ) -> List[FusionHit]:
-    """Map indexer hits to hydrated fusion rows with media and timestamp metadata."""
+    """Map indexer hits to hydrated fusion rows with media and timestamp metadata.
+
+    Hits the indexer returned pre-hydrated skip the per-row joins; only the
+    rest (e.g. vectors indexed before the sidecar existed) are joined
+    through Supabase. Input order is preserved.
+
+    Only media whose ingest finished (``ready``) is kept. FAISS never
+    deletes vectors, so a failed or retried ingest leaves its vectors
+    behind under a ``failed`` (or, if interrupted, ``processing``) media
+    row; without this a retried upload would show up twice.
+    """
+    hydrated: Dict[FaissHitKey, FusionHit] = {}
+    missing: List[IndexerVectorHit] = []
+    for hit in hits:
+        fusion_hit = _fusion_hit_from_metadata(hit)
+        if fusion_hit is None:
+            missing.append(hit)
+        else:
+            hydrated[(hit.faiss_index_id, hit.vector_type)] = fusion_hit
+    if hydrated:
+        # One small query for the distinct media ids among pre-hydrated hits.
+        ready = await _ready_media_ids(
+            supabase, {fusion_hit.media_id for fusion_hit in hydrated.values()}
+        )
+        hydrated = {
+            key: fusion_hit
+            for key, fusion_hit in hydrated.items()
+            if fusion_hit.media_id in ready
+        }
+    for fusion_hit in await _hydrate_from_database(supabase, timelines, missing):
+        hydrated[(fusion_hit.faiss_index_id, fusion_hit.vector_type)] = fusion_hit
+    return [
+        hydrated[key]
+        for key in ((h.faiss_index_id, h.vector_type) for h in hits)
+        if key in hydrated
+    ]
+
+
+async def _ready_media_ids(supabase: SupabaseDB, media_ids: set[UUID]) -> set[UUID]:
+    medias = await supabase.get_media_by_ids(list[IdLike](media_ids))
+    return {m.id for m in medias if m.status == MediaStatus.READY}
+
+
+async def _hydrate_from_database(
+    supabase: SupabaseDB,
+    timelines: FrameTimelineCache,
+    hits: List[IndexerVectorHit],
+) -> List[FusionHit]:
+    """Join indexer hits to embeddings, frames, transcripts, captions and media."""
     if not hits:
         return []
 
@@ -183,12 +270,16 @@ async def _hydrate_fusion_hits(
     for caption in captions:
         media_ids.add(caption.media_id)
 
-    frames_by_media: Dict[UUID, List[FrameRow]] = {}
-    for media_id in media_ids:
-        frames_by_media[media_id] = await supabase.get_frames_by_media_id(media_id)
-
     medias = await supabase.get_media_by_ids(list(media_ids))
-    by_media = {m.id: m for m in medias}
+    by_media = {m.id: m for m in medias if m.status == MediaStatus.READY}
+
+    # Preview frames for transcript/caption hits: cached per-media timelines
+    # (keyed on current media status), misses filled by one batched query.
+    timeline_media = {t.media_id for t in transcripts} | {c.media_id for c in captions}
+    frame_timelines = await timelines.get_many(
+        supabase,
+        {m.id: m.status for m in medias if m.id in timeline_media},
+    )
 
     fusion_hits: List[FusionHit] = []
     for faiss_id, hit_vector_type in order:
@@ -229,10 +320,8 @@ async def _hydrate_fusion_hits(
             if media is None:
                 continue
             midpoint = (transcript.start_time + transcript.end_time) / 2.0
-            preview = _nearest_frame(
-                frames_by_media.get(transcript.media_id, []),
-                midpoint,
-            )
+            timeline = frame_timelines.get(transcript.media_id)
+            preview = timeline.nearest(midpoint) if timeline else None
             fusion_hits.append(
                 FusionHit(
                     faiss_index_id=faiss_id,
@@ -243,8 +332,8 @@ async def _hydrate_fusion_hits(
                     media_type=media.media_type,
                     file_name=media.file_name,
                     file_url=media.file_url,
-                    frame_id=preview.id if preview else None,
-                    frame_url=preview.frame_url if preview else None,
+                    frame_id=preview[0] if preview else None,
+                    frame_url=preview[1] if preview else None,
                     transcript_text=transcript.text,
                     start_time=transcript.start_time,
                     end_time=transcript.end_time,
@@ -260,10 +349,8 @@ async def _hydrate_fusion_hits(
             if media is None:
                 continue
             midpoint = (caption.start_time + caption.end_time) / 2.0
-            preview = _nearest_frame(
-                frames_by_media.get(caption.media_id, []),
-                midpoint,
-            )
+            timeline = frame_timelines.get(caption.media_id)
+            preview = timeline.nearest(midpoint) if timeline else None
             fusion_hits.append(
                 FusionHit(
                     faiss_index_id=faiss_id,
@@ -274,8 +361,8 @@ async def _hydrate_fusion_hits(
                     media_type=media.media_type,
                     file_name=media.file_name,
                     file_url=media.file_url,
-                    frame_id=preview.id if preview else None,
-                    frame_url=preview.frame_url if preview else None,
+                    frame_id=preview[0] if preview else None,
+                    frame_url=preview[1] if preview else None,
                     caption_text=caption.text,
                     start_time=caption.start_time,
                     end_time=caption.end_time,
@@ -285,38 +372,56 @@ async def _hydrate_fusion_hits(
     return fusion_hits
 
 
+def _candidate_top_k(
+    query_class: QueryClass,
+    vector_types: Tuple[VectorType, ...] = (
+        VectorType.IMAGE,
+        VectorType.CAPTION,
+        VectorType.TEXT,
+    ),
+    *,
+    paginate: bool = False,
+) -> Dict[VectorType, int]:
+    counts = candidate_counts_for(query_class)
+    scale = 1
+    if paginate:
+        # Deep enough for the primary modality alone to fill SEARCH_PAGE_MAX_DEPTH
+        # results, keeping the query class's per-modality proportions.
+        primary = max(counts[vector_type] for vector_type in vector_types)
+        scale = max(1, math.ceil(SEARCH_PAGE_MAX_DEPTH / primary))
+    return {
+        vector_type: min(counts[vector_type] * scale, INDEXER_MAX_TOP_K)
+        for vector_type in vector_types
+    }
+
+
 async def _retrieve_weighted_candidates(
     indexer: IndexerClient,
     embedding: List[float],
     query_class: QueryClass,
+    vector_types: Tuple[VectorType, ...] = (
+        VectorType.IMAGE,
+        VectorType.CAPTION,
+        VectorType.TEXT,
+    ),
+    *,
+    paginate: bool = False,
 ) -> List[IndexerVectorHit]:
-    counts = candidate_counts_for(query_class)
-    image_hits, caption_hits, transcript_hits = await asyncio.gather(
-        indexer.search_vectors(
-            embedding,
-            counts[VectorType.IMAGE],
-            vector_type=VectorType.IMAGE,
-        ),
-        indexer.search_vectors(
-            embedding,
-            counts[VectorType.CAPTION],
-            vector_type=VectorType.CAPTION,
-        ),
-        indexer.search_vectors(
-            embedding,
-            counts[VectorType.TEXT],
-            vector_type=VectorType.TEXT,
-        ),
+    top_k = _candidate_top_k(query_class, vector_types, paginate=paginate)
+    # One round trip; the indexer runs one batched FAISS search per modality.
+    results = await indexer.search_vectors_batch(
+        [embedding], top_k, include_metadata=True
     )
-    return [*image_hits, *caption_hits, *transcript_hits]
+    return results[0]
 
 
 async def _fused_search_results(
     supabase: SupabaseDB,
+    timelines: FrameTimelineCache,
     hits: List[IndexerVectorHit],
     top_k: int,
 ) -> List[SearchResult]:
-    fusion_hits = await _hydrate_fusion_hits(supabase, hits)
+    fusion_hits = await _hydrate_fusion_hits(supabase, timelines, hits)
     if not fusion_hits:
         return []
 
@@ -328,15 +433,88 @@ async def _fused_search_results(
 
 async def _filtered_search_results(
     supabase: SupabaseDB,
+    timelines: FrameTimelineCache,
     hits: List[IndexerVectorHit],
 ) -> List[SearchResult]:
-    fusion_hits = await _hydrate_fusion_hits(supabase, hits)
+    fusion_hits = await _hydrate_fusion_hits(supabase, timelines, hits)
     return [_search_result_from_single_hit(hit) for hit in fusion_hits]
 
 
+async def _search_cache_key(
+    indexer: IndexerClient,
+    result_cache: SearchResultCache,
+    text: str,
+    vector_type: Optional[VectorType],
+    top_k: int,
+) -> Optional[SearchCacheKey]:
+    """Cache key at the current index generation; ``None`` (no caching) if unknown.
+
+    The indexer is only asked when the generation ``result_cache`` last saw
+    has aged out.
+    """
+    generation = result_cache.recent_generation()
+    if generation is None:
+        try:
+            generation = await indexer.get_generation()
+        except httpx.HTTPError:
+            logger.warning("Indexer generation unavailable; skipping search result cache")
+            return None
+        result_cache.remember_generation(generation)
+    return SearchCacheKey.for_text(
+        text, vector_type, top_k, generation, result_cache.epoch
+    )
+
+
+async def _search_text(
+    embedder: EmbedderClient,
+    indexer: IndexerClient,
+    supabase: SupabaseDB,
+    timelines: FrameTimelineCache,
+    text: str,
+    vector_type_filter: Optional[VectorType],
+    top_k: int,
+    *,
+    paginate: bool = False,
+) -> List[SearchResult]:
+    """Ranked results: ``top_k`` of them, or the whole pageable depth when paginating."""
+    depth = SEARCH_PAGE_MAX_DEPTH if paginate else top_k
+    try:
+        embedding = await embedder.embed_text(text)
+    except httpx.HTTPError:
+        logger.exception("Embedder text embed failed")
+        raise HTTPException(
+            status_code=502,
+            detail="Embedding service failed for text query.",
+        ) from None
+
+    try:
+        if vector_type_filter is None:
+            # Classified on the normalized text so every query sharing a
+            # result-cache key also shares a query class.
+            query_class = classify_query(normalize_query(text))
+            hits = await _retrieve_weighted_candidates(
+                indexer, embedding, query_class, paginate=paginate
+            )
+            return await _fused_search_results(supabase, timelines, hits, depth)
+        hits = await indexer.search_vectors(
+            embedding,
+            depth,
+            vector_type=vector_type_filter,
+            include_metadata=True,
+        )
+        return await _filtered_search_results(supabase, timelines, hits)
+    except httpx.HTTPError:
+        logger.exception("Indexer search failed")
+        raise HTTPException(
+            status_code=502,
+            detail="Indexer search failed.",
+        ) from None
+
+
 @router.post("/text", response_model=SearchResponse)
 async def search_by_text(request: Request, body: TextSearchRequest) -> SearchResponse:
     """Embed text with CLIP, search FAISS, then join hits to frames and media."""
+    started = time.perf_counter()
     text = (body.text or "").strip()
     if not text:
         raise HTTPException(status_code=422, detail="text must not be empty")
@@ -346,57 +524,369 @@ async def search_by_text(request: Request, body: TextSearchRequest) -> SearchRes
     embedder: EmbedderClient = request.app.state.embedder
     indexer: IndexerClient = request.app.state.indexer
     supabase: SupabaseDB = request.app.state.supabase
+    timelines: FrameTimelineCache = request.app.state.frame_timelines
+    result_cache: SearchResultCache = request.app.state.search_results
+    cursors: SearchCursorStore = request.app.state.search_cursors
+    search_log: SearchQueryLog = request.app.state.search_log
+
+    next_cursor: Optional[str] = None
+    if body.paginate:
+        # The parked candidate set plays the result cache's role for later pages.
+        candidates = await _search_text(
+            embedder,
+            indexer,
+            supabase,
+            timelines,
+            text,
+            vector_type_filter,
+            top_k,
+            paginate=True,
+        )
+        results, next_cursor = cursors.open(QueryType.TEXT, candidates, top_k)
+    else:
+        cache_key = await _search_cache_key(
+            indexer, result_cache, text, vector_type_filter, top_k
+        )
+        results = result_cache.get(cache_key) if cache_key is not None else None
+        if results is None:
+            results = await _search_text(
+                embedder, indexer, supabase, timelines, text, vector_type_filter, top_k
+            )
+            if cache_key is not None:
+                result_cache.put(cache_key, results)
+
+    search_log.record(
+        SearchQueryCreate(
+            query_type=QueryType.TEXT,
+            query_text=text,
+            latency_ms=(time.perf_counter() - started) * 1000.0,
+            result_count=len(results),
+        )
+    )
+    return SearchResponse(
+        query_type=QueryType.TEXT,
+        top_k=top_k,
+        results=results,
+        next_cursor=next_cursor,
+    )
+
+
+@router.post("/image", response_model=SearchResponse)
+async def search_by_image(
+    request: Request,
+    image_query: UploadFile = File(...),
+    top_k: Optional[int] = Form(None),
+    paginate: bool = Form(False),
+) -> SearchResponse:
+    """Embed an uploaded image with CLIP, search image + caption indexes, and fuse."""
+    started = time.perf_counter()
+    effective_top_k = _effective_top_k(top_k)
+    data = await image_query.read(SEARCH_IMAGE_MAX_BYTES + 1)
+    if not data:
+        raise HTTPException(status_code=422, detail="image_query must not be empty")
+    if len(data) > SEARCH_IMAGE_MAX_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"image_query exceeds {SEARCH_IMAGE_MAX_BYTES} bytes",
+        )
+
+    embedder: EmbedderClient = request.app.state.embedder
+    indexer: IndexerClient = request.app.state.indexer
+    supabase: SupabaseDB = request.app.state.supabase
+    timelines: FrameTimelineCache = request.app.state.frame_timelines
+    cursors: SearchCursorStore = request.app.state.search_cursors
+    search_log: SearchQueryLog = request.app.state.search_log
 
     try:
-        embedding = await embedder.embed_text(text)
+        embedding = await embedder.embed_query_image(
+            data, image_query.content_type or "application/octet-stream"
+        )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 400:
+            raise HTTPException(
+                status_code=400, detail="image_query is not a readable image."
+            ) from None
+        logger.exception("Embedder image embed failed")
+        raise HTTPException(
+            status_code=502,
+            detail="Embedding service failed for image query.",
+        ) from None
     except httpx.HTTPError:
-        logger.exception("Embedder text embed failed")
+        logger.exception("Embedder image embed failed")
         raise HTTPException(
             status_code=502,
-            detail="Embedding service failed for text query.",
+            detail="Embedding service failed for image query.",
         ) from None
 
     try:
-        if vector_type_filter is None:
-            query_class = classify_query(text)
-            hits = await _retrieve_weighted_candidates(indexer, embedding, query_class)
-            results = await _fused_search_results(supabase, hits, top_k)
-        else:
-            hits = await indexer.search_vectors(
-                embedding,
-                top_k,
-                vector_type=vector_type_filter,
-            )
-            results = await _filtered_search_results(supabase, hits)
+        # An image query is visual by construction: frames and captions only.
+        hits = await _retrieve_weighted_candidates(
+            indexer,
+            embedding,
+            QueryClass.VISUAL,
+            (VectorType.IMAGE, VectorType.CAPTION),
+            paginate=paginate,
+        )
+        results = await _fused_search_results(
+            supabase,
+            timelines,
+            hits,
+            SEARCH_PAGE_MAX_DEPTH if paginate else effective_top_k,
+        )
     except httpx.HTTPError:
         logger.exception("Indexer search failed")
         raise HTTPException(
             status_code=502,
             detail="Indexer search failed.",
         ) from None
+    next_cursor: Optional[str] = None
+    if paginate:
+        results, next_cursor = cursors.open(QueryType.IMAGE, results, effective_top_k)
+
+    search_log.record(
+        SearchQueryCreate(
+            query_type=QueryType.IMAGE,
+            latency_ms=(time.perf_counter() - started) * 1000.0,
+            result_count=len(results),
+        )
+    )
+    return SearchResponse(
+        query_type=QueryType.IMAGE,
+        top_k=effective_top_k,
+        results=results,
+        next_cursor=next_cursor,
+    )
+
+
+def _merge_query_frame_hits(
+    per_frame_hits: List[List[IndexerVectorHit]],
+    frame_times: List[float],
+) -> Tuple[List[IndexerVectorHit], Dict[FaissHitKey, List[Tuple[int, float]]]]:
+    """Dedupe hits across query frames (keeping the best score) and remember
+    which ``(frame index, frame time)`` retrieved each one."""
+    best: Dict[FaissHitKey, IndexerVectorHit] = {}
+    matches: Dict[FaissHitKey, List[Tuple[int, float]]] = {}
+    for index, (hits, frame_time) in enumerate(zip(per_frame_hits, frame_times)):
+        for hit in hits:
+            key = (hit.faiss_index_id, hit.vector_type)
+            matches.setdefault(key, []).append((index, frame_time))
+            current = best.get(key)
+            if current is None or hit.similarity_score > current.similarity_score:
+                best[key] = hit
+    return list(best.values()), matches
+
+
+def _clip_frame_embeddings(
+    embedded: List[EmbeddingResult], frame_count: int
+) -> List[List[float]]:
+    """Embeddings in query-frame order (frame ``i`` was sent as ``UUID(int=i)``).
+
+    Raises ``ValueError`` unless the embedder returned each frame exactly once.
+    """
+    by_index = {result.frame_id.int: result.embedding for result in embedded}
+    if len(embedded) != frame_count or set(by_index) != set(range(frame_count)):
+        raise ValueError(
+            f"embedder returned {len(embedded)} results for {frame_count} clip frames"
+        )
+    return [by_index[i] for i in range(frame_count)]
+
+
+@router.post("/video", response_model=SearchResponse)
+async def search_by_video(
+    request: Request,
+    video_query: UploadFile = File(...),
+    top_k: Optional[int] = Form(None),
+) -> SearchResponse:
+    """Search with a short clip: sample representative frames, embed them in one
+    batch, search image + caption indexes per frame, then fuse with temporal
+    alignment across frames."""
+    started = time.perf_counter()
+    effective_top_k = _effective_top_k(top_k)
+    data = await video_query.read(SEARCH_VIDEO_MAX_BYTES + 1)
+    if not data:
+        raise HTTPException(status_code=422, detail="video_query must not be empty")
+    if len(data) > SEARCH_VIDEO_MAX_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"video_query exceeds {SEARCH_VIDEO_MAX_BYTES} bytes",
+        )
+
+    media_processor: MediaProcessorClient = request.app.state.media_processor
+    embedder: EmbedderClient = request.app.state.embedder
+    indexer: IndexerClient = request.app.state.indexer
+    supabase: SupabaseDB = request.app.state.supabase
+    timelines: FrameTimelineCache = request.app.state.frame_timelines
+    search_log: SearchQueryLog = request.app.state.search_log
 
     try:
-        await supabase.insert_search_query(
-            SearchQueryCreate(query_type=QueryType.TEXT, query_text=text)
+        clip = await media_processor.extract_query_frames(
+            data,
+            content_type=video_query.content_type or "application/octet-stream",
+            max_frames=SEARCH_VIDEO_MAX_FRAMES,
         )
-    except Exception:
-        logger.exception(
-            "Failed to insert search_queries row (query_type=text, text_len=%s)",
-            len(text),
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 400:
+            raise HTTPException(
+                status_code=400, detail="video_query is not a readable video."
+            ) from None
+        logger.exception("Query clip frame sampling failed")
+        raise HTTPException(
+            status_code=502,
+            detail="Media processor failed for video query.",
+        ) from None
+    except httpx.HTTPError:
+        logger.exception("Query clip frame sampling failed")
+        raise HTTPException(
+            status_code=502,
+            detail="Media processor failed for video query.",
+        ) from None
+
+    frames = clip.frames[:SEARCH_VIDEO_MAX_FRAMES]
+    try:
+        embedded = await embedder.embed_images(
+            [
+                EmbedImageItem(frame_id=UUID(int=i), frame_data=frame.frame_data)
+                for i, frame in enumerate(frames)
+            ]
         )
-    return SearchResponse(query_type=QueryType.TEXT, top_k=top_k, results=results)
+        embeddings = _clip_frame_embeddings(embedded, len(frames))
+    except (httpx.HTTPError, ValueError):
+        logger.exception("Embedder clip frame embed failed")
+        raise HTTPException(
+            status_code=502,
+            detail="Embedding service failed for video query.",
+        ) from None
+
+    try:
+        per_frame_hits = await indexer.search_vectors_batch(
+            embeddings,
+            _candidate_top_k(QueryClass.VISUAL, (VectorType.IMAGE, VectorType.CAPTION)),
+            include_metadata=True,
+        )
+        hits, matches = _merge_query_frame_hits(
+            per_frame_hits, [frame.timestamp for frame in frames]
+        )
+        fusion_hits = await _hydrate_fusion_hits(supabase, timelines, hits)
+    except httpx.HTTPError:
+        logger.exception("Indexer search failed")
+        raise HTTPException(
+            status_code=502,
+            detail="Indexer search failed.",
+        ) from None
 
+    results: List[SearchResult] = []
+    if fusion_hits:
+        normalize_scores_by_type(fusion_hits)
+        groups = group_by_timestamp(fusion_hits)
+        scored = fuse_and_rank(groups, len(groups))
+        ranked = rank_with_alignment(scored, matches, len(frames), effective_top_k)
+        results = [_search_result_from_group(group) for group in ranked]
+
+    search_log.record(
+        SearchQueryCreate(
+            query_type=QueryType.VIDEO,
+            latency_ms=(time.perf_counter() - started) * 1000.0,
+            result_count=len(results),
+        )
+    )
+    return SearchResponse(
+        query_type=QueryType.VIDEO, top_k=effective_top_k, results=results
+    )
 
-@router.post("/image")
-async def search_by_image(query: SearchRequest) -> SearchResponse:
-    """Search by uploaded image (placeholder)."""
-    raise NotImplementedError("Image search is not wired yet.")
 
+@router.post("/similar", response_model=SearchResponse)
+async def search_similar(request: Request, body: SimilarSearchRequest) -> SearchResponse:
+    """"More like this" from an indexed frame, caption or transcript segment.
 
-@router.post("/video")
-async def search_by_video(query: SearchRequest) -> SearchResponse:
-    """Search by uploaded video clip (placeholder)."""
-    raise NotImplementedError("Video search is not wired yet.")
+    The seed's ``faiss_index_id`` comes from ``embeddings`` and the indexer
+    reconstructs its stored vector, so no embedder call is made.
+    """
+    started = time.perf_counter()
+    top_k = _effective_top_k(body.top_k)
+    indexer: IndexerClient = request.app.state.indexer
+    supabase: SupabaseDB = request.app.state.supabase
+    timelines: FrameTimelineCache = request.app.state.frame_timelines
+    cursors: SearchCursorStore = request.app.state.search_cursors
+    search_log: SearchQueryLog = request.app.state.search_log
+
+    if body.frame_id is not None:
+        source, seed_type = "frame", VectorType.IMAGE
+        rows = await supabase.get_embeddings_by_frame_id(body.frame_id)
+    elif body.caption_id is not None:
+        source, seed_type = "caption", VectorType.CAPTION
+        rows = await supabase.get_embeddings_by_caption_id(body.caption_id)
+    else:
+        source, seed_type = "transcript", VectorType.TEXT
+        rows = await supabase.get_embeddings_by_transcript_id(body.transcript_id)
+    seed = next((row for row in rows if row.vector_type == seed_type), None)
+    if seed is None:
+        raise HTTPException(
+            status_code=404, detail=f"No indexed embedding for that {source}."
+        )
+
+    # Speech seeds lean on transcripts; frames and captions on visual signals.
+    query_class = QueryClass.SPEECH if seed_type == VectorType.TEXT else QueryClass.VISUAL
+    try:
+        hits = await indexer.search_similar(
+            seed.vector_type,
+            seed.faiss_index_id,
+            _candidate_top_k(query_class, paginate=body.paginate),
+            include_metadata=True,
+        )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise HTTPException(
+                status_code=404,
+                detail=f"The {source}'s vector is not in the index.",
+            ) from None
+        logger.exception("Indexer similar search failed")
+        raise HTTPException(status_code=502, detail="Indexer search failed.") from None
+    except httpx.HTTPError:
+        logger.exception("Indexer similar search failed")
+        raise HTTPException(status_code=502, detail="Indexer search failed.") from None
+    results = await _fused_search_results(
+        supabase, timelines, hits, SEARCH_PAGE_MAX_DEPTH if body.paginate else top_k
+    )
+
+    # Logged under the seed's modality; ``query_type`` is a Postgres enum.
+    query_type = QueryType.IMAGE if seed_type == VectorType.IMAGE else QueryType.TEXT
+    next_cursor: Optional[str] = None
+    if body.paginate:
+        results, next_cursor = cursors.open(query_type, results, top_k)
+    search_log.record(
+        SearchQueryCreate(
+            query_type=query_type,
+            latency_ms=(time.perf_counter() - started) * 1000.0,
+            result_count=len(results),
+        )
+    )
+    return SearchResponse(
+        query_type=query_type,
+        top_k=top_k,
+        results=results,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/page", response_model=SearchResponse)
+async def search_page(request: Request, cursor: str) -> SearchResponse:
+    """Next page of a paginated search, served from its parked candidate set.
+
+    No FAISS or Supabase work, and not logged again as a search query.
+    """
+    cursors: SearchCursorStore = request.app.state.search_cursors
+    page = cursors.page(cursor)
+    if page is None:
+        raise HTTPException(
+            status_code=410,
+            detail="Cursor is unknown or expired; run the search again.",
+        )
+    return SearchResponse(
+        query_type=page.query_type,
+        top_k=page.page_size,
+        results=page.results,
+        next_cursor=page.next_cursor,
+    )
 
 
 @router.post("/multimodal")
@@ -1,7 +1,7 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 
 from exports.schema.constants import MediaType, QueryType, VectorType
 
@@ -10,6 +10,32 @@ class UploadResponse(BaseModel):
     """Response shape for `/upload/image` and `/upload/video`."""
     file_url: Optional[HttpUrl] = None
     status: str = "uploaded"
+    # `/upload/video` only: the queued ingest job (see `GET /jobs/{job_id}`).
+    job_id: Optional[str] = None
+
+
+class IngestStage(BaseModel):
+    """Progress of one ingest stage within the current attempt."""
+    state: str
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    duration_seconds: Optional[float] = None
+    error: Optional[str] = None
+    detail: Dict[str, Any] = Field(default_factory=dict)
+
+
+class IngestJobResponse(BaseModel):
+    """Response shape for `GET /jobs/{job_id}` (times are Unix seconds)."""
+    job_id: str
+    state: str
+    attempts: int
+    media_id: Optional[UUID] = None
+    error: Optional[str] = None
+    stages: Dict[str, IngestStage]
+    created_at: float
+    updated_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
 
 
 class SignalMatch(BaseModel):
@@ -50,3 +76,6 @@ class SearchResponse(BaseModel):
     query_type: QueryType
     top_k: int
     results: List[SearchResult]
+    # Opaque token for ``GET /search/page``; set only on paginated searches
+    # that have more results.
+    next_cursor: Optional[str] = None
@@ -0,0 +1,114 @@
+"""Short-lived server-side candidate sets behind search pagination cursors.
+
+A paginated search retrieves and fuses its candidates once, up to
+``SEARCH_PAGE_MAX_DEPTH`` ranked results, hydrates them, and parks the
+ranked list here. The first page is returned with a cursor; every later
+page is a slice of the parked list, so paging does no FAISS or Supabase
+work. Cursors are ``<set id>.<offset>`` and stop working when their set
+expires (``SEARCH_CURSOR_TTL``) or is evicted (LRU).
+"""
+
+from __future__ import annotations
+
+import secrets
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from exports.schema.constants import (
+    SEARCH_CURSOR_CACHE_SIZE,
+    SEARCH_CURSOR_TTL,
+    QueryType,
+)
+
+from src.schema.responses import SearchResult
+
+
+class SearchPage(NamedTuple):
+    query_type: QueryType
+    page_size: int
+    results: List[SearchResult]
+    next_cursor: Optional[str]
+
+
+class _CandidateSet(NamedTuple):
+    created_at: float
+    query_type: QueryType
+    page_size: int
+    results: List[SearchResult]
+
+
+class SearchCursorStore:
+    """Bounded ``set id -> ranked results`` map with expiry."""
+
+    def __init__(
+        self,
+        max_sets: int = SEARCH_CURSOR_CACHE_SIZE,
+        ttl_seconds: float = SEARCH_CURSOR_TTL,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_sets = max(1, max_sets)
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._sets: OrderedDict[str, _CandidateSet] = OrderedDict()
+        self.pages_served = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._sets)
+
+    def open(
+        self,
+        query_type: QueryType,
+        results: List[SearchResult],
+        page_size: int,
+    ) -> Tuple[List[SearchResult], Optional[str]]:
+        """First page of ``results`` and a cursor to the next one (``None`` if none).
+
+        A set is only kept when there is more than one page.
+        """
+        page_size = max(1, page_size)
+        if len(results) <= page_size:
+            return results, None
+        set_id = secrets.token_urlsafe(12)
+        self._sets[set_id] = _CandidateSet(self._clock(), query_type, page_size, results)
+        while len(self._sets) > self._max_sets:
+            self._sets.popitem(last=False)
+        return results[:page_size], _cursor(set_id, page_size)
+
+    def page(self, cursor: str) -> Optional[SearchPage]:
+        """The page a cursor points at, or ``None`` if it is unknown or expired."""
+        set_id, _, raw_offset = cursor.rpartition(".")
+        if not set_id or not raw_offset.isdigit():
+            return None
+        candidates = self._sets.get(set_id)
+        if candidates is None:
+            return None
+        if self._clock() - candidates.created_at > self._ttl:
+            del self._sets[set_id]
+            self.expired += 1
+            return None
+        self._sets.move_to_end(set_id)
+        offset = int(raw_offset)
+        end = offset + candidates.page_size
+        self.pages_served += 1
+        return SearchPage(
+            query_type=candidates.query_type,
+            page_size=candidates.page_size,
+            results=candidates.results[offset:end],
+            next_cursor=_cursor(set_id, end) if end < len(candidates.results) else None,
+        )
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "sets": len(self._sets),
+            "max_sets": self._max_sets,
+            "ttl_seconds": self._ttl,
+            "pages_served": self.pages_served,
+            "expired": self.expired,
+        }
+
+
+def _cursor(set_id: str, offset: int) -> str:
+    return f"{set_id}.{offset}"
@@ -0,0 +1,113 @@
+"""Buffered, fire-and-forget writer for the ``search_queries`` log.
+
+Search handlers call ``record`` (no I/O) and return; a background task
+inserts the buffered rows in batches of up to ``SEARCH_LOG_BATCH_SIZE``,
+waking early once a full batch is waiting and otherwise every
+``SEARCH_LOG_FLUSH_SECONDS``. The buffer is bounded: when Supabase is slow
+or down, new rows are dropped (and counted) instead of piling up in
+memory or slowing searches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict
+
+from exports.db_clients.supabaseDB import SupabaseDB
+from exports.schema.constants import (
+    SEARCH_LOG_BATCH_SIZE,
+    SEARCH_LOG_FLUSH_SECONDS,
+    SEARCH_LOG_QUEUE_SIZE,
+)
+from exports.schema.models import SearchQueryCreate
+from exports.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class SearchQueryLog:
+    """Background batcher owned by the API lifespan (``start`` / ``close``)."""
+
+    def __init__(
+        self,
+        supabase: SupabaseDB,
+        *,
+        batch_size: int = SEARCH_LOG_BATCH_SIZE,
+        flush_seconds: float = SEARCH_LOG_FLUSH_SECONDS,
+        max_queued: int = SEARCH_LOG_QUEUE_SIZE,
+    ) -> None:
+        self._supabase = supabase
+        self._batch_size = max(1, batch_size)
+        self._flush_seconds = flush_seconds
+        self._max_queued = max(1, max_queued)
+        self._pending: Deque[SearchQueryCreate] = deque()
+        self._wake = asyncio.Event()
+        self._closed = False
+        self._task: asyncio.Task | None = None
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def start(self) -> "SearchQueryLog":
+        if self._task is None:
+            self._closed = False
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Flush what is buffered (bounded by ``timeout``) and stop the writer."""
+        if self._task is None:
+            return
+        self._closed = True
+        self._wake.set()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Search query log did not drain in %.1fs; dropping %s rows",
+                timeout,
+                len(self._pending),
+            )
+        self._task = None
+
+    def record(self, query: SearchQueryCreate) -> None:
+        """Queue one row without blocking; drops it if the buffer is full."""
+        if self._closed or len(self._pending) >= self._max_queued:
+            self.dropped += 1
+            return
+        self._pending.append(query)
+        if len(self._pending) >= self._batch_size:
+            self._wake.set()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": len(self._pending),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self._flush()
+        await self._flush()
+
+    async def _flush(self) -> None:
+        while self._pending:
+            count = min(self._batch_size, len(self._pending))
+            batch = [self._pending.popleft() for _ in range(count)]
+            try:
+                await self._supabase.insert_search_queries_batch(batch)
+            except Exception:
+                # Leave the rest buffered for the next tick; the bounded
+                # buffer sheds load if the database stays unavailable.
+                self.failed += len(batch)
+                logger.exception("Failed to insert %s search_queries rows", len(batch))
+                return
+            self.written += len(batch)
@@ -0,0 +1,160 @@
+"""In-process LRU + TTL cache of finished text-search results.
+
+Keys are ``(normalized query, vector_type filter, top_k, index generation)``.
+The indexer's generation grows on every add, so an entry can only be served
+while the vectors it was computed from are unchanged; entries from older
+generations are dropped as soon as a newer generation is seen. The TTL
+covers database-side changes (media status, frame rows) that the
+generation does not track.
+
+Callers read the generation before searching, so a search that races an
+add may store fresher results under the older generation; those entries
+stop being served once the newer generation is observed.
+
+The generation moves when vectors land, but search only returns media once
+ingest flips its row to ``ready`` (minutes later for long videos). Every
+media status change therefore calls ``invalidate``, which clears the cache
+and bumps ``epoch``; keys carry the epoch they were built at, so a search
+that started before the flip cannot store its results afterwards. To avoid an
+indexer round trip per search, the last generation read is reused for
+``SEARCH_GENERATION_TTL`` seconds (``recent_generation``), which bounds how
+long new vectors can go unseen.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from exports.schema.constants import (
+    SEARCH_GENERATION_TTL,
+    SEARCH_RESULT_CACHE_SIZE,
+    SEARCH_RESULT_CACHE_TTL,
+    VectorType,
+)
+
+from src.query_embeddings import normalize_query
+from src.schema.responses import SearchResult
+
+
+class SearchCacheKey(NamedTuple):
+    query: str
+    vector_type: Optional[VectorType]
+    top_k: int
+    generation: int
+    epoch: int = 0
+
+    @classmethod
+    def for_text(
+        cls,
+        text: str,
+        vector_type: Optional[VectorType],
+        top_k: int,
+        generation: int,
+        epoch: int = 0,
+    ) -> "SearchCacheKey":
+        return cls(normalize_query(text), vector_type, top_k, generation, epoch)
+
+
+class SearchResultCache:
+    """Bounded ``SearchCacheKey -> results`` map with expiry and hit counters."""
+
+    def __init__(
+        self,
+        max_entries: int = SEARCH_RESULT_CACHE_SIZE,
+        ttl_seconds: float = SEARCH_RESULT_CACHE_TTL,
+        *,
+        generation_ttl_seconds: float = SEARCH_GENERATION_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self._generation_ttl = generation_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[SearchCacheKey, Tuple[float, List[SearchResult]]] = (
+            OrderedDict()
+        )
+        self._generation = -1
+        self._epoch = 0
+        self._fetched_generation: Optional[Tuple[float, int]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def epoch(self) -> int:
+        """Bumped by ``invalidate``; pass it to ``SearchCacheKey.for_text``."""
+        return self._epoch
+
+    def invalidate(self) -> None:
+        """Drop every entry, including ones still being computed (media status changed)."""
+        self._epoch += 1
+        self._entries.clear()
+
+    def get(self, key: SearchCacheKey) -> Optional[List[SearchResult]]:
+        if key.epoch != self._epoch:
+            self.misses += 1
+            return None
+        if key.generation < self._generation:
+            # The index went backwards (rebuilt or wiped): nothing cached is valid.
+            self._entries.clear()
+            self._generation = key.generation
+        self._observe_generation(key.generation)
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() - entry[0] > self._ttl:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return [result.model_copy(deep=True) for result in entry[1]]
+
+    def put(self, key: SearchCacheKey, results: List[SearchResult]) -> None:
+        self._observe_generation(key.generation)
+        if key.generation < self._generation or key.epoch != self._epoch:
+            return
+        self._entries[key] = (
+            self._clock(),
+            [result.model_copy(deep=True) for result in results],
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def recent_generation(self) -> Optional[int]:
+        """Generation from ``remember_generation`` if still fresh, else ``None``."""
+        if self._fetched_generation is None:
+            return None
+        fetched_at, generation = self._fetched_generation
+        if self._clock() - fetched_at > self._generation_ttl:
+            return None
+        return generation
+
+    def remember_generation(self, generation: int) -> None:
+        self._fetched_generation = (self._clock(), generation)
+
+    def stats(self) -> Dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl,
+            "generation": self._generation if self._generation >= 0 else None,
+            "epoch": self._epoch,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+        }
+
+    def _observe_generation(self, generation: int) -> None:
+        if generation <= self._generation:
+            return
+        self._generation = generation
+        stale = [key for key in self._entries if key.generation < generation]
+        for key in stale:
+            del self._entries[key]
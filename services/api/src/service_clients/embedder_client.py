@@ -1,9 +1,17 @@
+import asyncio
+import hashlib
+
 import httpx
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
-from exports.schema.constants import EMBED_IMAGE_BATCH_SIZE, EMBEDDER_SERVICE
+from exports.schema.constants import (
+    EMBED_IMAGE_BATCH_SIZE,
+    EMBEDDER_SERVICE,
+    VECTOR_WIRE_FORMAT,
+)
 from exports.schema.models import (
     EmbedImageItem,
+    EmbedImageResponse,
     EmbedImagesRequest,
     EmbedImagesResponse,
     EmbedTextBatchRequest,
@@ -16,6 +24,9 @@ from exports.schema.models import (
     CaptionEmbeddingResult,
     TextEmbeddingResult,
 )
+from exports.utils.vector_wire import accept_headers, response_payload
+
+from ..query_embeddings import QueryEmbeddingCache, normalize_query
 
 
 class EmbedderClient:
@@ -25,11 +36,30 @@ class EmbedderClient:
       * Async context manager (``async with EmbedderClient() as c: ...``).
       * Long-lived client owned by FastAPI (``await client.connect()`` at
         startup, ``await client.close()`` at shutdown).
+
+    Embeddings come back as packed float32 unless ``binary_vectors`` is off
+    (``VECTOR_WIRE_FORMAT=json``).
+
+    With a ``query_cache``, ``embed_text`` answers repeated queries from it
+    and concurrent misses for the same query share one embedder call;
+    ``image_cache`` does the same for ``embed_query_image``, keyed by the
+    image's SHA-256.
     """
 
-    def __init__(self, base_url: str = EMBEDDER_SERVICE):
+    def __init__(
+        self,
+        base_url: str = EMBEDDER_SERVICE,
+        *,
+        binary_vectors: bool = VECTOR_WIRE_FORMAT == "binary",
+        query_cache: QueryEmbeddingCache | None = None,
+        image_cache: QueryEmbeddingCache | None = None,
+    ):
         self.base_url = base_url
+        self.binary_vectors = binary_vectors
+        self.query_cache = query_cache
+        self.image_cache = image_cache
         self.client: httpx.AsyncClient | None = None
+        self._pending_queries: Dict[Tuple[int, str], asyncio.Task] = {}
 
     async def connect(self) -> "EmbedderClient":
         if self.client is None:
@@ -65,20 +95,105 @@ class EmbedderClient:
         for start in range(0, len(frames), chunk_size):
             chunk = frames[start : start + chunk_size]
             payload = EmbedImagesRequest(frames=chunk).model_dump(mode="json")
-            response = await self.client.post("/embed/images/", json=payload)
+            response = await self.client.post(
+                "/embed/images/",
+                json=payload,
+                headers=accept_headers(binary=self.binary_vectors),
+            )
             response.raise_for_status()
-            results.extend(EmbedImagesResponse(**response.json()).embeddings)
+            results.extend(
+                EmbedImagesResponse(**response_payload(response)).embeddings
+            )
         return results
 
     async def embed_text(self, text: str) -> List[float]:
         """Embed a search query string into a single CLIP vector."""
+        if not self.client:
+            raise RuntimeError("HTTP client is not initialized.")
+        if self.query_cache is None:
+            return await self._post_embed_text(text)
+        return await self._cached_embedding(
+            self.query_cache,
+            normalize_query(text),
+            lambda: self._post_embed_text(text),
+        )
+
+    async def embed_query_image(
+        self, data: bytes, content_type: str = "application/octet-stream"
+    ) -> List[float]:
+        """Embed one query image, sent as raw bytes (no base64 or JSON wrapping)."""
+        if not self.client:
+            raise RuntimeError("HTTP client is not initialized.")
+        if self.image_cache is None:
+            return await self._post_query_image(data, content_type)
+        return await self._cached_embedding(
+            self.image_cache,
+            hashlib.sha256(data).hexdigest(),
+            lambda: self._post_query_image(data, content_type),
+        )
+
+    async def _cached_embedding(
+        self,
+        cache: QueryEmbeddingCache,
+        key: str,
+        fetch: Callable[[], Awaitable[List[float]]],
+    ) -> List[float]:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        pending_key = (id(cache), key)
+        task = self._pending_queries.get(pending_key)
+        if task is None:
+            task = asyncio.create_task(self._fill_cache(cache, key, fetch))
+            self._pending_queries[pending_key] = task
+            task.add_done_callback(
+                lambda t, pending_key=pending_key: self._finish_pending(pending_key, t)
+            )
+        # Shielded so one caller disconnecting does not cancel the shared call.
+        return list(await asyncio.shield(task))
+
+    @staticmethod
+    async def _fill_cache(
+        cache: QueryEmbeddingCache,
+        key: str,
+        fetch: Callable[[], Awaitable[List[float]]],
+    ) -> List[float]:
+        embedding = await fetch()
+        cache.put(key, embedding)
+        return embedding
+
+    def _finish_pending(self, pending_key: Tuple[int, str], task: asyncio.Task) -> None:
+        self._pending_queries.pop(pending_key, None)
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every waiter went away
+
+    async def _post_query_image(self, data: bytes, content_type: str) -> List[float]:
+        if not self.client:
+            raise RuntimeError("HTTP client is not initialized.")
+
+        response = await self.client.post(
+            "/embed/images/raw",
+            content=data,
+            headers={
+                "content-type": content_type,
+                **accept_headers(binary=self.binary_vectors),
+            },
+        )
+        response.raise_for_status()
+        return EmbedImageResponse(**response_payload(response)).embedding
+
+    async def _post_embed_text(self, text: str) -> List[float]:
         if not self.client:
             raise RuntimeError("HTTP client is not initialized.")
 
         payload = EmbedTextRequest(text=text).model_dump(mode="json")
-        response = await self.client.post("/embed/text/", json=payload)
+        response = await self.client.post(
+            "/embed/text/",
+            json=payload,
+            headers=accept_headers(binary=self.binary_vectors),
+        )
         response.raise_for_status()
-        return EmbedTextResponse(**response.json()).embedding
+        return EmbedTextResponse(**response_payload(response)).embedding
 
     async def embed_texts(self, items: List[EmbedTextItem]) -> List[TextEmbeddingResult]:
         """Embed a batch of transcript strings into CLIP vectors."""
@@ -88,9 +203,13 @@ class EmbedderClient:
             return []
 
         payload = EmbedTextBatchRequest(texts=items).model_dump(mode="json")
-        response = await self.client.post("/embed/text/batch", json=payload)
+        response = await self.client.post(
+            "/embed/text/batch",
+            json=payload,
+            headers=accept_headers(binary=self.binary_vectors),
+        )
         response.raise_for_status()
-        return EmbedTextBatchResponse(**response.json()).embeddings
+        return EmbedTextBatchResponse(**response_payload(response)).embeddings
 
     async def embed_captions(
         self, items: List[EmbedCaptionItem]
@@ -1,16 +1,22 @@
 import httpx
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Mapping, Optional, Union
 from uuid import UUID
 
-from exports.schema.constants import INDEXER_SERVICE, VectorType
+from exports.schema.constants import INDEXER_SERVICE, VECTOR_WIRE_FORMAT, VectorType
 from exports.schema.models import (
     AddVectorItem,
     AddVectorsRequest,
     AddVectorsResponse,
+    BatchSearchVectorsRequest,
+    BatchSearchVectorsResponse,
+    IndexGenerationResponse,
+    IndexedMedia,
     IndexerVectorHit,
     SearchVectorsRequest,
     SearchVectorsResponse,
+    SimilarVectorsRequest,
 )
+from exports.utils.vector_wire import request_kwargs
 
 
 IdLike = Union[str, UUID]
@@ -27,10 +33,19 @@ class IndexerClient:
       * Async context manager (``async with IndexerClient() as c: ...``).
       * Long-lived client owned by FastAPI (``await client.connect()`` at
         startup, ``await client.close()`` at shutdown).
+
+    Vectors are sent as packed float32 unless ``binary_vectors`` is off
+    (``VECTOR_WIRE_FORMAT=json``).
     """
 
-    def __init__(self, base_url: str = INDEXER_SERVICE):
+    def __init__(
+        self,
+        base_url: str = INDEXER_SERVICE,
+        *,
+        binary_vectors: bool = VECTOR_WIRE_FORMAT == "binary",
+    ):
         self.base_url = base_url
+        self.binary_vectors = binary_vectors
         self.client: httpx.AsyncClient | None = None
 
     async def connect(self) -> "IndexerClient":
@@ -53,6 +68,7 @@ class IndexerClient:
         self,
         media_id: IdLike,
         vectors: List[AddVectorItem],
+        media: Optional[IndexedMedia] = None,
     ) -> AddVectorsResponse:
         """Add embeddings to FAISS and persist `embeddings` rows.
 
@@ -66,8 +82,11 @@ class IndexerClient:
         payload = AddVectorsRequest(
             media_id=_as_uuid(media_id),
             vectors=vectors,
+            media=media,
         ).model_dump(mode="json")
-        response = await self.client.post("vectors/add/", json=payload)
+        response = await self.client.post(
+            "vectors/add/", **request_kwargs(payload, binary=self.binary_vectors)
+        )
         response.raise_for_status()
         return AddVectorsResponse(**response.json())
 
@@ -76,8 +95,19 @@ class IndexerClient:
         embedding: List[float],
         top_k: int,
         vector_type: Optional[VectorType] = None,
+        *,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        rerank_factor: Optional[int] = None,
+        include_metadata: bool = False,
     ) -> List[IndexerVectorHit]:
-        """Nearest-neighbour search against one or all FAISS indexes."""
+        """Nearest-neighbour search against one or all FAISS indexes.
+
+        ``nprobe`` / ``ef_search`` trade recall for latency on IVF / HNSW
+        indexes and ``rerank_factor`` controls exact re-ranking on
+        compressed ones; ``None`` leaves the indexer's configured default.
+        ``include_metadata`` asks for pre-hydrated hits where available.
+        """
         if not self.client:
             raise RuntimeError("HTTP client is not initialized.")
 
@@ -85,8 +115,78 @@ class IndexerClient:
             embedding=embedding,
             top_k=top_k,
             vector_type=vector_type,
-        ).model_dump(mode="json")
-        response = await self.client.post("vectors/search/", json=payload)
+            nprobe=nprobe,
+            ef_search=ef_search,
+            rerank_factor=rerank_factor,
+            include_metadata=include_metadata,
+        ).model_dump(mode="json", exclude_none=True)
+        response = await self.client.post(
+            "vectors/search/", **request_kwargs(payload, binary=self.binary_vectors)
+        )
+        response.raise_for_status()
+        return SearchVectorsResponse(**response.json()).hits
+
+    async def search_vectors_batch(
+        self,
+        embeddings: List[List[float]],
+        top_k: Mapping[VectorType, int],
+        *,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        rerank_factor: Optional[int] = None,
+        include_metadata: bool = False,
+    ) -> List[List[IndexerVectorHit]]:
+        """Search every embedding against each modality in ``top_k`` in one request.
+
+        Returns one hit list per embedding, grouped by modality in
+        ``top_k`` order.
+        """
+        if not self.client:
+            raise RuntimeError("HTTP client is not initialized.")
+
+        payload = BatchSearchVectorsRequest(
+            embeddings=embeddings,
+            top_k=dict(top_k),
+            nprobe=nprobe,
+            ef_search=ef_search,
+            rerank_factor=rerank_factor,
+            include_metadata=include_metadata,
+        ).model_dump(mode="json", exclude_none=True)
+        response = await self.client.post(
+            "vectors/search/batch",
+            **request_kwargs(payload, binary=self.binary_vectors),
+        )
+        response.raise_for_status()
+        return BatchSearchVectorsResponse(**response.json()).results
+
+    async def search_similar(
+        self,
+        vector_type: VectorType,
+        faiss_index_id: int,
+        top_k: Mapping[VectorType, int],
+        *,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        rerank_factor: Optional[int] = None,
+        include_metadata: bool = False,
+    ) -> List[IndexerVectorHit]:
+        """Search each modality in ``top_k`` using an indexed vector as the query.
+
+        The indexer reconstructs the vector itself; the seed is not returned.
+        """
+        if not self.client:
+            raise RuntimeError("HTTP client is not initialized.")
+
+        payload = SimilarVectorsRequest(
+            vector_type=vector_type,
+            faiss_index_id=faiss_index_id,
+            top_k=dict(top_k),
+            nprobe=nprobe,
+            ef_search=ef_search,
+            rerank_factor=rerank_factor,
+            include_metadata=include_metadata,
+        ).model_dump(mode="json", exclude_none=True)
+        response = await self.client.post("vectors/search/similar", json=payload)
         response.raise_for_status()
         return SearchVectorsResponse(**response.json()).hits
 
@@ -98,6 +198,15 @@ class IndexerClient:
         response.raise_for_status()
         return response.json()
 
+    async def get_generation(self) -> int:
+        """Index generation; changes exactly when vectors are added."""
+        if not self.client:
+            raise RuntimeError("HTTP client is not initialized.")
+
+        response = await self.client.get("/index/generation")
+        response.raise_for_status()
+        return IndexGenerationResponse(**response.json()).generation
+
     async def get_index_stats(self) -> dict:
         if not self.client:
             raise RuntimeError("HTTP client is not initialized.")
@@ -4,7 +4,7 @@ from typing import Dict
 from exports.schema.constants import EMBEDDER_SERVICE  # noqa: F401  (kept for parity import patterns)
 from exports.schema.constants import MEDIA_PROCESSOR_SERVICE
 from exports.schema.constants import ExtractionStrategy
-from exports.schema.models import ExtractFramesResponse
+from exports.schema.models import ExtractFramesResponse, QueryFramesResponse
 from exports.utils.logger import get_logger
 
 logger = get_logger()
@@ -82,6 +82,26 @@ class MediaProcessorClient:
             file_name=file_name,
         )
 
+    async def extract_query_frames(
+        self,
+        data: bytes,
+        *,
+        content_type: str = "application/octet-stream",
+        max_frames: int,
+    ) -> QueryFramesResponse:
+        """Representative frames of a search clip (raw bytes in, nothing persisted)."""
+        if not self.client:
+            raise RuntimeError("HTTP client is not initialized.")
+
+        response = await self.client.post(
+            "/extract/query",
+            params={"max_frames": max_frames},
+            content=data,
+            headers={"content-type": content_type},
+        )
+        response.raise_for_status()
+        return QueryFramesResponse(**response.json())
+
     async def health_check(self) -> Dict[str, str]:
         if not self.client:
             raise RuntimeError("HTTP client is not initialized.")
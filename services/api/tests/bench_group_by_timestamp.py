@@ -0,0 +1,67 @@
+"""Microbenchmark: sweep-line ``group_by_timestamp`` vs the pairwise original.
+
+Not collected by pytest. Run from ``services/api``::
+
+    PYTHONPATH=../exports/src python tests/bench_group_by_timestamp.py
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from uuid import uuid4
+
+from exports.fusion.pipeline import group_by_timestamp
+from exports.fusion.types import FusionHit
+from exports.schema.constants import VectorType
+
+# The script's directory is on sys.path, so the test module's reference
+# implementation is importable.
+from test_fusion import _group_by_timestamp_pairwise
+
+_SHAPES = [(60, 5), (300, 10), (1_000, 20), (5_000, 50)]
+
+
+def _hits(count: int, media_count: int, seed: int = 0) -> list[FusionHit]:
+    rng = random.Random(seed)
+    media_ids = [uuid4() for _ in range(media_count)]
+    hits = []
+    for i in range(count):
+        vector_type = rng.choice(list(VectorType))
+        timestamp = rng.uniform(0.0, 3_600.0)
+        start = end = None
+        if vector_type == VectorType.CAPTION:
+            start, end = timestamp, timestamp + rng.uniform(1.0, 8.0)
+        hits.append(
+            FusionHit(
+                faiss_index_id=i,
+                vector_type=vector_type,
+                raw_score=rng.random(),
+                media_id=rng.choice(media_ids),
+                timestamp=timestamp,
+                start_time=start,
+                end_time=end,
+            )
+        )
+    return hits
+
+
+def main() -> None:
+    print(f"{'hits':>6} {'media':>6} {'pairwise ms':>12} {'sweep ms':>10} {'speedup':>8}")
+    for count, media_count in _SHAPES:
+        hits = _hits(count, media_count)
+        number = max(1, 2_000 // count)
+        pairwise = min(
+            timeit.repeat(lambda: _group_by_timestamp_pairwise(hits), number=number, repeat=5)
+        ) / number
+        sweep = min(
+            timeit.repeat(lambda: group_by_timestamp(hits), number=number, repeat=5)
+        ) / number
+        print(
+            f"{count:>6} {media_count:>6} {pairwise * 1e3:>12.3f} "
+            f"{sweep * 1e3:>10.3f} {pairwise / sweep:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
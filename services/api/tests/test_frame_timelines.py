@@ -0,0 +1,82 @@
+"""Nearest-frame timelines and their per-media LRU cache."""
+
+import asyncio
+from uuid import UUID, uuid4
+
+from exports.schema.constants import MediaStatus
+from exports.schema.models import FrameTimestampRow
+
+from src.frame_timelines import FrameTimeline, FrameTimelineCache
+
+
+def _row(media_id: UUID, timestamp: float) -> FrameTimestampRow:
+    return FrameTimestampRow(
+        id=uuid4(),
+        media_id=media_id,
+        timestamp=timestamp,
+        frame_url=f"http://example/{timestamp}.jpg",
+    )
+
+
+def _timeline(*timestamps: float) -> FrameTimeline:
+    media_id = uuid4()
+    return FrameTimeline.from_rows(
+        MediaStatus.READY, [_row(media_id, t) for t in timestamps]
+    )
+
+
+def test_nearest_picks_closest_timestamp() -> None:
+    timeline = _timeline(9.0, 1.0, 5.0)  # unsorted input is fine
+    assert timeline.nearest(4.8)[1] == "http://example/5.0.jpg"
+
+
+def test_nearest_handles_bounds_and_ties() -> None:
+    timeline = _timeline(1.0, 5.0, 9.0)
+    assert timeline.nearest(-3.0)[1] == "http://example/1.0.jpg"
+    assert timeline.nearest(42.0)[1] == "http://example/9.0.jpg"
+    assert timeline.nearest(3.0)[1] == "http://example/1.0.jpg"  # tie keeps the earlier frame
+
+
+def test_nearest_returns_none_for_empty_timeline() -> None:
+    assert _timeline().nearest(1.0) is None
+
+
+class _FakeSupabase:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def get_frame_timestamps_by_media_ids(self, media_ids):
+        self.calls.append(sorted(media_ids))
+        return [row for row in self.rows if row.media_id in set(media_ids)]
+
+
+def test_cache_batches_misses_and_refetches_on_status_change() -> None:
+    a, b = uuid4(), uuid4()
+    supabase = _FakeSupabase([_row(a, 1.0), _row(b, 2.0), _row(b, 4.0)])
+    cache = FrameTimelineCache(max_media=8)
+
+    async def run():
+        ready = {a: MediaStatus.READY, b: MediaStatus.READY}
+        first = await cache.get_many(supabase, ready)
+        assert first[b].timestamps == (2.0, 4.0)
+        await cache.get_many(supabase, ready)  # warm: no query
+        await cache.get_many(supabase, {a: MediaStatus.FAILED, b: MediaStatus.READY})
+
+    asyncio.run(run())
+    assert supabase.calls == [sorted([a, b]), [a]]
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    ids = [uuid4() for _ in range(3)]
+    supabase = _FakeSupabase([_row(m, 1.0) for m in ids])
+    cache = FrameTimelineCache(max_media=2)
+
+    async def run():
+        for media_id in ids:
+            await cache.get_many(supabase, {media_id: MediaStatus.READY})
+        await cache.get_many(supabase, {ids[0]: MediaStatus.READY})
+
+    asyncio.run(run())
+    assert len(cache) == 2
+    assert supabase.calls[-1] == [ids[0]]
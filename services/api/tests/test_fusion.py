@@ -1,7 +1,9 @@
 """Unit tests for temporal signal fusion."""
 
+import random
 from uuid import uuid4
 
+from exports.fusion.alignment import alignment_score, rank_with_alignment
 from exports.fusion.classifier import QueryClass, classify_query
 from exports.fusion.pipeline import (
     candidate_counts_for,
@@ -34,6 +36,33 @@ def _hit(
     )
 
 
+def _group_by_timestamp_pairwise(hits: list[FusionHit]) -> list[MomentGroup]:
+    """Original O(hits x groups) grouping; reference for ``group_by_timestamp``."""
+    sorted_hits = sorted(hits, key=lambda hit: (str(hit.media_id), hit.timestamp))
+    groups: list[MomentGroup] = []
+
+    for hit in sorted_hits:
+        radius = proximity_radius(hit)
+        matched = False
+        for group in groups:
+            if group.media_id != hit.media_id:
+                continue
+            if abs(hit.timestamp - group.anchor_time) <= radius:
+                group.hits.append(hit)
+                matched = True
+                break
+        if not matched:
+            groups.append(
+                MomentGroup(
+                    media_id=hit.media_id,
+                    anchor_time=hit.timestamp,
+                    hits=[hit],
+                )
+            )
+
+    return groups
+
+
 def test_classify_visual_query() -> None:
     assert classify_query("show me the red car") == QueryClass.VISUAL
 
@@ -105,6 +134,37 @@ def test_group_by_timestamp_merges_cross_signal_hits() -> None:
     assert len(groups[0].signal_types) == 2
 
 
+def test_group_by_timestamp_matches_pairwise_grouping() -> None:
+    rng = random.Random(7)
+    media_ids = [uuid4() for _ in range(5)]
+    hits = []
+    for _ in range(400):
+        vector_type = rng.choice(list(VectorType))
+        timestamp = round(rng.uniform(0.0, 120.0), 1)
+        start = end = None
+        if vector_type == VectorType.CAPTION:
+            start, end = timestamp - 1.0, timestamp + rng.uniform(0.0, 4.0)
+        hits.append(
+            _hit(
+                vector_type=vector_type,
+                raw_score=rng.random(),
+                timestamp=timestamp,
+                media_id=rng.choice(media_ids),
+                start_time=start,
+                end_time=end,
+            )
+        )
+
+    expected = _group_by_timestamp_pairwise(hits)
+    actual = group_by_timestamp(hits)
+    assert [(g.media_id, g.anchor_time) for g in actual] == [
+        (g.media_id, g.anchor_time) for g in expected
+    ]
+    assert [[id(h) for h in g.hits] for g in actual] == [
+        [id(h) for h in g.hits] for g in expected
+    ]
+
+
 def test_fuse_and_rank_boosts_intersections() -> None:
     media_id = uuid4()
     single = MomentGroup(
@@ -145,3 +205,71 @@ def test_fuse_and_rank_boosts_intersections() -> None:
     ranked = fuse_and_rank([single, intersection], top_k=2)
     assert ranked[0] is intersection
     assert ranked[0].best_hit.fused_score == 0.7 * 1.3
+
+
+def test_alignment_score_counts_distinct_query_frames_on_one_offset() -> None:
+    votes = [(10.0, 0), (10.5, 1), (10.2, 1), (40.0, 2)]
+    assert alignment_score([10.0], votes, 4, tolerance=1.0) == 0.5
+    assert alignment_score([40.0], votes, 4, tolerance=1.0) == 0.25
+    assert alignment_score([], votes, 4) == 0.0
+
+
+def test_rank_with_alignment_prefers_media_matching_the_clip_in_order() -> None:
+    aligned_media, scattered_media = uuid4(), uuid4()
+    hits = []
+    matches = {}
+    # Query frames at 0s, 5s, 10s. The aligned video contains them at 100s+,
+    # the scattered one has look-alikes at unrelated times (slightly higher scores).
+    clip_times = [(100.0, 20.0), (105.0, 300.0), (110.0, 70.0)]
+    for index, (aligned_t, scattered_t) in enumerate(clip_times):
+        aligned = _hit(
+            vector_type=VectorType.IMAGE,
+            raw_score=0.8,
+            timestamp=aligned_t,
+            media_id=aligned_media,
+        )
+        scattered = _hit(
+            vector_type=VectorType.IMAGE,
+            raw_score=0.85,
+            timestamp=scattered_t,
+            media_id=scattered_media,
+        )
+        aligned.faiss_index_id = 10 + index
+        scattered.faiss_index_id = 20 + index
+        matches[(aligned.faiss_index_id, VectorType.IMAGE)] = [(index, index * 5.0)]
+        matches[(scattered.faiss_index_id, VectorType.IMAGE)] = [(index, index * 5.0)]
+        hits += [aligned, scattered]
+    weak = _hit(vector_type=VectorType.IMAGE, raw_score=0.5, timestamp=0.0)
+    weak.faiss_index_id = 99
+    hits.append(weak)
+
+    normalize_scores_by_type(hits)
+    groups = group_by_timestamp(hits)
+    scored = fuse_and_rank(groups, len(groups))
+    assert scored[0].media_id == scattered_media
+
+    ranked = rank_with_alignment(scored, matches, 3, top_k=2, tolerance=1.0, weight=0.5)
+    assert len(ranked) == 2
+    assert {group.media_id for group in ranked} == {aligned_media}
+
+
+def test_rank_with_alignment_adds_weighted_alignment_to_fused_score() -> None:
+    media_id = uuid4()
+    hits = []
+    matches = {}
+    for index in range(2):
+        hit = _hit(
+            vector_type=VectorType.IMAGE,
+            raw_score=0.5,
+            timestamp=50.0 + index * 5.0,
+            media_id=media_id,
+        )
+        hit.faiss_index_id = index
+        hit.fused_score = 0.0
+        matches[(index, VectorType.IMAGE)] = [(index, index * 5.0)]
+        hits.append(hit)
+    group = MomentGroup(media_id=media_id, anchor_time=50.0, hits=hits)
+
+    ranked = rank_with_alignment([group], matches, 4, top_k=1, tolerance=1.0, weight=0.5)
+    # Two of four query frames agree on offset 50s: 0.0 + 0.5 * 0.5.
+    assert ranked[0].best_hit.fused_score == 0.25
@@ -0,0 +1,73 @@
+"""Concurrent, deadline-bound health probes behind /health/all."""
+
+import asyncio
+import time
+
+from src.health_monitor import ServiceHealthMonitor
+
+
+def test_probes_run_concurrently_and_hung_services_time_out() -> None:
+    async def healthy() -> dict:
+        await asyncio.sleep(0.05)
+        return {"live": True, "ready": True}
+
+    async def loading() -> dict:
+        await asyncio.sleep(0.05)
+        return {"live": True, "ready": False}
+
+    async def hung() -> dict:
+        await asyncio.sleep(60)
+        return {"live": True, "ready": True}
+
+    async def broken() -> dict:
+        raise RuntimeError("connection refused")
+
+    async def run():
+        monitor = ServiceHealthMonitor(
+            {"a": healthy, "b": healthy, "c": loading, "d": hung, "e": broken},
+            probe_timeout=0.2,
+        )
+        before = monitor.snapshot()
+        started = time.perf_counter()
+        await monitor.refresh()
+        elapsed = time.perf_counter() - started
+        return before, monitor.snapshot(), elapsed
+
+    before, after, elapsed = asyncio.run(run())
+    assert before["checked_at"] is None
+    assert before["services"]["a"]["status"] == "unknown"
+    assert elapsed < 0.5
+    statuses = {name: entry["status"] for name, entry in after["services"].items()}
+    assert statuses == {
+        "a": "healthy",
+        "b": "healthy",
+        "c": "degraded",
+        "d": "unhealthy",
+        "e": "unhealthy",
+    }
+    assert "0.2s" in after["services"]["d"]["error"]
+    assert after["services"]["e"]["error"] == "connection refused"
+
+
+def test_background_loop_refreshes_and_callers_share_a_round() -> None:
+    calls = []
+
+    async def probe() -> dict:
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {"live": True, "ready": True}
+
+    async def run():
+        monitor = ServiceHealthMonitor({"svc": probe}, refresh_seconds=0.05).start()
+        await asyncio.sleep(0.01)
+        await asyncio.gather(monitor.refresh(), monitor.refresh())
+        first_round = len(calls)
+        await asyncio.sleep(0.12)
+        await monitor.close()
+        return first_round, len(calls), monitor.snapshot()
+
+    first_round, total, snapshot = asyncio.run(run())
+    assert first_round == 1
+    assert total >= 2
+    assert snapshot["services"]["svc"]["status"] == "healthy"
+    assert snapshot["age_seconds"] is not None
@@ -0,0 +1,93 @@
+"""Durable ingest job queue and its worker pool."""
+
+import asyncio
+
+from src.ingest_jobs import (
+    IngestJobStore,
+    IngestWorkerPool,
+    JobProgress,
+    JobState,
+    StageState,
+)
+
+
+def test_claim_runs_oldest_first_and_failures_retry_until_max_attempts() -> None:
+    store = IngestJobStore(path=None, max_attempts=2)
+    store.load()
+    first = store.enqueue({"object_name": "a.mp4"})
+    second = store.enqueue({"object_name": "b.mp4"})
+
+    claimed = store.claim()
+    assert claimed.id == first.id
+    assert claimed.state == JobState.RUNNING
+    assert claimed.attempts == 1
+    assert store.finish(first.id, "extract exploded") == JobState.QUEUED
+
+    assert store.claim().id == first.id  # re-queued ahead of the newer job
+    assert store.finish(first.id, "extract exploded again") == JobState.FAILED
+    failed = store.get(first.id)
+    assert failed.attempts == 2
+    assert failed.error == "extract exploded again"
+    assert failed.finished_at is not None
+
+    assert store.claim().id == second.id
+    assert store.finish(second.id) == JobState.SUCCEEDED
+    assert store.claim() is None
+    assert store.counts()[JobState.SUCCEEDED.value] == 1
+
+
+def test_running_jobs_are_requeued_after_restart(tmp_path) -> None:
+    path = str(tmp_path / "jobs.sqlite")
+    store = IngestJobStore(path=path, max_attempts=2)
+    store.load()
+    exhausted = store.enqueue({"object_name": "a.mp4"})
+    retried = store.enqueue({"object_name": "b.mp4"})
+    assert store.claim().id == exhausted.id
+    store.finish(exhausted.id, "boom")  # attempt 1 of 2 used, queued again
+    assert store.claim().id == exhausted.id
+    assert store.claim().id == retried.id  # both running; the process "dies" here
+    store.close()
+
+    reopened = IngestJobStore(path=path, max_attempts=2)
+    reopened.load()
+    assert reopened.get(retried.id).state == JobState.QUEUED
+    assert reopened.get(exhausted.id).state == JobState.FAILED
+    reopened.close()
+
+
+def test_worker_pool_records_stage_timing_and_retries() -> None:
+    calls = []
+
+    async def runner(job, progress: JobProgress) -> None:
+        calls.append(job.attempts)
+        async with progress.stage("extract") as detail:
+            detail["frames"] = 3
+        progress.set_media_id("00000000-0000-0000-0000-000000000001")
+        if job.attempts == 1:
+            async with progress.stage("embed_frames"):
+                raise RuntimeError("embedder down")
+        progress.skip("caption", "no captions")
+
+    async def run():
+        store = IngestJobStore(path=None, max_attempts=2)
+        store.load()
+        pool = IngestWorkerPool(store, runner, workers=2, poll_seconds=0.01).start()
+        job = store.enqueue({"object_name": "a.mp4"})
+        pool.notify()
+        for _ in range(200):
+            if store.get(job.id).state == JobState.SUCCEEDED:
+                break
+            await asyncio.sleep(0.01)
+        await pool.close()
+        return store.get(job.id)
+
+    job = asyncio.run(run())
+    assert calls == [1, 2]
+    assert job.state == JobState.SUCCEEDED
+    assert job.media_id == "00000000-0000-0000-0000-000000000001"
+    # Stages belong to the latest attempt only.
+    assert set(job.stages) == {"extract", "caption"}
+    assert job.stages["extract"]["state"] == StageState.DONE.value
+    assert job.stages["extract"]["detail"] == {"frames": 3}
+    assert job.stages["extract"]["duration_seconds"] >= 0.0
+    assert job.stages["caption"]["state"] == StageState.SKIPPED.value
@@ -0,0 +1,227 @@
+"""Ingest stage graph: concurrent branches and per-stage limits."""
+
+import asyncio
+from uuid import uuid4
+
+from exports.schema.constants import ExtractionStrategy, MediaStatus, MediaType
+from exports.schema.models import (
+    AddVectorsResponse,
+    CaptionEmbeddingResult,
+    CaptionResponse,
+    CaptionSegmentData,
+    EmbeddingResult,
+    ExtractFramesResponse,
+    FrameData,
+    TextEmbeddingResult,
+    TranscribeResponse,
+    TranscriptSegmentData,
+)
+
+from src.ingest_jobs import IngestJobStore, JobProgress, JobState, StageState
+from src.ingest_pipeline import IngestServices, StageLimits, run_ingest_job
+from src.schema.responses import SearchResult
+from src.search_results import SearchCacheKey, SearchResultCache
+
+
+class _Services:
+    """Fake downstream clients that record call order and embedder overlap."""
+
+    def __init__(self, *, fail_index: bool = False) -> None:
+        self.media_id = uuid4()
+        self.events: list[str] = []
+        self.embedding_now = 0
+        self.embedding_peak = 0
+        self.fail_index = fail_index
+        self.statuses: list[MediaStatus] = []
+        self.updates: list[tuple[str, MediaStatus]] = []
+        self.on_add_vectors = None
+
+    async def extract_frames_hybrid(self, **_kwargs) -> ExtractFramesResponse:
+        frames = [
+            FrameData(
+                frame_id=uuid4(),
+                sequence_number=i,
+                timestamp=float(i),
+                frame_url=f"http://minio/f{i}.jpg",
+                frame_data="",
+            )
+            for i in range(3)
+        ]
+        return ExtractFramesResponse(
+            media_id=self.media_id,
+            frames=frames,
+            frame_count=len(frames),
+            strategy=ExtractionStrategy.HYBRID,
+            duration=3.0,
+        )
+
+    async def _embed(self, name: str, results):
+        self.embedding_now += 1
+        self.embedding_peak = max(self.embedding_peak, self.embedding_now)
+        self.events.append(f"{name}:start")
+        await asyncio.sleep(0.03)
+        self.events.append(f"{name}:end")
+        self.embedding_now -= 1
+        return results
+
+    async def embed_images(self, items):
+        return await self._embed(
+            "embed_images",
+            [EmbeddingResult(frame_id=item.frame_id, embedding=[1.0]) for item in items],
+        )
+
+    async def embed_texts(self, items):
+        return await self._embed(
+            "embed_texts",
+            [
+                TextEmbeddingResult(transcript_id=item.transcript_id, embedding=[1.0])
+                for item in items
+            ],
+        )
+
+    async def embed_captions(self, items):
+        return await self._embed(
+            "embed_captions",
+            [
+                CaptionEmbeddingResult(caption_id=item.caption_id, embedding=[1.0])
+                for item in items
+            ],
+        )
+
+    async def add_vectors(self, *, vectors, **_kwargs) -> AddVectorsResponse:
+        if self.fail_index and vectors[0].frame_id is not None:
+            raise RuntimeError("indexer down")
+        if self.on_add_vectors is not None:
+            self.on_add_vectors()
+        return AddVectorsResponse(count=len(vectors))
+
+    async def transcribe(self, **_kwargs) -> TranscribeResponse:
+        self.events.append("transcribe:start")
+        await asyncio.sleep(0.01)
+        segment = TranscriptSegmentData(id=uuid4(), start_time=0.0, end_time=2.0, text="hi")
+        return TranscribeResponse(media_id=self.media_id, segments=[segment], segment_count=1)
+
+    async def caption(self, **_kwargs) -> CaptionResponse:
+        self.events.append("caption:start")
+        await asyncio.sleep(0.01)
+        segment = CaptionSegmentData(id=uuid4(), start_time=1.0, end_time=3.0, text="a dog")
+        return CaptionResponse(media_id=self.media_id, segments=[segment], segment_count=1)
+
+    async def update_media(self, media_id, update) -> None:
+        self.statuses.append(update.status)
+        self.updates.append((str(media_id), update.status))
+
+
+def _run(
+    fake: _Services,
+    *,
+    previous_media_id: str | None = None,
+    search_results: SearchResultCache | None = None,
+):
+    async def run():
+        store = IngestJobStore(path=None)
+        store.load()
+        job = store.enqueue({"object_name": "a.mp4", "file_url": "http://x", "threshold": 0.3})
+        job = store.claim()
+        if previous_media_id is not None:
+            # Attempt 1 got as far as creating a media row, then was cut short.
+            store.set_media_id(job.id, previous_media_id)
+            store.finish(job.id, "interrupted")
+            job = store.claim()
+        services = IngestServices(
+            supabase=fake,
+            media_processor=fake,
+            embedder=fake,
+            indexer=fake,
+            transcribe=fake,
+            caption=fake,
+            search_results=search_results,
+            limits=StageLimits(
+                {"extract": 1, "embed": 1, "index": 1, "transcribe": 1, "caption": 1}
+            ),
+        )
+        error = None
+        try:
+            await run_ingest_job(services, job, JobProgress(store, job.id))
+        except Exception as exc:
+            error = exc
+        return store.get(job.id), error
+
+    return asyncio.run(run())
+
+
+def test_transcribe_and_caption_start_while_frames_embed() -> None:
+    fake = _Services()
+    job, error = _run(fake)
+    assert error is None
+    events = fake.events
+    assert events.index("transcribe:start") < events.index("embed_images:end")
+    assert events.index("caption:start") < events.index("embed_images:end")
+    assert fake.embedding_peak == 1  # the embed limit serialized all three embeds
+    assert fake.statuses == [MediaStatus.READY]
+    assert job.state == JobState.RUNNING  # finishing is the worker's job
+    assert {name: stage["state"] for name, stage in job.stages.items()} == {
+        "extract": StageState.DONE.value,
+        "embed_frames": StageState.DONE.value,
+        "index_frames": StageState.DONE.value,
+        "transcribe": StageState.DONE.value,
+        "caption": StageState.DONE.value,
+        "finalize": StageState.DONE.value,
+    }
+    assert job.stages["transcribe"]["detail"] == {"segments": 1, "vectors": 1}
+
+
+def test_frame_branch_failure_fails_job_and_marks_media_failed() -> None:
+    fake = _Services(fail_index=True)
+    job, error = _run(fake)
+    assert isinstance(error, RuntimeError)
+    assert str(error) == "indexer down"
+    assert fake.statuses == [MediaStatus.FAILED]
+    assert job.stages["index_frames"]["state"] == StageState.FAILED.value
+    assert "finalize" not in job.stages
+
+
+def test_retry_retires_the_previous_attempts_media_row() -> None:
+    fake = _Services()
+    previous = str(uuid4())
+    job, error = _run(fake, previous_media_id=previous)
+    assert error is None
+    assert job.attempts == 2
+    assert job.media_id == str(fake.media_id)
+    assert fake.updates == [
+        (previous, MediaStatus.FAILED),
+        (str(fake.media_id), MediaStatus.READY),
+    ]
+
+
+def test_status_flips_drop_results_cached_before_media_was_ready() -> None:
+    cache = SearchResultCache()
+    stale = SearchResult(
+        media_id=uuid4(),
+        similarity=0.9,
+        media_type=MediaType.VIDEO,
+        file_name="old.mp4",
+        file_url="http://x/old.mp4",
+    )
+    keys = []
+
+    def search_between_index_and_finalize() -> None:
+        # Vectors are in (new generation) but the media is still processing,
+        # so a search now caches results without it.
+        key = SearchCacheKey.for_text("dog", None, 10, 5, cache.epoch)
+        cache.put(key, [stale])
+        keys.append(key)
+
+    fake = _Services()
+    fake.on_add_vectors = search_between_index_and_finalize
+    _job, error = _run(fake, search_results=cache)
+    assert error is None
+    assert fake.statuses == [MediaStatus.READY]
+
+    assert cache.get(keys[0]) is None
+    cache.put(keys[0], [stale])  # a search that started before the flip
+    assert cache.get(keys[0]) is None
+    assert len(cache) == 0
+    fresh = SearchCacheKey.for_text("dog", None, 10, 5, cache.epoch)
+    cache.put(fresh, [stale])
+    assert cache.get(fresh) is not None
@@ -0,0 +1,116 @@
+"""Query embedding cache and its use in the embedder client."""
+
+import asyncio
+
+import httpx
+
+from src.query_embeddings import QueryEmbeddingCache, normalize_query
+from src.service_clients.embedder_client import EmbedderClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_normalize_query_matches_clip_tokenizer_cleanup() -> None:
+    assert normalize_query("  Red   CAR\tat night ") == "red car at night"
+
+
+def test_cache_evicts_lru_and_expires_by_ttl() -> None:
+    clock = _Clock()
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=60.0, path=None, clock=clock)
+    cache.put("a", [0.5, 1.0])
+    cache.put("b", [0.25, 2.0])
+    assert cache.get("a") == [0.5, 1.0]  # a is now most recent
+    cache.put("c", [1.0, 1.0])
+    assert cache.get("b") is None
+    assert cache.get("a") == [0.5, 1.0]
+
+    clock.now += 61.0
+    assert cache.get("c") is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_cache_persists_across_restarts_for_same_model(tmp_path) -> None:
+    path = str(tmp_path / "queries.sqlite")
+    clock = _Clock()
+    cache = QueryEmbeddingCache(path=path, model="clip-a", clock=clock)
+    cache.load()
+    cache.put("red car", [0.5, -1.0, 2.0])
+    cache.close()
+
+    reopened = QueryEmbeddingCache(path=path, model="clip-a", clock=clock)
+    reopened.load()
+    assert reopened.stats()["persistent"] is True
+    assert reopened.get("red car") == [0.5, -1.0, 2.0]
+    reopened.close()
+
+    other_model = QueryEmbeddingCache(path=path, model="clip-b", clock=clock)
+    other_model.load()
+    assert other_model.get("red car") is None
+    other_model.close()
+
+
+def test_embed_text_serves_repeats_and_coalesces_concurrent_misses() -> None:
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"embedding": [0.5, 0.25]})
+
+    async def run():
+        client = EmbedderClient(
+            "http://embedder",
+            binary_vectors=False,
+            query_cache=QueryEmbeddingCache(path=None),
+        )
+        client.client = httpx.AsyncClient(
+            base_url="http://embedder", transport=httpx.MockTransport(handler)
+        )
+        first = await asyncio.gather(
+            client.embed_text("Red car"), client.embed_text("red  car")
+        )
+        again = await client.embed_text("RED CAR")
+        await client.close()
+        return first, again
+
+    first, again = asyncio.run(run())
+    assert first == [[0.5, 0.25], [0.5, 0.25]]
+    assert again == [0.5, 0.25]
+    assert len(calls) == 1
+
+
+def test_embed_query_image_posts_raw_bytes_and_caches_by_content_hash() -> None:
+    bodies = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.url.path, request.headers["content-type"], request.content))
+        return httpx.Response(200, json={"embedding": [1.0, 0.0]})
+
+    async def run():
+        client = EmbedderClient(
+            "http://embedder",
+            binary_vectors=False,
+            image_cache=QueryEmbeddingCache(path=None),
+        )
+        client.client = httpx.AsyncClient(
+            base_url="http://embedder", transport=httpx.MockTransport(handler)
+        )
+        first = await client.embed_query_image(b"\xff\xd8jpeg", "image/jpeg")
+        repeat = await client.embed_query_image(b"\xff\xd8jpeg", "image/jpeg")
+        other = await client.embed_query_image(b"\x89PNG", "image/png")
+        await client.close()
+        return first, repeat, other
+
+    first, repeat, other = asyncio.run(run())
+    assert first == repeat == other == [1.0, 0.0]
+    assert bodies == [
+        ("/embed/images/raw", "image/jpeg", b"\xff\xd8jpeg"),
+        ("/embed/images/raw", "image/png", b"\x89PNG"),
+    ]
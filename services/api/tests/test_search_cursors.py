@@ -0,0 +1,83 @@
+"""Pagination cursors over parked search candidate sets."""
+
+from uuid import uuid4
+
+from exports.fusion.classifier import QueryClass
+from exports.schema.constants import (
+    INDEXER_MAX_TOP_K,
+    SEARCH_PAGE_MAX_DEPTH,
+    MediaType,
+    QueryType,
+    VectorType,
+)
+
+from src.routes.search_route import _candidate_top_k
+from src.schema.responses import SearchResult
+from src.search_cursors import SearchCursorStore
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _results(n: int) -> list[SearchResult]:
+    return [
+        SearchResult(
+            media_id=uuid4(),
+            similarity=1.0 - i / n,
+            media_type=MediaType.VIDEO,
+            file_name="clip.mp4",
+            file_url="http://example/clip.mp4",
+        )
+        for i in range(n)
+    ]
+
+
+def test_cursor_walks_every_page_in_rank_order() -> None:
+    store = SearchCursorStore()
+    results = _results(7)
+    first, cursor = store.open(QueryType.TEXT, results, 3)
+    pages = [first]
+    while cursor is not None:
+        page = store.page(cursor)
+        assert page is not None
+        assert page.query_type == QueryType.TEXT
+        pages.append(page.results)
+        cursor = page.next_cursor
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [r for page in pages for r in page] == results
+    assert store.stats()["pages_served"] == 2
+
+
+def test_single_page_is_not_parked() -> None:
+    store = SearchCursorStore()
+    results = _results(3)
+    assert store.open(QueryType.IMAGE, results, 3) == (results, None)
+    assert len(store) == 0
+
+
+def test_cursors_expire_and_reject_garbage() -> None:
+    clock = _Clock()
+    store = SearchCursorStore(max_sets=1, ttl_seconds=60.0, clock=clock)
+    _, first_cursor = store.open(QueryType.TEXT, _results(4), 2)
+    _, second_cursor = store.open(QueryType.TEXT, _results(4), 2)
+    assert store.page(first_cursor) is None  # evicted by the second set
+    assert store.page("not-a-cursor") is None
+    assert store.page(second_cursor.rpartition(".")[0] + ".x") is None
+
+    clock.now += 61.0
+    assert store.page(second_cursor) is None
+    assert store.stats()["expired"] == 1
+
+
+def test_paginated_candidate_counts_keep_class_proportions() -> None:
+    plain = _candidate_top_k(QueryClass.VISUAL)
+    deep = _candidate_top_k(QueryClass.VISUAL, paginate=True)
+    assert deep[VectorType.IMAGE] > plain[VectorType.IMAGE]
+    assert deep[VectorType.IMAGE] >= min(SEARCH_PAGE_MAX_DEPTH, INDEXER_MAX_TOP_K)
+    assert deep[VectorType.TEXT] < deep[VectorType.IMAGE]
+    assert all(k <= INDEXER_MAX_TOP_K for k in deep.values())
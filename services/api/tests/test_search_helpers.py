@@ -1,41 +1,31 @@
 """Unit tests for search result assembly helpers."""
 
-from datetime import datetime, timezone
-from uuid import uuid4
+import asyncio
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
 
 from exports.fusion.types import FusionHit, MomentGroup
-from exports.schema.constants import MediaType, VectorType
-from exports.schema.models import FrameRow
+from exports.schema.constants import MediaStatus, MediaType, VectorType
+from exports.schema.models import (
+    EmbeddingResult,
+    IndexedHitMetadata,
+    IndexedMedia,
+    IndexerVectorHit,
+)
 
 from src.routes.search_route import (
+    _clip_frame_embeddings,
     _effective_top_k,
-    _nearest_frame,
+    _fusion_hit_from_metadata,
+    _hydrate_fusion_hits,
+    _search_cache_key,
     _search_result_from_group,
     _search_result_from_single_hit,
 )
-
-
-def _frame(timestamp: float) -> FrameRow:
-    now = datetime.now(timezone.utc)
-    return FrameRow(
-        id=uuid4(),
-        media_id=uuid4(),
-        timestamp=timestamp,
-        frame_url="http://example/frame.jpg",
-        sequence_number=0,
-        created_at=now,
-    )
-
-
-def test_nearest_frame_picks_closest_timestamp() -> None:
-    frames = [_frame(1.0), _frame(5.0), _frame(9.0)]
-    nearest = _nearest_frame(frames, 4.8)
-    assert nearest is not None
-    assert nearest.timestamp == 5.0
-
-
-def test_nearest_frame_returns_none_for_empty_list() -> None:
-    assert _nearest_frame([], 1.0) is None
+from src.search_results import SearchResultCache
 
 
 def test_effective_top_k_clamps_to_default_max() -> None:
@@ -111,3 +101,127 @@ def test_search_result_from_group_includes_all_signals() -> None:
     assert len(result.signals) == 2
     assert result.caption_text == "A person waves"
     assert result.similarity == 0.78
+
+
+def test_fusion_hit_from_metadata_uses_sidecar_fields() -> None:
+    media_id, frame_id = uuid4(), uuid4()
+    hit = IndexerVectorHit(
+        faiss_index_id=4,
+        vector_type=VectorType.CAPTION,
+        similarity_score=0.7,
+        metadata=IndexedHitMetadata(
+            media_id=media_id,
+            row_id=uuid4(),
+            timestamp=5.0,
+            start_time=4.0,
+            end_time=6.0,
+            frame_id=frame_id,
+            frame_url="http://example/frame.jpg",
+            text="a dog on a beach",
+            media=IndexedMedia(
+                media_type=MediaType.VIDEO,
+                file_name="clip.mp4",
+                file_url="http://example/clip.mp4",
+            ),
+        ),
+    )
+    fusion_hit = _fusion_hit_from_metadata(hit)
+    assert fusion_hit is not None
+    assert fusion_hit.media_id == media_id
+    assert fusion_hit.frame_id == frame_id
+    assert fusion_hit.caption_text == "a dog on a beach"
+    assert fusion_hit.transcript_text is None
+    assert fusion_hit.raw_score == 0.7
+
+
+def test_fusion_hit_from_metadata_needs_media_fields() -> None:
+    hit = IndexerVectorHit(
+        faiss_index_id=1, vector_type=VectorType.IMAGE, similarity_score=0.5
+    )
+    assert _fusion_hit_from_metadata(hit) is None
+
+
+def test_hydrate_drops_hits_from_media_that_did_not_finish_ingest() -> None:
+    ready, failed, processing = uuid4(), uuid4(), uuid4()
+
+    def hit(faiss_id: int, media_id) -> IndexerVectorHit:
+        return IndexerVectorHit(
+            faiss_index_id=faiss_id,
+            vector_type=VectorType.IMAGE,
+            similarity_score=0.9,
+            metadata=IndexedHitMetadata(
+                media_id=media_id,
+                row_id=uuid4(),
+                timestamp=1.0,
+                media=IndexedMedia(
+                    media_type=MediaType.VIDEO,
+                    file_name="clip.mp4",
+                    file_url="http://example/clip.mp4",
+                ),
+            ),
+        )
+
+    class _Supabase:
+        async def get_media_by_ids(self, media_ids):
+            statuses = {
+                ready: MediaStatus.READY,
+                failed: MediaStatus.FAILED,  # previous attempt of a retried job
+                processing: MediaStatus.PROCESSING,
+            }
+            return [SimpleNamespace(id=m, status=statuses[m]) for m in media_ids]
+
+    hits = [hit(0, failed), hit(1, ready), hit(2, processing), hit(3, ready)]
+    fusion_hits = asyncio.run(_hydrate_fusion_hits(_Supabase(), None, hits))
+    assert [h.faiss_index_id for h in fusion_hits] == [1, 3]
+
+
+def test_search_cache_key_reuses_a_recent_generation() -> None:
+    class _Indexer:
+        def __init__(self) -> None:
+            self.calls = 0
+            self.fail = False
+
+        async def get_generation(self) -> int:
+            self.calls += 1
+            if self.fail:
+                raise httpx.ConnectError("indexer down")
+            return 7
+
+    clock = SimpleNamespace(now=0.0)
+    cache = SearchResultCache(generation_ttl_seconds=1.0, clock=lambda: clock.now)
+    indexer = _Indexer()
+
+    def key():
+        return asyncio.run(_search_cache_key(indexer, cache, "red car", None, 10))
+
+    assert key().generation == 7
+    assert key().generation == 7
+    assert indexer.calls == 1
+
+    clock.now = 2.0
+    indexer.fail = True
+    assert key() is None  # lookup failed: search runs uncached
+    assert indexer.calls == 2
+
+
+def test_clip_frame_embeddings_follow_frame_order_and_reject_gaps() -> None:
+    def result(i: int) -> EmbeddingResult:
+        return EmbeddingResult(frame_id=UUID(int=i), embedding=[float(i)])
+
+    assert _clip_frame_embeddings([result(1), result(0)], 2) == [[0.0], [1.0]]
+    for embedded in ([result(0)], [result(0), result(0)], [result(0), result(2)]):
+        with pytest.raises(ValueError):
+            _clip_frame_embeddings(embedded, 2)
+
+
+def test_similar_search_request_needs_exactly_one_seed() -> None:
+    import pytest
+    from pydantic import ValidationError
+
+    from exports.schema.models import SimilarSearchRequest
+
+    assert SimilarSearchRequest(caption_id=uuid4()).caption_id is not None
+    with pytest.raises(ValidationError):
+        SimilarSearchRequest()
+    with pytest.raises(ValidationError):
+        SimilarSearchRequest(frame_id=uuid4(), transcript_id=uuid4())
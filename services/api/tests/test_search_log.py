@@ -0,0 +1,80 @@
+"""Buffered search_queries writer."""
+
+import asyncio
+
+from exports.schema.constants import QueryType
+from exports.schema.models import SearchQueryCreate
+
+from src.search_log import SearchQueryLog
+
+
+def _query(i: int) -> SearchQueryCreate:
+    return SearchQueryCreate(
+        query_type=QueryType.TEXT, query_text=f"q{i}", latency_ms=1.5, result_count=i
+    )
+
+
+class _FakeSupabase:
+    def __init__(self, fail: bool = False) -> None:
+        self.batches = []
+        self.fail = fail
+
+    async def insert_search_queries_batch(self, queries):
+        if self.fail:
+            raise RuntimeError("supabase down")
+        self.batches.append([q.query_text for q in queries])
+
+
+def test_full_batch_flushes_before_the_interval() -> None:
+    supabase = _FakeSupabase()
+
+    async def run():
+        log = SearchQueryLog(supabase, batch_size=2, flush_seconds=60.0).start()
+        log.record(_query(0))
+        await asyncio.sleep(0.01)
+        before_full = list(supabase.batches)
+        for i in range(1, 4):
+            log.record(_query(i))
+        await asyncio.sleep(0.01)
+        after_full = list(supabase.batches)
+        log.record(_query(4))
+        await log.close()
+        return before_full, after_full, log.stats()
+
+    before_full, after_full, stats = asyncio.run(run())
+    assert before_full == []
+    assert after_full == [["q0", "q1"], ["q2", "q3"]]
+    assert supabase.batches[-1] == ["q4"]  # drained on close
+    assert stats["written"] == 5 and stats["queued"] == 0
+
+
+def test_flushes_partial_batch_after_interval() -> None:
+    supabase = _FakeSupabase()
+
+    async def run():
+        log = SearchQueryLog(supabase, batch_size=100, flush_seconds=0.01).start()
+        log.record(_query(0))
+        await asyncio.sleep(0.05)
+        flushed = list(supabase.batches)
+        await log.close()
+        return flushed
+
+    assert asyncio.run(run()) == [["q0"]]
+
+
+def test_drops_when_buffer_is_full_and_database_is_down() -> None:
+    supabase = _FakeSupabase(fail=True)
+
+    async def run():
+        log = SearchQueryLog(
+            supabase, batch_size=10, flush_seconds=60.0, max_queued=3
+        ).start()
+        for i in range(5):
+            log.record(_query(i))
+        await log.close()
+        return log.stats()
+
+    stats = asyncio.run(run())
+    assert stats["dropped"] == 2
+    assert stats["failed"] == 3
+    assert stats["written"] == 0
@@ -0,0 +1,75 @@
+"""Search result cache keyed on the index generation."""
+
+from uuid import uuid4
+
+from exports.schema.constants import MediaType, VectorType
+
+from src.schema.responses import SearchResult
+from src.search_results import SearchCacheKey, SearchResultCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _result(similarity: float) -> SearchResult:
+    return SearchResult(
+        media_id=uuid4(),
+        similarity=similarity,
+        media_type=MediaType.VIDEO,
+        file_name="clip.mp4",
+        file_url="http://example/clip.mp4",
+    )
+
+
+def test_key_normalizes_query_text() -> None:
+    a = SearchCacheKey.for_text("Red  car", None, 10, 3)
+    b = SearchCacheKey.for_text("red car", None, 10, 3)
+    assert a == b
+    assert a != SearchCacheKey.for_text("red car", VectorType.IMAGE, 10, 3)
+    assert a != SearchCacheKey.for_text("red car", None, 5, 3)
+
+
+def test_new_generation_invalidates_older_entries() -> None:
+    cache = SearchResultCache()
+    old = SearchCacheKey.for_text("red car", None, 10, 3)
+    cache.put(old, [_result(0.9)])
+    assert cache.get(old)[0].similarity == 0.9
+
+    new = SearchCacheKey.for_text("red car", None, 10, 4)
+    assert cache.get(new) is None
+    assert len(cache) == 0
+    cache.put(old, [_result(0.1)])  # a slow search that read the old generation
+    assert len(cache) == 0
+
+
+def test_entries_expire_and_are_isolated_from_callers() -> None:
+    clock = _Clock()
+    cache = SearchResultCache(ttl_seconds=10.0, clock=clock)
+    key = SearchCacheKey.for_text("red car", None, 10, 1)
+    results = [_result(0.5)]
+    cache.put(key, results)
+    results[0].similarity = 0.0
+    served = cache.get(key)
+    assert served[0].similarity == 0.5
+    served[0].similarity = 0.0
+    assert cache.get(key)[0].similarity == 0.5
+
+    clock.now = 11.0
+    assert cache.get(key) is None
+    assert cache.stats()["hits"] == 2
+
+
+def test_remembered_generation_expires() -> None:
+    clock = _Clock()
+    cache = SearchResultCache(generation_ttl_seconds=1.0, clock=clock)
+    assert cache.recent_generation() is None
+    cache.remember_generation(5)
+    clock.now = 1.0
+    assert cache.recent_generation() == 5
+    clock.now = 1.5
+    assert cache.recent_generation() is None
@@ -1,8 +1,6 @@
 """Caption endpoint: download video, run Qwen2-VL pipeline, persist caption windows."""
 
 import asyncio
-import os
-import tempfile
 
 from fastapi import APIRouter, HTTPException, Request
 
@@ -15,6 +13,7 @@ from exports.schema.models import (
     CaptionSegmentData,
 )
 from exports.utils.logger import get_logger
+from exports.video_cache import VideoCache
 
 from ..caption_engine import CaptionEngine
 
@@ -31,7 +30,7 @@ def _get_engine(request: Request) -> CaptionEngine:
 
 @router.post("/", response_model=CaptionResponse)
 async def caption_video(request: Request, body: CaptionRequest) -> CaptionResponse:
-    """Download a video from MinIO, caption it, and store time-bounded windows."""
+    """Caption a cached copy of a MinIO video and store time-bounded windows."""
     minio: MinioDB = request.app.state.minio
     supabase: SupabaseDB = request.app.state.supabase
     engine = _get_engine(request)
@@ -42,14 +41,12 @@ async def caption_video(request: Request, body: CaptionRequest) -> CaptionRespon
         body.video_object_key,
     )
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as temp_file:
-        temp_path = temp_file.name
-        temp_file.write(await minio.download_file(body.video_object_key))
-
+    video_cache: VideoCache = request.app.state.video_cache
     try:
-        drafts = await asyncio.to_thread(
-            engine.caption_video, temp_path, body.media_id
-        )
+        async with video_cache.open(minio, body.video_object_key) as video_path:
+            drafts = await asyncio.to_thread(
+                engine.caption_video, video_path, body.media_id
+            )
         if not drafts:
             logger.info("No captions generated for media_id=%s", body.media_id)
             return CaptionResponse(
@@ -94,8 +91,3 @@ async def caption_video(request: Request, body: CaptionRequest) -> CaptionRespon
             "Captioning failed for media_id=%s: %s", body.media_id, exc, exc_info=True
         )
         raise HTTPException(status_code=500, detail=str(exc)) from exc
-    finally:
-        try:
-            os.unlink(temp_path)
-        except OSError:
-            pass
@@ -75,11 +75,7 @@ def _clip_features_to_tensor(feats: torch.Tensor | object) -> torch.Tensor:
     raise TypeError(f"Cannot get embedding tensor from {type(feats).__name__}")
 
 
-def decode_base64_jpeg(data: str) -> Image.Image:
-    try:
-        raw = base64.b64decode(data, validate=True)
-    except (ValueError, binascii.Error) as e:
-        raise ValueError("invalid base64") from e
+def decode_image_bytes(raw: bytes) -> Image.Image:
     try:
         img = Image.open(BytesIO(raw))
         return img.convert("RGB")
@@ -87,6 +83,14 @@ def decode_base64_jpeg(data: str) -> Image.Image:
         raise ValueError("invalid image data") from e
 
 
+def decode_base64_jpeg(data: str) -> Image.Image:
+    try:
+        raw = base64.b64decode(data, validate=True)
+    except (ValueError, binascii.Error) as e:
+        raise ValueError("invalid base64") from e
+    return decode_image_bytes(raw)
+
+
 class ClipEmbeddingEngine:
     """Loads CLIP once; synchronous encode helpers (call from thread pool in async routes)."""
 
@@ -137,20 +141,24 @@ class ClipEmbeddingEngine:
         return _l2_normalize(feats)
 
     def embed_images(
-        self, frame_ids: Sequence[UUID], frame_b64: Sequence[str]
+        self, frame_ids: Sequence[UUID], frame_data: Sequence[str | bytes]
     ) -> List[Tuple[UUID, List[float]]]:
-        if len(frame_ids) != len(frame_b64):
-            raise ValueError("frame_ids and frame_b64 length mismatch")
+        """Embed encoded images: ``str`` items are base64, ``bytes`` items are raw files."""
+        if len(frame_ids) != len(frame_data):
+            raise ValueError("frame_ids and frame_data length mismatch")
 
         out: List[Tuple[UUID, List[float]]] = []
         bs = self._image_batch_size
         for start in range(0, len(frame_ids), bs):
             chunk_ids = frame_ids[start : start + bs]
-            chunk_b64 = frame_b64[start : start + bs]
+            chunk_data = frame_data[start : start + bs]
             chunk_imgs: List[Image.Image] = []
-            for i, raw in enumerate(chunk_b64):
+            for i, raw in enumerate(chunk_data):
                 try:
-                    chunk_imgs.append(decode_base64_jpeg(raw))
+                    if isinstance(raw, bytes):
+                        chunk_imgs.append(decode_image_bytes(raw))
+                    else:
+                        chunk_imgs.append(decode_base64_jpeg(raw))
                 except ValueError as e:
                     raise ValueError(f"frame at index {start + i}: {e}") from e
             vecs = self._encode_image_batch(chunk_imgs)
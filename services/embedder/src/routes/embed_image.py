@@ -1,12 +1,16 @@
 import asyncio
+from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
+from exports.schema.constants import SEARCH_IMAGE_MAX_BYTES
 from exports.schema.models import (
+    EmbedImageResponse,
     EmbedImagesRequest,
     EmbedImagesResponse,
     EmbeddingResult,
 )
 from exports.utils.logger import get_logger
+from exports.utils.vector_wire import vector_response
 
 from ..clip_service import ClipEmbeddingEngine
 
@@ -21,8 +25,10 @@ def _get_engine(request: Request) -> ClipEmbeddingEngine:
     return engine
 
 
-@router.post("/")
-async def embed_images(request: Request, body: EmbedImagesRequest) -> EmbedImagesResponse:
+@router.post("/", response_model=EmbedImagesResponse)
+async def embed_images(
+    request: Request, body: EmbedImagesRequest
+) -> EmbedImagesResponse | Response:
     if not body.frames:
         raise HTTPException(status_code=422, detail="frames must not be empty")
 
@@ -37,4 +43,23 @@ async def embed_images(request: Request, body: EmbedImagesRequest) -> EmbedImage
         raise HTTPException(status_code=400, detail=str(e)) from e
 
     embeddings = [EmbeddingResult(frame_id=fid, embedding=vec) for fid, vec in pairs]
-    return EmbedImagesResponse(embeddings=embeddings)
+    return vector_response(request, EmbedImagesResponse(embeddings=embeddings))
+
+
+@router.post("/raw", response_model=EmbedImageResponse)
+async def embed_raw_image(request: Request) -> EmbedImageResponse | Response:
+    """Embed one query image sent as the raw request body (no base64/JSON wrapping)."""
+    data = await request.body()
+    if not data:
+        raise HTTPException(status_code=422, detail="image body must not be empty")
+    if len(data) > SEARCH_IMAGE_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="image body is too large")
+
+    engine = _get_engine(request)
+    logger.info("embed/images/raw bytes=%s", len(data))
+    try:
+        pairs = await asyncio.to_thread(engine.embed_images, [UUID(int=0)], [data])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return vector_response(request, EmbedImageResponse(embedding=pairs[0][1]))
@@ -1,8 +1,9 @@
 import asyncio
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 from exports.schema.models import EmbedTextRequest, EmbedTextResponse
 from exports.utils.logger import get_logger
+from exports.utils.vector_wire import vector_response
 
 from ..clip_service import ClipEmbeddingEngine
 
@@ -17,8 +18,10 @@ def _get_engine(request: Request) -> ClipEmbeddingEngine:
     return engine
 
 
-@router.post("/")
-async def embed_text(request: Request, body: EmbedTextRequest) -> EmbedTextResponse:
+@router.post("/", response_model=EmbedTextResponse)
+async def embed_text(
+    request: Request, body: EmbedTextRequest
+) -> EmbedTextResponse | Response:
     text = (body.text or "").strip()
     if not text:
         raise HTTPException(status_code=422, detail="text must not be empty")
@@ -26,4 +29,4 @@ async def embed_text(request: Request, body: EmbedTextRequest) -> EmbedTextRespo
     engine = _get_engine(request)
     logger.info("embed/text chars=%s", len(text))
     embedding = await asyncio.to_thread(engine.embed_text, text)
-    return EmbedTextResponse(embedding=embedding)
+    return vector_response(request, EmbedTextResponse(embedding=embedding))
@@ -1,12 +1,13 @@
 import asyncio
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 from exports.schema.models import (
     EmbedTextBatchRequest,
     EmbedTextBatchResponse,
     TextEmbeddingResult,
 )
 from exports.utils.logger import get_logger
+from exports.utils.vector_wire import vector_response
 
 from ..clip_service import ClipEmbeddingEngine
 
@@ -24,7 +25,7 @@ def _get_engine(request: Request) -> ClipEmbeddingEngine:
 @router.post("/batch", response_model=EmbedTextBatchResponse)
 async def embed_text_batch(
     request: Request, body: EmbedTextBatchRequest
-) -> EmbedTextBatchResponse:
+) -> EmbedTextBatchResponse | Response:
     if not body.texts:
         return EmbedTextBatchResponse(embeddings=[])
 
@@ -45,4 +46,4 @@ async def embed_text_batch(
         TextEmbeddingResult(transcript_id=item.transcript_id, embedding=vector)
         for item, vector in zip(body.texts, vectors, strict=True)
     ]
-    return EmbedTextBatchResponse(embeddings=embeddings)
+    return vector_response(request, EmbedTextBatchResponse(embeddings=embeddings))
@@ -7,7 +7,7 @@ import pytest
 import torch
 from PIL import Image  # pyright: ignore[reportMissingImports]
 
-from src.clip_service import _l2_normalize, decode_base64_jpeg
+from src.clip_service import _l2_normalize, decode_base64_jpeg, decode_image_bytes
 
 
 def test_l2_normalize_unit_vectors() -> None:
@@ -35,3 +35,11 @@ def test_decode_invalid_image_bytes() -> None:
     b64 = base64.b64encode(b"not a jpeg").decode()
     with pytest.raises(ValueError, match="invalid image"):
         decode_base64_jpeg(b64)
+
+
+def test_decode_image_bytes_reads_raw_files() -> None:
+    buf = BytesIO()
+    Image.new("RGB", (4, 4), color=(10, 20, 30)).save(buf, format="PNG")
+    img = decode_image_bytes(buf.getvalue())
+    assert img.mode == "RGB"
+    assert img.size == (4, 4)
@@ -29,3 +29,11 @@ def test_embed_text_whitespace_422() -> None:
     client = _text_app()
     r = client.post("/embed/text/", json={"text": "   "})
     assert r.status_code == 422
+
+
+def test_embed_raw_image_empty_body_422() -> None:
+    client = _image_app()
+    r = client.post(
+        "/embed/images/raw", content=b"", headers={"content-type": "image/jpeg"}
+    )
+    assert r.status_code == 422
@@ -15,6 +15,7 @@ from exports.schema.constants import (
     FAISS_INDEX_PATH,
 )
 from exports.utils.logger import get_logger
+from exports.video_cache import VideoCache
 
 logger = get_logger()
 
@@ -66,7 +67,9 @@ async def lifespan(app: FastAPI):
 
             if _should_init_faiss():
                 base_dir = faiss_index_dir()
+                # Ingest-only mutex; searches rely on the registry's RW lock.
                 app.state.indexer_write_lock = asyncio.Lock()
+                app.state.faiss_compaction_task = None
                 faiss_store = FaissIndexRegistry(base_dir)
                 logger.info("Loading FAISS indexes from %s ...", faiss_store.base_dir)
                 await asyncio.to_thread(faiss_store.load)
@@ -84,6 +87,7 @@ async def lifespan(app: FastAPI):
                 logger.info("Connecting to MinIO...")
                 minio_client = await create_minio()
                 app.state.minio = MinioDB(minio_client)
+                app.state.video_cache = VideoCache()
                 logger.info("✅ MinIO connected.")
 
 
@@ -91,6 +95,9 @@ async def lifespan(app: FastAPI):
 
     finally:
         if faiss_store is not None:
+            compaction = getattr(app.state, "faiss_compaction_task", None)
+            if compaction is not None:
+                await compaction
             try:
                 logger.info("Saving FAISS index on shutdown...")
                 await asyncio.to_thread(faiss_store.save)
@@ -110,6 +117,7 @@ async def lifespan(app: FastAPI):
 
         if minio_client is not None:
             app.state.minio = None
+            app.state.video_cache = None
             logger.info("MinIO lifespan: MinIO released.")
 
         logger.info("✅ Cleanup complete.")
@@ -1,8 +1,21 @@
+import asyncio
+import io
+import os
 from urllib.parse import urljoin
-from exports.schema.constants import MINIO_BUCKET_NAME, MINIO_ENDPOINT
-from typing import BinaryIO
+from exports.schema.constants import (
+    MINIO_BUCKET_NAME,
+    MINIO_DOWNLOAD_CHUNK_BYTES,
+    MINIO_ENDPOINT,
+    MINIO_UPLOAD_CONCURRENCY,
+    MINIO_UPLOAD_RETRIES,
+    MINIO_UPLOAD_RETRY_BACKOFF,
+)
+from exports.utils.logger import get_logger
+from typing import AsyncIterator, BinaryIO, List, Sequence, Tuple
 from miniopy_async.api import Minio
 
+logger = get_logger()
+
 
 class MinioDB:
     def __init__(self, minio_client: Minio):
@@ -20,8 +33,60 @@ class MinioDB:
         )
 
         # Construct and return accessible URL
-        return urljoin(f"http://{MINIO_ENDPOINT}/{MINIO_BUCKET_NAME}/", object_name)
-    
+        return _object_url(object_name)
+
+    async def upload_many(
+        self,
+        objects: Sequence[Tuple[str, bytes]],
+        content_type: str = "application/octet-stream",
+        concurrency: int = MINIO_UPLOAD_CONCURRENCY,
+        retries: int = MINIO_UPLOAD_RETRIES,
+    ) -> List[str]:
+        """Upload ``(object_name, data)`` pairs concurrently; URLs come back in input order.
+
+        At most ``concurrency`` PUTs are in flight. A failed PUT is retried
+        ``retries`` times with exponential backoff; if an object still fails,
+        the remaining uploads are cancelled and the error is raised.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def put(object_name: str, data: bytes) -> str:
+            async with semaphore:
+                attempt = 0
+                while True:
+                    try:
+                        await self.client.put_object(
+                            bucket_name=MINIO_BUCKET_NAME,
+                            object_name=object_name,
+                            data=io.BytesIO(data),
+                            length=len(data),  # Known size: a single PUT, no multipart
+                            content_type=content_type
+                        )
+                        return _object_url(object_name)
+                    except Exception as exc:
+                        if attempt >= retries:
+                            raise
+                        delay = MINIO_UPLOAD_RETRY_BACKOFF * (2 ** attempt)
+                        attempt += 1
+                        logger.warning(
+                            "Upload of %s failed (%s); retry %s/%s in %.2fs",
+                            object_name,
+                            exc,
+                            attempt,
+                            retries,
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
+
+        tasks = [asyncio.ensure_future(put(name, data)) for name, data in objects]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def download_file(self, object_name: str) -> bytes:
         """Download a file from MinIO and return its raw bytes."""
         response = await self.client.get_object(
@@ -35,9 +100,65 @@ class MinioDB:
         finally:
             await response.release()  # Always release connection
 
+    async def iter_file(self, object_name: str, chunk_size: int = MINIO_DOWNLOAD_CHUNK_BYTES) -> AsyncIterator[bytes]:
+        """Stream an object as chunks of at most ``chunk_size`` bytes."""
+        response = await self.client.get_object(
+            bucket_name=MINIO_BUCKET_NAME,
+            object_name=object_name
+        )
+
+        try:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+        finally:
+            await response.release()  # Always release connection
+
+    async def download_to_path(self, object_name: str, path: str, chunk_size: int = MINIO_DOWNLOAD_CHUNK_BYTES) -> int:
+        """Stream an object into ``path`` (fsynced) and return its size in bytes.
+
+        At most two chunks are held in memory: each is written from a worker
+        thread while the next one is read, and that write is awaited before
+        the following one starts.
+        """
+        size = 0
+        pending: asyncio.Future | None = None
+        with open(path, "wb") as fh:
+            try:
+                async for chunk in self.iter_file(object_name, chunk_size):
+                    if pending is not None:
+                        await pending
+                    pending = asyncio.ensure_future(asyncio.to_thread(fh.write, chunk))
+                    size += len(chunk)
+                if pending is not None:
+                    await pending
+                    pending = None
+            finally:
+                # Never close the file under a write still running in a thread.
+                if pending is not None:
+                    await asyncio.gather(pending, return_exceptions=True)
+            await asyncio.to_thread(_flush_and_sync, fh)
+        return size
+
+    async def object_etag(self, object_name: str) -> str:
+        """ETag of an object (changes whenever its content does)."""
+        stat = await self.client.stat_object(
+            bucket_name=MINIO_BUCKET_NAME,
+            object_name=object_name
+        )
+        return stat.etag or ""
+
     async def delete_file(self, object_name: str) -> None:
         """Delete a file from the bucket."""
         await self.client.remove_object(
             bucket_name=MINIO_BUCKET_NAME,
             object_name=object_name
-        )
\ No newline at end of file
+        )
+
+
+def _object_url(object_name: str) -> str:
+    return urljoin(f"http://{MINIO_ENDPOINT}/{MINIO_BUCKET_NAME}/", object_name)
+
+
+def _flush_and_sync(fh: BinaryIO) -> None:
+    fh.flush()
+    os.fsync(fh.fileno())
@@ -6,7 +6,7 @@ Tables (see `dev_schema.sql`):
     embeddings     — one row per frame or transcript embedding; vectors live in FAISS
     transcripts    — Whisper transcript segments
     captions       — visual caption windows (uniform 1fps pass; not CLIP frames)
-    search_queries — query log (defined; not yet wired)
+    search_queries — query log (batched by the API's SearchQueryLog)
     incidents      — reliability-agent escalation rows
 
 All UUIDs are passed/stored as strings (`mode="json"` on dump). Enums
@@ -26,6 +26,7 @@ from exports.schema.models import (
     EmbeddingRow,
     FrameCreate,
     FrameRow,
+    FrameTimestampRow,
     IncidentCreate,
     IncidentRow,
     IncidentUpdate,
@@ -42,6 +43,10 @@ from exports.schema.models import (
 IdLike = Union[str, UUID]
 ModelT = TypeVar("ModelT", bound=BaseModel)
 
+# PostgREST caps rows per response (1000 on Supabase by default); multi-media
+# reads page through with ``range`` so results are never silently truncated.
+_PAGE_SIZE = 1000
+
 
 def _parse_row(model: type[ModelT], data: object) -> ModelT:
     """Build a row model from a Supabase JSON record (typed as object for Pyright)."""
@@ -113,6 +118,35 @@ class SupabaseDB:
         )
         return _parse_rows(FrameRow, response.data)
 
+    async def get_frame_timestamps_by_media_ids(
+        self, media_ids: List[IdLike]
+    ) -> List[FrameTimestampRow]:
+        """``(id, media_id, timestamp, frame_url)`` for every frame of ``media_ids``.
+
+        One query (paged) for all media instead of one per media, ordered by
+        ``media_id`` then ``timestamp`` so callers can bisect per media.
+        """
+        if not media_ids:
+            return []
+        ids = [_id(m) for m in media_ids]
+        rows: List[FrameTimestampRow] = []
+        start = 0
+        while True:
+            response = (
+                await self.client.table("frames")
+                .select("id, media_id, timestamp, frame_url")
+                .in_("media_id", ids)
+                .order("media_id")
+                .order("timestamp")
+                .range(start, start + _PAGE_SIZE - 1)
+                .execute()
+            )
+            page = _parse_rows(FrameTimestampRow, response.data)
+            rows.extend(page)
+            if len(page) < _PAGE_SIZE:
+                return rows
+            start += _PAGE_SIZE
+
     async def get_frame_by_id(self, frame_id: IdLike) -> Optional[FrameRow]:
         response = (
             await self.client.table("frames")
@@ -198,6 +232,17 @@ class SupabaseDB:
         )
         return _parse_rows(EmbeddingRow, response.data)
 
+    async def get_embeddings_by_caption_id(
+        self, caption_id: IdLike
+    ) -> List[EmbeddingRow]:
+        response = (
+            await self.client.table("embeddings")
+            .select("*")
+            .eq("caption_id", _id(caption_id))
+            .execute()
+        )
+        return _parse_rows(EmbeddingRow, response.data)
+
     async def insert_embedding(self, embedding: EmbeddingCreate) -> EmbeddingRow:
         payload = embedding.model_dump(mode="json", exclude_none=True)
         response = await self.client.table("embeddings").insert(payload).execute()
@@ -310,12 +355,24 @@ class SupabaseDB:
         response = await self.client.table("captions").insert(payload).execute()
         return _parse_rows(CaptionRow, response.data)
 
-    # ===================== Search Queries (model defined; not yet wired) =====================
+    # ===================== Search Queries =====================
     async def insert_search_query(self, query: SearchQueryCreate) -> SearchQueryRow:
         payload = query.model_dump(mode="json", exclude_none=True)
         response = await self.client.table("search_queries").insert(payload).execute()
         return _parse_row(SearchQueryRow, response.data[0])
 
+    async def insert_search_queries_batch(
+        self, queries: List[SearchQueryCreate]
+    ) -> None:
+        if not queries:
+            return
+        payload = [q.model_dump(mode="json", exclude_none=True) for q in queries]
+        await (
+            self.client.table("search_queries")
+            .insert(payload, returning="minimal")
+            .execute()
+        )
+
     # ===================== Incidents =====================
     async def get_incident_by_id(self, incident_id: IdLike) -> Optional[IncidentRow]:
         response = (
@@ -0,0 +1,282 @@
+"""Denormalized hit metadata kept next to each FAISS index, keyed by FAISS id.
+
+Lets the indexer answer searches pre-hydrated (media id, timestamps, row
+ids, preview frame, text snippet) so the API can skip the Supabase join
+chain. Vectors added without metadata simply have no row here and are
+hydrated from the database as before.
+
+In memory the rows are columns (packed UUID bytes, ``array('d')`` floats,
+string lists) indexed by FAISS id. On disk each add batch is one JSON line
+in ``<index>.meta.jsonl``; media fields shared by many rows live once per
+media in the registry's ``media.jsonl``. ``truncate`` and ``compact`` (run
+on every snapshot save) rewrite the file with one line per live row, so
+rows overwritten by re-applied batches do not pile up.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from exports.schema.constants import FAISS_META_TEXT_CHARS
+
+_NO_UUID = bytes(16)
+
+
+@dataclass(frozen=True)
+class HitMetadata:
+    media_id: UUID
+    row_id: UUID
+    timestamp: float
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    frame_id: Optional[UUID] = None
+    frame_url: Optional[str] = None
+    text: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    media_id: UUID
+    media_type: str
+    file_name: str
+    file_url: str
+
+
+class HitMetadataColumns:
+    """Append-mostly columnar rows for one index; row ``i`` is FAISS id ``i``."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        # Non-empty rows across all lines on disk (> live rows = compactable).
+        self._file_rows = 0
+        self._reset_columns()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def count(self) -> int:
+        return len(self._present)
+
+    def load(self) -> None:
+        """Rebuild the columns from disk, ignoring a torn last line."""
+        self._reset_columns()
+        self._file_rows = 0
+        if not os.path.exists(self._path):
+            return
+        valid = 0
+        with open(self._path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    self._put(int(record["start_id"]), record["rows"])
+                except (ValueError, KeyError, TypeError):
+                    break
+                valid += len(line)
+                self._file_rows += sum(row is not None for row in record["rows"])
+        if os.path.getsize(self._path) > valid:
+            with open(self._path, "r+b") as f:
+                f.truncate(valid)
+
+    def append(self, start_id: int, rows: Sequence[Optional[HitMetadata]]) -> None:
+        """Record rows for ids ``start_id..`` (``None`` = no metadata)."""
+        if not any(row is not None for row in rows):
+            return
+        encoded = [_encode_row(row) for row in rows]
+        line = json.dumps({"start_id": int(start_id), "rows": encoded}, separators=(",", ":"))
+        with open(self._path, "ab") as f:
+            f.write(line.encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._file_rows += sum(row is not None for row in encoded)
+        self._put(start_id, encoded)
+
+    def truncate(self, count: int) -> None:
+        """Forget rows at ids ``>= count`` (their vectors were never persisted)."""
+        if self.count <= count:
+            return
+        # Shrink ``_present`` first so searches stop seeing the dropped rows.
+        del self._present[count:]
+        del self._media_ids[count * 16 :]
+        del self._row_ids[count * 16 :]
+        del self._frame_ids[count * 16 :]
+        del self._timestamps[count:]
+        del self._start_times[count:]
+        del self._end_times[count:]
+        del self._frame_urls[count:]
+        del self._texts[count:]
+        self._rewrite()
+
+    def compact(self) -> None:
+        """Rewrite the file without rows that later batches overwrote."""
+        if self._file_rows > self._present.count(1):
+            self._rewrite()
+
+    def _rewrite(self) -> None:
+        """Atomically replace the file with one line per live row."""
+        tmp_path = self._path + ".tmp"
+        rows = 0
+        with open(tmp_path, "wb") as f:
+            for i in range(self.count):
+                row = self.get(i)
+                if row is None:
+                    continue
+                line = json.dumps(
+                    {"start_id": i, "rows": [_encode_row(row)]}, separators=(",", ":")
+                )
+                f.write(line.encode("utf-8") + b"\n")
+                rows += 1
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path)
+        self._file_rows = rows
+
+    def get(self, faiss_id: int) -> Optional[HitMetadata]:
+        if faiss_id < 0 or faiss_id >= self.count or not self._present[faiss_id]:
+            return None
+        return HitMetadata(
+            media_id=UUID(bytes=self._uuid_at(self._media_ids, faiss_id)),
+            row_id=UUID(bytes=self._uuid_at(self._row_ids, faiss_id)),
+            timestamp=self._timestamps[faiss_id],
+            start_time=_optional_float(self._start_times[faiss_id]),
+            end_time=_optional_float(self._end_times[faiss_id]),
+            frame_id=_optional_uuid(self._uuid_at(self._frame_ids, faiss_id)),
+            frame_url=self._frame_urls[faiss_id],
+            text=self._texts[faiss_id],
+        )
+
+    def get_many(self, faiss_ids: Iterable[int]) -> List[Optional[HitMetadata]]:
+        return [self.get(int(faiss_id)) for faiss_id in faiss_ids]
+
+    def _reset_columns(self) -> None:
+        self._present = bytearray()
+        self._media_ids = bytearray()
+        self._row_ids = bytearray()
+        self._frame_ids = bytearray()
+        self._timestamps = array("d")
+        self._start_times = array("d")
+        self._end_times = array("d")
+        self._frame_urls: List[Optional[str]] = []
+        self._texts: List[Optional[str]] = []
+
+    def _put(self, start_id: int, rows: list) -> None:
+        # Pad gaps (vectors added without metadata), then overwrite in place
+        # so re-applied batches are idempotent. ``get`` runs concurrently
+        # from searches without a lock, so ``_present`` is always written
+        # last: a row (and ``count``) only becomes visible once complete.
+        end = start_id + len(rows)
+        while self.count < end:
+            self._media_ids += _NO_UUID
+            self._row_ids += _NO_UUID
+            self._frame_ids += _NO_UUID
+            self._timestamps.append(math.nan)
+            self._start_times.append(math.nan)
+            self._end_times.append(math.nan)
+            self._frame_urls.append(None)
+            self._texts.append(None)
+            self._present.append(0)
+        for offset, row in enumerate(rows):
+            if row is None:
+                continue
+            i = start_id + offset
+            media_id, row_id, timestamp, start, end_, frame_id, frame_url, text = row
+            self._present[i] = 0  # hide the row while it is rewritten
+            self._media_ids[i * 16 : (i + 1) * 16] = UUID(media_id).bytes
+            self._row_ids[i * 16 : (i + 1) * 16] = UUID(row_id).bytes
+            self._frame_ids[i * 16 : (i + 1) * 16] = (
+                UUID(frame_id).bytes if frame_id else _NO_UUID
+            )
+            self._timestamps[i] = float(timestamp)
+            self._start_times[i] = math.nan if start is None else float(start)
+            self._end_times[i] = math.nan if end_ is None else float(end_)
+            self._frame_urls[i] = frame_url
+            self._texts[i] = text
+            self._present[i] = 1
+
+    @staticmethod
+    def _uuid_at(column: bytearray, i: int) -> bytes:
+        return bytes(column[i * 16 : (i + 1) * 16])
+
+
+class MediaInfoTable:
+    """``media_id -> MediaInfo`` shared by all modalities; last write wins."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._rows: dict[UUID, MediaInfo] = {}
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def load(self) -> None:
+        self._rows = {}
+        if not os.path.exists(self._path):
+            return
+        with open(self._path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    info = MediaInfo(
+                        media_id=UUID(record["media_id"]),
+                        media_type=record["media_type"],
+                        file_name=record["file_name"],
+                        file_url=record["file_url"],
+                    )
+                except (ValueError, KeyError, TypeError):
+                    break
+                self._rows[info.media_id] = info
+
+    def put(self, info: MediaInfo) -> None:
+        if self._rows.get(info.media_id) == info:
+            return
+        line = json.dumps(
+            {
+                "media_id": str(info.media_id),
+                "media_type": info.media_type,
+                "file_name": info.file_name,
+                "file_url": info.file_url,
+            },
+            separators=(",", ":"),
+        )
+        with open(self._path, "ab") as f:
+            f.write(line.encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._rows[info.media_id] = info
+
+    def get(self, media_id: UUID) -> Optional[MediaInfo]:
+        return self._rows.get(media_id)
+
+
+def _encode_row(row: Optional[HitMetadata]) -> Optional[list]:
+    if row is None:
+        return None
+    text = row.text
+    if text is not None and len(text) > FAISS_META_TEXT_CHARS:
+        text = text[:FAISS_META_TEXT_CHARS]
+    return [
+        str(row.media_id),
+        str(row.row_id),
+        row.timestamp,
+        row.start_time,
+        row.end_time,
+        str(row.frame_id) if row.frame_id is not None else None,
+        row.frame_url,
+        text,
+    ]
+
+
+def _optional_float(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _optional_uuid(value: bytes) -> Optional[UUID]:
+    return None if value == _NO_UUID else UUID(bytes=value)
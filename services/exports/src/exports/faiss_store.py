@@ -1,14 +1,46 @@
-"""In-process FAISS IndexFlatIP with disk persistence."""
+"""In-process FAISS indexes (flat, HNSW, IVF or compressed) with disk persistence."""
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from typing import List, Tuple
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from typing import List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
 
 import faiss
 import numpy as np
 
-from exports.schema.constants import CLIP_DIMENSION, FAISS_INDEX_PATH, VectorType
+from exports.schema.constants import (
+    CLIP_DIMENSION,
+    FAISS_CAPTION_INDEX_TYPE,
+    FAISS_HNSW_EF_CONSTRUCTION,
+    FAISS_HNSW_EF_SEARCH,
+    FAISS_HNSW_M,
+    FAISS_IMAGE_INDEX_TYPE,
+    FAISS_INDEX_PATH,
+    FAISS_IVF_NLIST,
+    FAISS_IVF_NPROBE,
+    FAISS_IVF_TRAIN_POINTS_PER_LIST,
+    FAISS_MMAP_LOAD,
+    FAISS_PQ_M,
+    FAISS_PQ_NBITS,
+    FAISS_RERANK_FACTOR,
+    FAISS_SQ8_MIN_TRAIN,
+    FAISS_TEXT_INDEX_TYPE,
+    FAISS_WAL_COMPACT_BYTES,
+    VectorType,
+)
+from exports.faiss_meta import HitMetadata, HitMetadataColumns, MediaInfo, MediaInfoTable
+from exports.faiss_wal import VectorLog
+from exports.utils.logger import get_logger
+from exports.utils.rwlock import ReadWriteLock
+
+logger = get_logger()
 
 
 _INDEX_FILENAMES: dict[VectorType, str] = {
@@ -17,6 +49,147 @@ _INDEX_FILENAMES: dict[VectorType, str] = {
     VectorType.CAPTION: "caption.index",
 }
 
+_INDEX_TYPES: dict[VectorType, str] = {
+    VectorType.IMAGE: FAISS_IMAGE_INDEX_TYPE,
+    VectorType.TEXT: FAISS_TEXT_INDEX_TYPE,
+    VectorType.CAPTION: FAISS_CAPTION_INDEX_TYPE,
+}
+
+
+_RAW_VECTORS_SUFFIX = ".vectors"
+_LOG_SUFFIX = ".wal"
+_MANIFEST_SUFFIX = ".manifest.json"
+_META_SUFFIX = ".meta.jsonl"
+_MEDIA_FILENAME = "media.jsonl"
+_SNAPSHOT_WRITE_CHUNK = 1 << 20
+# Map flat codes and inverted lists straight from the file (read-only views).
+_MMAP_IO_FLAGS = (
+    getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+)
+
+
+class IndexKind(str, Enum):
+    """FAISS index structure backing one modality."""
+    FLAT = "flat"
+    HNSW = "hnsw"
+    IVF_FLAT = "ivf_flat"
+    IVF_PQ = "ivf_pq"
+    SQ8 = "sq8"
+    SQ_FP16 = "sq_fp16"
+
+    @property
+    def is_compressed(self) -> bool:
+        """Lossy codes; exact vectors live in the raw sidecar file instead."""
+        return self in (IndexKind.IVF_PQ, IndexKind.SQ8, IndexKind.SQ_FP16)
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Target index structure and build parameters for one store."""
+
+    kind: IndexKind = IndexKind.FLAT
+    hnsw_m: int = FAISS_HNSW_M
+    hnsw_ef_construction: int = FAISS_HNSW_EF_CONSTRUCTION
+    ivf_nlist: int = FAISS_IVF_NLIST
+    ivf_train_points_per_list: int = FAISS_IVF_TRAIN_POINTS_PER_LIST
+    pq_m: int = FAISS_PQ_M
+    pq_nbits: int = FAISS_PQ_NBITS
+    sq8_min_train: int = FAISS_SQ8_MIN_TRAIN
+
+    @property
+    def factory_string(self) -> str:
+        """``faiss.index_factory`` description of ``kind``."""
+        if self.kind == IndexKind.HNSW:
+            return f"HNSW{self.hnsw_m},Flat"
+        if self.kind == IndexKind.IVF_FLAT:
+            return f"IVF{self.ivf_nlist},Flat"
+        if self.kind == IndexKind.IVF_PQ:
+            return f"IVF{self.ivf_nlist},PQ{self.pq_m}x{self.pq_nbits}"
+        if self.kind == IndexKind.SQ8:
+            return "SQ8"
+        if self.kind == IndexKind.SQ_FP16:
+            return "SQfp16"
+        return "Flat"
+
+    @property
+    def min_train_size(self) -> int:
+        """Vectors required before ``kind`` can be trained (0 = no training)."""
+        points = max(1, self.ivf_train_points_per_list)
+        if self.kind == IndexKind.IVF_FLAT:
+            return max(1, self.ivf_nlist) * points
+        if self.kind == IndexKind.IVF_PQ:
+            return max(max(1, self.ivf_nlist), 1 << self.pq_nbits) * points
+        if self.kind == IndexKind.SQ8:
+            return max(1, self.sq8_min_train)
+        return 0
+
+
+@dataclass(frozen=True)
+class SearchParams:
+    """Per-request recall/latency knobs; ``None`` uses the configured default."""
+
+    nprobe: Optional[int] = None
+    ef_search: Optional[int] = None
+    rerank_factor: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class IndexSnapshot:
+    """A serialized copy of a live index, taken under the read lock.
+
+    Writing it to disk (``FaissVectorStore.write_snapshot``) needs no lock.
+    """
+
+    data: np.ndarray
+    ntotal: int
+    dimension: int
+    index_type: str
+
+
+@dataclass(frozen=True)
+class IndexManifest:
+    """Small JSON summary written next to each snapshot on save.
+
+    Stats and drift checks read this instead of deserializing the index.
+    """
+
+    ntotal: int
+    dimension: int
+    index_type: str
+    sha256: str
+    saved_at: str
+
+    @classmethod
+    def read(cls, path: str) -> Optional["IndexManifest"]:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def write(self, path: str) -> None:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+def index_spec_for(vector_type: VectorType) -> IndexSpec:
+    """Build the configured ``IndexSpec`` for a modality from env constants."""
+    raw = (_INDEX_TYPES.get(vector_type) or IndexKind.FLAT.value).strip().lower()
+    try:
+        kind = IndexKind(raw)
+    except ValueError:
+        raise ValueError(
+            f"Unsupported FAISS index type {raw!r} for {vector_type.value}; "
+            f"expected one of {[k.value for k in IndexKind]}"
+        ) from None
+    return IndexSpec(kind=kind)
+
 
 def faiss_index_dir() -> str:
     """Directory holding per-modality FAISS index files."""
@@ -30,35 +203,240 @@ def faiss_index_dir() -> str:
 
 
 class FaissVectorStore:
-    """Exact inner-product search on L2-normalized CLIP vectors."""
+    """Inner-product search on L2-normalized CLIP vectors.
+
+    FAISS ids are always insertion positions (``0 .. ntotal-1``), whatever
+    the index structure, so rebuilding into another kind keeps every
+    ``embeddings.faiss_index_id`` valid.
+
+    Compressed kinds also append every vector to ``<path>.vectors`` (raw
+    float32 rows in id order). The file is memory-mapped, not loaded, and
+    serves exact re-ranking and lossless rebuilds. ``append_log`` fsyncs
+    it ahead of the log; if it still ends up short of ``ntotal`` (a
+    sidecar from before that), re-ranking is off and ``raw_rows_missing``
+    reports the gap. A rebuild refills it only from an uncompressed index;
+    otherwise the vectors have to be re-ingested.
 
-    def __init__(self, path: str, *, dimension: int = CLIP_DIMENSION) -> None:
+    Durability comes from ``<path>.wal`` (see ``exports.faiss_wal``):
+    ``append_log`` fsyncs each add batch, ``save`` writes a full snapshot
+    and resets the log, and ``load`` replays the log onto the snapshot.
+
+    ``<path>.meta.jsonl`` holds optional per-id hit metadata (see
+    ``exports.faiss_meta``) for pre-hydrated search responses.
+
+    With ``mmap=True`` the snapshot is mapped read-only (FAISS cannot add
+    to a mapped index). The first ``add`` copies it into the heap, and a
+    non-empty log at ``load`` reads it into the heap instead, so mapping
+    only pays off for read-only replicas.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        dimension: int = CLIP_DIMENSION,
+        spec: IndexSpec | None = None,
+        mmap: bool = FAISS_MMAP_LOAD,
+    ) -> None:
         self._path = path
         self._dimension = dimension
+        self._spec = spec or IndexSpec()
+        self._mmap = mmap
         self._index: faiss.Index | None = None
+        self._mapped = False
+        self._raw = _RawVectorFile(path + _RAW_VECTORS_SUFFIX, dimension)
+        self._log = VectorLog(path + _LOG_SUFFIX, dimension)
+        self._meta = HitMetadataColumns(path + _META_SUFFIX)
 
     @property
     def path(self) -> str:
         return self._path
 
+    @property
+    def spec(self) -> IndexSpec:
+        return self._spec
+
+    @property
+    def kind(self) -> IndexKind:
+        """Structure of the live index (may lag ``spec`` until IVF is trained)."""
+        if self._index is None:
+            return IndexKind.FLAT
+        return _index_kind(self._index)
+
     @property
     def ntotal(self) -> int:
         if self._index is None:
             return 0
         return int(self._index.ntotal)
 
+    @property
+    def manifest_path(self) -> str:
+        return self._path + _MANIFEST_SUFFIX
+
+    def manifest(self) -> IndexManifest | None:
+        """Manifest of the last saved snapshot (None if never saved)."""
+        return IndexManifest.read(self.manifest_path)
+
+    @property
+    def is_mapped(self) -> bool:
+        """True while the live index is a read-only view of the snapshot file."""
+        return self._mapped
+
+    @property
+    def log(self) -> VectorLog:
+        return self._log
+
+    @property
+    def metadata(self) -> HitMetadataColumns:
+        return self._meta
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._log.size_bytes >= FAISS_WAL_COMPACT_BYTES
+
+    @property
+    def raw_rows_missing(self) -> int:
+        """Ids without a raw row (re-ranking is off while this is non-zero).
+
+        Always 0 for kinds that keep no raw sidecar.
+        """
+        if not self._spec.kind.is_compressed:
+            return 0
+        return max(0, self.ntotal - self._raw.count)
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """True when the live index should be rebuilt into ``spec.kind``."""
+        if self._index is None or self.kind == self._spec.kind:
+            return False
+        return self.ntotal >= self._spec.min_train_size
+
     def load(self) -> None:
         _ensure_parent_dir(self._path)
+        self._mapped = False
         if os.path.exists(self._path):
-            self._index = faiss.read_index(self._path)
+            if self._mmap:
+                self._index = faiss.read_index(self._path, _MMAP_IO_FLAGS)
+                self._mapped = True
+            else:
+                self._index = faiss.read_index(self._path)
             if int(self._index.d) != self._dimension:
                 raise RuntimeError(
                     f"FAISS index at {self._path} has dimension {self._index.d}, "
                     f"expected CLIP_DIMENSION={self._dimension}. "
                     "Remove the index file or align CLIP_DIMENSION."
                 )
+            _enable_reconstruct(self._index)
+            if not os.path.exists(self.manifest_path):
+                # Snapshot predates manifests; describe it once so stats can skip it.
+                self._write_manifest(
+                    int(self._index.ntotal), int(self._index.d), self.kind.value
+                )
+        else:
+            self._index = self._empty_index()
+        # Raw rows past the snapshot are re-appended by the log replay below.
+        self._raw.truncate(self.ntotal)
+        self._log.repair()
+        records = self._log.replay_from(self.ntotal)
+        if records and self._mapped:
+            # Replaying would copy the mapped index anyway; read it owned.
+            self._index = faiss.read_index(self._path)
+            _enable_reconstruct(self._index)
+            self._mapped = False
+        for record in records:
+            self.add(record.vectors)
+        if self.raw_rows_missing:
+            logger.warning(
+                "Raw vector sidecar %s holds %s of %s rows; exact re-ranking is "
+                "off for this index until %s",
+                self._raw.path,
+                self._raw.count,
+                self.ntotal,
+                (
+                    "the vectors are re-ingested (the index only keeps "
+                    "approximate codes)"
+                    if self.kind.is_compressed
+                    else "it is rebuilt from the exact vectors"
+                ),
+            )
+        self._meta.load()
+        self._meta.truncate(self.ntotal)
+
+    def rebuild(self) -> None:
+        """Re-create the index as ``spec.kind`` from the stored vectors.
+
+        Vectors are re-added in id order, so FAISS ids are unchanged. The
+        registry runs the same steps (``rebuild_source``, ``build_index``,
+        ``install_index``) with only the final swap under its write lock.
+        """
+        vectors = self.rebuild_source()
+        index = self.build_index(vectors)
+        self.refill_raw((vectors,))
+        self.install_index(index)
+
+    def rebuild_source(self) -> np.ndarray:
+        """Copy of every stored vector in id order (reads only)."""
+        if self._index is None:
+            raise RuntimeError("FAISS index is not loaded.")
+        return self._all_vectors()
+
+    def build_index(self, vectors: np.ndarray) -> faiss.Index:
+        """A new ``spec.kind`` index holding ``vectors``; the store is untouched."""
+        if self._spec.min_train_size:
+            if int(vectors.shape[0]) < self._spec.min_train_size:
+                raise ValueError(
+                    f"{self._spec.kind.value} index needs at least "
+                    f"{self._spec.min_train_size} vectors to train, "
+                    f"have {vectors.shape[0]}"
+                )
+            index = self._trained_index(vectors)
         else:
-            self._index = faiss.IndexFlatIP(self._dimension)
+            index = self._empty_index()
+        if vectors.shape[0]:
+            index.add(vectors)
+        return index
+
+    def vectors_since(self, start: int) -> np.ndarray:
+        """Stored vectors for ids ``start .. ntotal-1`` (reads only)."""
+        if self._index is None:
+            raise RuntimeError("FAISS index is not loaded.")
+        return self._vectors_range(start, self.ntotal)
+
+    def refill_raw(self, parts: Sequence[np.ndarray]) -> None:
+        """Rewrite a short raw sidecar from ``parts`` (together: every id, in order).
+
+        Call before ``install_index``: ``parts`` are only exact while the
+        live index is uncompressed. Decoded codes would pass for raw rows
+        and turn re-ranking back on, so a compressed source leaves the
+        sidecar short.
+        """
+        total = sum(int(part.shape[0]) for part in parts)
+        if not self._spec.kind.is_compressed or self._raw.count >= total:
+            return
+        if self.kind.is_compressed:
+            logger.warning(
+                "Raw vector sidecar %s holds %s of %s rows and the %s index only "
+                "keeps approximate codes; re-ingest the vectors to restore exact "
+                "re-ranking",
+                self._raw.path,
+                self._raw.count,
+                total,
+                self.kind.value,
+            )
+            return
+        self._raw.truncate(0)
+        for part in parts:
+            if part.shape[0]:
+                self._raw.append(part)
+
+    def install_index(self, index: faiss.Index) -> None:
+        """Swap in a rebuilt ``index`` that already holds every current id."""
+        if int(index.ntotal) != self.ntotal:
+            raise RuntimeError(
+                f"Rebuilt index holds {index.ntotal} vectors, store has {self.ntotal}"
+            )
+        self._index = index
+        self._mapped = False
 
     def add(self, vectors: np.ndarray) -> List[int]:
         if self._index is None:
@@ -69,54 +447,337 @@ class FaissVectorStore:
             )
         if vectors.dtype != np.float32:
             vectors = vectors.astype(np.float32, copy=False)
+        if self._mapped:
+            self._unmap()
         start = int(self._index.ntotal)
         self._index.add(vectors)
+        if self._spec.kind.is_compressed and self._raw.count == start:
+            self._raw.append(vectors)
         n = int(vectors.shape[0])
         return list[int](range(start, start + n))
 
-    def search(self, query: np.ndarray, top_k: int) -> List[Tuple[int, float]]:
-        if self._index is None:
-            raise RuntimeError("FAISS index is not loaded.")
-        if int(self._index.ntotal) == 0:
-            return []
-        if top_k <= 0:
-            return []
+    def search(
+        self,
+        query: np.ndarray,
+        top_k: int,
+        params: SearchParams | None = None,
+    ) -> List[Tuple[int, float]]:
         if query.ndim == 1:
             query = query.reshape(1, -1)
-        if query.shape[1] != self._dimension:
+        if query.shape[0] != 1 or query.shape[1] != self._dimension:
             raise ValueError(
                 f"Expected query shape (1, {self._dimension}) or ({self._dimension},), "
                 f"got {query.shape}"
             )
-        q = query.astype(np.float32, copy=False)
+        return self.search_batch(query, top_k, params)[0]
+
+    def search_batch(
+        self,
+        queries: np.ndarray,
+        top_k: int,
+        params: SearchParams | None = None,
+    ) -> List[List[Tuple[int, float]]]:
+        """One ``index.search`` over an (n, d) query matrix; one hit list per row."""
+        if self._index is None:
+            raise RuntimeError("FAISS index is not loaded.")
+        if queries.ndim != 2 or queries.shape[1] != self._dimension:
+            raise ValueError(
+                f"Expected queries shape (n, {self._dimension}), got {queries.shape}"
+            )
+        n_queries = int(queries.shape[0])
+        if int(self._index.ntotal) == 0 or top_k <= 0 or n_queries == 0:
+            return [[] for _ in range(n_queries)]
+        q = queries.astype(np.float32, copy=False)
         k = min(int(top_k), int(self._index.ntotal))
-        scores, indices = self._index.search(q, k)
-        out: List[Tuple[int, float]] = []
-        for idx, score in zip(indices[0], scores[0], strict=True):
-            if int(idx) < 0:
-                continue
-            out.append((int(idx), float(score)))
-        return out
+        rerank_factor = self._rerank_factor(params)
+        fetch_k = min(k * rerank_factor, int(self._index.ntotal))
+        faiss_params = self._faiss_search_params(params, fetch_k)
+        if faiss_params is None:
+            scores, indices = self._index.search(q, fetch_k)
+        else:
+            scores, indices = self._index.search(q, fetch_k, params=faiss_params)
+        results: List[List[Tuple[int, float]]] = []
+        for row in range(n_queries):
+            out: List[Tuple[int, float]] = []
+            for idx, score in zip(indices[row], scores[row], strict=True):
+                if int(idx) < 0:
+                    continue
+                out.append((int(idx), float(score)))
+            if rerank_factor > 1:
+                out = self._rerank_exact(q[row], out)
+            results.append(out[:k])
+        return results
 
-    def save(self) -> None:
+    def reconstruct(self, faiss_id: int) -> np.ndarray:
+        """The stored vector for ``faiss_id`` (exact raw row when one is kept)."""
         if self._index is None:
-            return
+            raise RuntimeError("FAISS index is not loaded.")
+        if not 0 <= faiss_id < int(self._index.ntotal):
+            raise ValueError(
+                f"faiss_index_id {faiss_id} is out of range for {self.ntotal} vectors"
+            )
+        # Compressed codes only decode approximately; prefer the raw rows.
+        if self._raw.count > faiss_id:
+            return self._raw.read_rows(np.asarray([faiss_id], dtype=np.int64))[0]
+        return self._index.reconstruct(int(faiss_id))
+
+    def append_log(self, start_id: int, vectors: np.ndarray) -> None:
+        """Durably record an add batch whose first FAISS id is ``start_id``.
+
+        Compressed kinds also fsync the batch to the raw sidecar first, so
+        it can never fall behind the log (``add`` then skips its append).
+        """
+        _ensure_parent_dir(self._path)
+        if self._spec.kind.is_compressed and self._raw.count == start_id:
+            self._raw.append(vectors)
+        try:
+            self._log.append(start_id, vectors)
+        except BaseException:
+            self._raw.truncate(start_id)
+            raise
+
+    def undo_append_log(self, start_id: int, log_size: int) -> None:
+        """Drop a batch recorded by ``append_log`` whose in-memory add failed."""
+        self._log.truncate(log_size)
+        self._raw.truncate(start_id)
+
+    def append_metadata(
+        self, start_id: int, rows: Sequence[Optional[HitMetadata]]
+    ) -> None:
+        """Durably record hit metadata for ids ``start_id..``."""
         _ensure_parent_dir(self._path)
-        faiss.write_index(self._index, self._path)
+        self._meta.append(start_id, rows)
+
+    def save(self) -> None:
+        """Write a full snapshot atomically, then drop the now-redundant log."""
+        snapshot = self.serialize()
+        if snapshot is not None:
+            self.write_snapshot(snapshot)
+
+    def serialize(self) -> IndexSnapshot | None:
+        """In-memory copy of the index for ``write_snapshot`` (no disk I/O).
+
+        ``None`` when there is nothing to write: not loaded, or still mapped
+        (the on-disk snapshot byte for byte).
+        """
+        if self._index is None or self._mapped:
+            return None
+        return IndexSnapshot(
+            data=faiss.serialize_index(self._index),
+            ntotal=int(self._index.ntotal),
+            dimension=int(self._index.d),
+            index_type=self.kind.value,
+        )
+
+    def write_snapshot(self, snapshot: IndexSnapshot) -> None:
+        """Atomically replace the snapshot file, then reset the log and
+        compact the hit-metadata sidecar.
+
+        The caller must keep log appends out until this returns, or records
+        past ``snapshot.ntotal`` would be dropped with the log.
+        """
+        _ensure_parent_dir(self._path)
+        tmp_path = self._path + ".tmp"
+        # Hash the bytes on their way out rather than re-reading the file.
+        digest = hashlib.sha256()
+        data = memoryview(snapshot.data).cast("B")
+        with open(tmp_path, "wb") as f:
+            for start in range(0, len(data), _SNAPSHOT_WRITE_CHUNK):
+                chunk = data[start : start + _SNAPSHOT_WRITE_CHUNK]
+                digest.update(chunk)
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path)
+        self._write_manifest(
+            snapshot.ntotal,
+            snapshot.dimension,
+            snapshot.index_type,
+            sha256=digest.hexdigest(),
+        )
+        self._log.reset()
+        self._meta.compact()
+
+    def _write_manifest(
+        self,
+        ntotal: int,
+        dimension: int,
+        index_type: str,
+        *,
+        sha256: str | None = None,
+    ) -> None:
+        """Describe the snapshot file as it is now on disk.
+
+        ``sha256`` is the digest of its bytes when the caller already has
+        it; otherwise the file is read back to compute it.
+        """
+        if sha256 is None:
+            digest = hashlib.sha256()
+            with open(self._path, "rb") as f:
+                for chunk in iter(lambda: f.read(_SNAPSHOT_WRITE_CHUNK), b""):
+                    digest.update(chunk)
+            sha256 = digest.hexdigest()
+        IndexManifest(
+            ntotal=ntotal,
+            dimension=dimension,
+            index_type=index_type,
+            sha256=sha256,
+            saved_at=datetime.fromtimestamp(
+                os.path.getmtime(self._path), tz=timezone.utc
+            ).isoformat(),
+        ).write(self.manifest_path)
+
+    def unmapped_copy(self) -> faiss.Index:
+        """A heap-owned copy of the live index for ``install_index`` (reads only)."""
+        if self._index is None:
+            raise RuntimeError("FAISS index is not loaded.")
+        # Cloning keeps the mapped views; a serialize round trip owns its memory.
+        index = faiss.deserialize_index(faiss.serialize_index(self._index))
+        _enable_reconstruct(index)
+        return index
+
+    def _unmap(self) -> None:
+        self.install_index(self.unmapped_copy())
+
+    def _empty_index(self) -> faiss.Index:
+        # Trainable kinds start flat and are rebuilt once enough vectors exist.
+        if self._spec.min_train_size:
+            return faiss.IndexFlatIP(self._dimension)
+        index = faiss.index_factory(
+            self._dimension, self._spec.factory_string, faiss.METRIC_INNER_PRODUCT
+        )
+        if self._spec.kind == IndexKind.HNSW:
+            index.hnsw.efConstruction = self._spec.hnsw_ef_construction
+        return index
+
+    def _trained_index(self, vectors: np.ndarray) -> faiss.Index:
+        # index_factory owns the coarse quantizer, unlike IndexIVFFlat(quantizer, …).
+        index = faiss.index_factory(
+            self._dimension, self._spec.factory_string, faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(vectors)
+        _enable_reconstruct(index)
+        return index
+
+    def _all_vectors(self) -> np.ndarray:
+        assert self._index is not None
+        return self._vectors_range(0, int(self._index.ntotal))
+
+    def _vectors_range(self, start: int, stop: int) -> np.ndarray:
+        assert self._index is not None
+        if stop <= start:
+            return np.empty((0, self._dimension), dtype=np.float32)
+        # Compressed codes only decode approximately; prefer the raw rows.
+        if self._raw.count >= stop:
+            return self._raw.read_range(start, stop)
+        return self._index.reconstruct_n(start, stop - start)
+
+    def _rerank_factor(self, params: SearchParams | None) -> int:
+        if not self.kind.is_compressed:
+            return 1
+        factor = FAISS_RERANK_FACTOR
+        if params is not None and params.rerank_factor is not None:
+            factor = params.rerank_factor
+        if factor <= 1 or self._raw.count < self.ntotal:
+            return 1
+        return int(factor)
+
+    def _rerank_exact(
+        self, query: np.ndarray, candidates: List[Tuple[int, float]]
+    ) -> List[Tuple[int, float]]:
+        """Re-score compressed-index candidates against the raw vectors."""
+        if not candidates:
+            return candidates
+        ids = np.asarray([faiss_id for faiss_id, _ in candidates], dtype=np.int64)
+        exact = self._raw.read_rows(ids) @ query
+        order = np.argsort(-exact, kind="stable")
+        return [(int(ids[i]), float(exact[i])) for i in order]
+
+    def _faiss_search_params(
+        self, params: SearchParams | None, k: int
+    ) -> faiss.SearchParameters | None:
+        kind = self.kind
+        if kind in (IndexKind.IVF_FLAT, IndexKind.IVF_PQ):
+            nprobe = FAISS_IVF_NPROBE
+            if params is not None and params.nprobe is not None:
+                nprobe = params.nprobe
+            return faiss.SearchParametersIVF(nprobe=max(1, int(nprobe)))
+        if kind == IndexKind.HNSW:
+            ef_search = FAISS_HNSW_EF_SEARCH
+            if params is not None and params.ef_search is not None:
+                ef_search = params.ef_search
+            # efSearch below k would silently truncate the result list.
+            return faiss.SearchParametersHNSW(efSearch=max(int(ef_search), k))
+        return None
 
 
 class FaissIndexRegistry:
-    """One FAISS index per vector type (image, transcript, caption)."""
+    """One FAISS index per vector type (image, transcript, caption).
 
-    def __init__(self, base_dir: str, *, dimension: int = CLIP_DIMENSION) -> None:
+    ``load`` and ``add`` also rebuild a store into its configured kind once
+    that is possible (HNSW / fp16 immediately, IVF / PQ / SQ8 once enough
+    vectors exist to train on).
+
+    The registry is the concurrency boundary: searches and the in-memory
+    serialize step of ``save`` share a read lock and run in parallel, while
+    the in-memory part of ``add`` and ``load`` take it exclusively. Snapshot
+    files are written and fsynced after the lock is released.
+    ``FaissVectorStore`` itself is not locked.
+
+    Rebuilds (training IVF / PQ / SQ8 and re-adding every vector) run
+    outside the RW lock on a copy of the stored vectors, so searches keep
+    going. Rows added meanwhile are caught up under the store's log lock
+    and only the swap to the new index is exclusive.
+
+    ``add`` is write-ahead: the batch is fsynced to the store's vector log
+    before the in-memory add (outside the RW lock, so searches never wait
+    on disk). A failed append leaves the index untouched, and a failed
+    in-memory add cuts its record back off the log, so the log never skips
+    or invents ids. ``save`` / ``compact`` fold the log into a full
+    snapshot; a per-store log lock keeps them ordered with ``add``.
+
+    Hit metadata passed to ``add`` is appended after the vector log, so a
+    search can briefly see a new id before its metadata; callers treat a
+    missing row as "hydrate from the database".
+
+    ``generation`` grows by the number of vectors each ``add`` made durable
+    (it starts at ``ntotal`` on ``load``), so callers can key result caches
+    on it: it changes exactly when new vectors land and survives restarts.
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        *,
+        dimension: int = CLIP_DIMENSION,
+        specs: Mapping[VectorType, IndexSpec] | None = None,
+        mmap: bool = FAISS_MMAP_LOAD,
+    ) -> None:
         self._base_dir = base_dir
         self._stores: dict[VectorType, FaissVectorStore] = {
             vector_type: FaissVectorStore(
                 os.path.join(base_dir, filename),
                 dimension=dimension,
+                spec=(
+                    specs[vector_type]
+                    if specs is not None and vector_type in specs
+                    else index_spec_for(vector_type)
+                ),
+                mmap=mmap,
             )
             for vector_type, filename in _INDEX_FILENAMES.items()
         }
+        self._lock = ReadWriteLock()
+        self._log_locks: dict[VectorType, threading.Lock] = {
+            vector_type: threading.Lock() for vector_type in self._stores
+        }
+        self._rebuild_locks: dict[VectorType, threading.Lock] = {
+            vector_type: threading.Lock() for vector_type in self._stores
+        }
+        self._media = MediaInfoTable(os.path.join(base_dir, _MEDIA_FILENAME))
+        self._media_lock = threading.Lock()
+        self._generation = 0
+        self._generation_lock = threading.Lock()
 
     @property
     def base_dir(self) -> str:
@@ -129,34 +790,289 @@ class FaissIndexRegistry:
     def ntotal(self) -> int:
         return sum(store.ntotal for store in self._stores.values())
 
+    @property
+    def generation(self) -> int:
+        return self._generation
+
     def load(self) -> None:
         os.makedirs(self._base_dir, exist_ok=True)
-        for store in self._stores.values():
-            store.load()
+        with self._lock.write():
+            self._media.load()
+            for store in self._stores.values():
+                store.load()
+            with self._generation_lock:
+                self._generation = self.ntotal
+        for vector_type in self._stores:
+            self._rebuild(vector_type, force=False)
+
+    @property
+    def needs_compaction(self) -> bool:
+        return any(store.needs_compaction for store in self._stores.values())
 
     def save(self) -> None:
-        for store in self._stores.values():
-            store.save()
+        """Snapshot every store and reset its log (shutdown / explicit flush)."""
+        for vector_type in self._stores:
+            self._snapshot(vector_type)
+
+    def compact(self) -> None:
+        """Snapshot only the stores whose log outgrew FAISS_WAL_COMPACT_BYTES."""
+        for vector_type, store in self._stores.items():
+            if store.needs_compaction:
+                self._snapshot(vector_type)
+
+    def _snapshot(self, vector_type: VectorType) -> None:
+        # The log lock (same order as ``add``) is held throughout so no batch
+        # lands in the log between the snapshot and the reset. The RW lock
+        # only covers the in-memory serialize: a pending ``add`` (writer-
+        # preferring) would otherwise hold up every search until the file
+        # write and fsync finished.
+        store = self._stores[vector_type]
+        with self._log_locks[vector_type]:
+            with self._lock.read():
+                snapshot = store.serialize()
+            if snapshot is not None:
+                store.write_snapshot(snapshot)
+
+    def rebuild(self, vector_type: VectorType) -> None:
+        """Force a rebuild of one modality into its configured index kind."""
+        self._rebuild(vector_type, force=True)
+
+    def _rebuild(self, vector_type: VectorType, *, force: bool) -> bool:
+        """Rebuild one store while searches and adds continue.
+
+        Without ``force`` this is a no-op unless the store ``needs_rebuild``
+        and no other rebuild of it is running. Returns whether it rebuilt.
+        """
+        store = self._stores[vector_type]
+        rebuild_lock = self._rebuild_locks[vector_type]
+        if not rebuild_lock.acquire(blocking=force):
+            return False
+        try:
+            if not force and not store.needs_rebuild:
+                return False
+            with self._lock.read():
+                vectors = store.rebuild_source()
+            index = store.build_index(vectors)
+            with self._log_locks[vector_type]:
+                # No add can land while the log lock is held, so after this
+                # catch-up ``index`` covers every id.
+                with self._lock.read():
+                    added = store.vectors_since(int(vectors.shape[0]))
+                if added.shape[0]:
+                    index.add(added)
+                store.refill_raw((vectors, added))
+                with self._lock.write():
+                    store.install_index(index)
+            return True
+        finally:
+            rebuild_lock.release()
+
+    def add(
+        self,
+        vector_type: VectorType,
+        vectors: np.ndarray,
+        metadata: Sequence[Optional[HitMetadata]] | None = None,
+    ) -> List[int]:
+        """Add vectors (and optional per-row hit metadata, same order)."""
+        if metadata is not None and len(metadata) != int(vectors.shape[0]):
+            raise ValueError(
+                f"Got {len(metadata)} metadata rows for {vectors.shape[0]} vectors"
+            )
+        store = self._stores[vector_type]
+        with self._log_locks[vector_type]:
+            # Only ``add`` (under this lock) grows ntotal, so the next ids are known.
+            start_id = store.ntotal
+            owned = None
+            if store.is_mapped:
+                # Copy the mapped snapshot into the heap beside searches;
+                # only the swap below is exclusive.
+                with self._lock.read():
+                    owned = store.unmapped_copy()
+            log_size = store.log.size_bytes
+            store.append_log(start_id, vectors)
+            with self._lock.write():
+                if owned is not None:
+                    store.install_index(owned)
+                try:
+                    ids = store.add(vectors)
+                except BaseException:
+                    store.undo_append_log(start_id, log_size)
+                    raise
+            if ids and metadata is not None:
+                store.append_metadata(ids[0], metadata)
+        if ids:
+            with self._generation_lock:
+                self._generation += len(ids)
+        if store.needs_rebuild:
+            self._rebuild(vector_type, force=False)
+        return ids
+
+    def put_media(self, info: MediaInfo) -> None:
+        with self._media_lock:
+            self._media.put(info)
 
-    def add(self, vector_type: VectorType, vectors: np.ndarray) -> List[int]:
-        return self._stores[vector_type].add(vectors)
+    def media_info(self, media_id: UUID) -> Optional[MediaInfo]:
+        return self._media.get(media_id)
+
+    def hit_metadata(
+        self, vector_type: VectorType, faiss_ids: Sequence[int]
+    ) -> List[Optional[HitMetadata]]:
+        return self._stores[vector_type].metadata.get_many(faiss_ids)
 
     def search(
-        self, vector_type: VectorType, query: np.ndarray, top_k: int
+        self,
+        vector_type: VectorType,
+        query: np.ndarray,
+        top_k: int,
+        params: SearchParams | None = None,
     ) -> List[Tuple[int, float]]:
-        return self._stores[vector_type].search(query, top_k)
+        with self._lock.read():
+            return self._stores[vector_type].search(query, top_k, params)
 
     def search_all(
-        self, query: np.ndarray, top_k: int
+        self,
+        query: np.ndarray,
+        top_k: int,
+        params: SearchParams | None = None,
     ) -> List[Tuple[VectorType, int, float]]:
         """Query every index with ``top_k`` neighbours each, merge by score."""
         merged: List[Tuple[VectorType, int, float]] = []
-        for vector_type, store in self._stores.items():
-            for faiss_index_id, score in store.search(query, top_k):
-                merged.append((vector_type, faiss_index_id, score))
+        with self._lock.read():
+            for vector_type, store in self._stores.items():
+                for faiss_index_id, score in store.search(query, top_k, params):
+                    merged.append((vector_type, faiss_index_id, score))
         merged.sort(key=lambda row: row[2], reverse=True)
         return merged[:top_k]
 
+    def search_batch(
+        self,
+        queries: np.ndarray,
+        top_k_by_type: Mapping[VectorType, int],
+        params: SearchParams | None = None,
+    ) -> List[List[Tuple[VectorType, int, float]]]:
+        """Search several queries against several indexes in one pass.
+
+        Each listed store runs a single batched ``index.search`` over all
+        queries. Row ``i`` of the result holds query ``i``'s hits, grouped
+        per store in ``top_k_by_type`` order and best-first within a store.
+        """
+        results: List[List[Tuple[VectorType, int, float]]] = [
+            [] for _ in range(int(queries.shape[0]))
+        ]
+        with self._lock.read():
+            for vector_type, top_k in top_k_by_type.items():
+                per_query = self._stores[vector_type].search_batch(
+                    queries, top_k, params
+                )
+                for row, hits in zip(results, per_query, strict=True):
+                    row.extend(
+                        (vector_type, faiss_index_id, score)
+                        for faiss_index_id, score in hits
+                    )
+        return results
+
+    def search_similar(
+        self,
+        vector_type: VectorType,
+        faiss_id: int,
+        top_k_by_type: Mapping[VectorType, int],
+        params: SearchParams | None = None,
+    ) -> List[Tuple[VectorType, int, float]]:
+        """``search_batch`` seeded with an already-indexed vector.
+
+        The seed is reconstructed and searched under one read lock, and is
+        left out of its own modality's hits (which still return ``top_k``).
+        """
+        with self._lock.read():
+            seed = self._stores[vector_type].reconstruct(faiss_id)
+            merged: List[Tuple[VectorType, int, float]] = []
+            for hit_type, top_k in top_k_by_type.items():
+                is_seed_store = hit_type == vector_type
+                hits = self._stores[hit_type].search_batch(
+                    seed.reshape(1, -1), top_k + int(is_seed_store), params
+                )[0]
+                if is_seed_store:
+                    hits = [hit for hit in hits if hit[0] != faiss_id][:top_k]
+                merged.extend((hit_type, hit_id, score) for hit_id, score in hits)
+        return merged
+
+
+class _RawVectorFile:
+    """Append-only float32 rows on disk, read back through ``np.memmap``."""
+
+    def __init__(self, path: str, dimension: int) -> None:
+        self._path = path
+        self._dimension = dimension
+        self._row_bytes = dimension * 4
+        self._mmap: np.memmap | None = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def count(self) -> int:
+        if not os.path.exists(self._path):
+            return 0
+        return os.path.getsize(self._path) // self._row_bytes
+
+    def append(self, vectors: np.ndarray) -> None:
+        """Append rows and fsync, so the file never ends up shorter than the log."""
+        _ensure_parent_dir(self._path)
+        with open(self._path, "ab") as f:
+            f.write(np.ascontiguousarray(vectors, dtype="<f4").tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        self._mmap = None
+
+    def truncate(self, rows: int) -> None:
+        """Cut the file to ``rows`` rows, dropping any torn partial row (never extends it)."""
+        if not os.path.exists(self._path):
+            return
+        if os.path.getsize(self._path) <= rows * self._row_bytes:
+            return
+        with open(self._path, "r+b") as f:
+            f.truncate(rows * self._row_bytes)
+            f.flush()
+            os.fsync(f.fileno())
+        self._mmap = None
+
+    def read_rows(self, ids: np.ndarray) -> np.ndarray:
+        return np.asarray(self._mapped()[ids], dtype=np.float32)
+
+    def read_range(self, start: int, stop: int) -> np.ndarray:
+        return np.array(self._mapped()[start:stop], dtype=np.float32)
+
+    def _mapped(self) -> np.memmap:
+        rows = self.count
+        if self._mmap is None or self._mmap.shape[0] != rows:
+            self._mmap = np.memmap(
+                self._path, dtype="<f4", mode="r", shape=(rows, self._dimension)
+            )
+        return self._mmap
+
+
+def _index_kind(index: faiss.Index) -> IndexKind:
+    if isinstance(index, faiss.IndexHNSW):
+        return IndexKind.HNSW
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        if isinstance(faiss.downcast_index(ivf), faiss.IndexIVFPQ):
+            return IndexKind.IVF_PQ
+        return IndexKind.IVF_FLAT
+    if isinstance(index, faiss.IndexScalarQuantizer):
+        if index.sq.qtype == faiss.ScalarQuantizer.QT_fp16:
+            return IndexKind.SQ_FP16
+        return IndexKind.SQ8
+    return IndexKind.FLAT
+
+
+def _enable_reconstruct(index: faiss.Index) -> None:
+    """IVF indexes need a direct map before ``reconstruct_n`` works."""
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf.make_direct_map()
+
 
 def _ensure_parent_dir(path: str) -> None:
     parent = os.path.dirname(os.path.abspath(path))
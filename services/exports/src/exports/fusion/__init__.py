@@ -1,5 +1,6 @@
 """Temporal signal fusion for multi-index text search (Step 5)."""
 
+from exports.fusion.alignment import rank_with_alignment
 from exports.fusion.classifier import QueryClass, classify_query
 from exports.fusion.pipeline import (
     candidate_counts_for,
@@ -17,4 +18,5 @@ __all__ = [
     "group_by_timestamp",
     "intersection_multiplier",
     "normalize_scores_by_type",
+    "rank_with_alignment",
 ]
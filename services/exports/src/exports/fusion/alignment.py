@@ -0,0 +1,93 @@
+"""Temporal alignment scoring for multi-frame (video clip) queries.
+
+A clip query embeds several frames taken at query times ``q_i``. A hit at
+media time ``t`` retrieved by frame ``i`` votes for the offset ``t - q_i``.
+When a stored video really contains the clip, hits from different query
+frames agree on one offset; unrelated look-alike frames do not. A moment's
+alignment is the fraction of query frames that support the best offset
+among its own hits, counting votes from anywhere in the same media.
+"""
+
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+from uuid import UUID
+
+from exports.fusion.types import FusionHit, MomentGroup
+from exports.schema.constants import (
+    FUSION_ALIGNMENT_TOLERANCE,
+    FUSION_ALIGNMENT_WEIGHT,
+    VectorType,
+)
+
+HitKey = tuple[int, VectorType]
+# For one hit: every (query frame index, query frame time) that retrieved it.
+QueryMatches = Mapping[HitKey, Sequence[tuple[int, float]]]
+
+
+def hit_key(hit: FusionHit) -> HitKey:
+    return hit.faiss_index_id, hit.vector_type
+
+
+def alignment_score(
+    candidate_offsets: Sequence[float],
+    votes: Sequence[tuple[float, int]],
+    query_frame_count: int,
+    tolerance: float = FUSION_ALIGNMENT_TOLERANCE,
+) -> float:
+    """Largest fraction of query frames whose ``(offset, frame)`` votes agree
+    with one of ``candidate_offsets`` to within ``tolerance`` seconds."""
+    if query_frame_count <= 0:
+        return 0.0
+    best = 0
+    for offset in candidate_offsets:
+        support = {index for other, index in votes if abs(other - offset) <= tolerance}
+        best = max(best, len(support))
+    return min(best / query_frame_count, 1.0)
+
+
+def rank_with_alignment(
+    groups: list[MomentGroup],
+    matches: QueryMatches,
+    query_frame_count: int,
+    top_k: int,
+    *,
+    tolerance: float = FUSION_ALIGNMENT_TOLERANCE,
+    weight: float = FUSION_ALIGNMENT_WEIGHT,
+) -> list[MomentGroup]:
+    """Add ``weight * alignment`` to already-fused group scores and return the
+    top moments.
+
+    Expects ``groups`` scored by ``fuse_and_rank`` (every hit carries the
+    group's fused score). The bonus is additive so a well-aligned moment
+    can still surface when min-max normalization left its raw score near 0.
+    """
+    votes_by_media: dict[UUID, list[tuple[float, int]]] = {}
+    for group in groups:
+        votes = votes_by_media.setdefault(group.media_id, [])
+        for hit in group.hits:
+            for index, query_time in matches.get(hit_key(hit), ()):
+                votes.append((hit.timestamp - query_time, index))
+
+    for group in groups:
+        candidates = [
+            hit.timestamp - query_time
+            for hit in group.hits
+            for _index, query_time in matches.get(hit_key(hit), ())
+        ]
+        score = alignment_score(
+            candidates,
+            votes_by_media.get(group.media_id, []),
+            query_frame_count,
+            tolerance,
+        )
+        fused = group.best_hit.fused_score + weight * score
+        for hit in group.hits:
+            hit.fused_score = fused
+
+    ranked = sorted(
+        groups,
+        key=lambda group: group.best_hit.fused_score,
+        reverse=True,
+    )
+    return ranked[:top_k]
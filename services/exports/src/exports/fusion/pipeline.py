@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from uuid import UUID
+
 from exports.fusion.classifier import QueryClass
 from exports.fusion.types import FusionHit, MomentGroup
 from exports.schema.constants import (
@@ -84,28 +87,42 @@ def proximity_radius(hit: FusionHit) -> float:
 
 
 def group_by_timestamp(hits: list[FusionHit]) -> list[MomentGroup]:
-    """Group hydrated hits by media and timestamp proximity."""
-    sorted_hits = sorted(hits, key=lambda hit: (str(hit.media_id), hit.timestamp))
-    groups: list[MomentGroup] = []
+    """Group hydrated hits by media and timestamp proximity.
+
+    A hit joins the earliest-created group of its media whose anchor lies
+    within ``proximity_radius(hit)``, else it starts a new group. Hits are
+    swept per media in timestamp order, so each media's anchors are sorted
+    and the matching group is found by bisection instead of a scan over
+    every group.
+    """
+    by_media: dict[UUID, list[FusionHit]] = {}
+    for hit in hits:
+        by_media.setdefault(hit.media_id, []).append(hit)
 
-    for hit in sorted_hits:
-        radius = proximity_radius(hit)
-        matched = False
-        for group in groups:
-            if group.media_id != hit.media_id:
+    groups: list[MomentGroup] = []
+    # UUID ordering matches the ordering of their canonical strings.
+    for media_id in sorted(by_media):
+        media_hits = sorted(by_media[media_id], key=lambda hit: hit.timestamp)
+        media_groups: list[MomentGroup] = []
+        anchors: list[float] = []
+        for hit in media_hits:
+            # Every anchor is <= hit.timestamp, so the anchors inside the
+            # radius form a suffix; bisect to its start, then nudge across
+            # float rounding so the test stays exactly ``ts - anchor <= r``.
+            radius = proximity_radius(hit)
+            i = bisect_left(anchors, hit.timestamp - radius)
+            while i > 0 and hit.timestamp - anchors[i - 1] <= radius:
+                i -= 1
+            while i < len(anchors) and hit.timestamp - anchors[i] > radius:
+                i += 1
+            if i < len(anchors):
+                media_groups[i].hits.append(hit)
                 continue
-            if abs(hit.timestamp - group.anchor_time) <= radius:
-                group.hits.append(hit)
-                matched = True
-                break
-        if not matched:
-            groups.append(
-                MomentGroup(
-                    media_id=hit.media_id,
-                    anchor_time=hit.timestamp,
-                    hits=[hit],
-                )
+            anchors.append(hit.timestamp)
+            media_groups.append(
+                MomentGroup(media_id=media_id, anchor_time=hit.timestamp, hits=[hit])
             )
+        groups.extend(media_groups)
 
     return groups
 
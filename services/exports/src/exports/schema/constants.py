@@ -98,6 +98,9 @@ EMBEDDER_SERVICE = _get_env("EMBEDDER_SERVICE", "")
 INDEXER_SERVICE = _get_env("INDEXER_SERVICE", "")
 TRANSCRIBE_SERVICE = _get_env("TRANSCRIBE_SERVICE", "")
 CAPTION_SERVICE = _get_env("CAPTION_SERVICE", "")
+# Wire format for vector-carrying calls to the embedder and indexer: "binary"
+# (packed float32, see exports.utils.vector_wire) or "json" for debugging.
+VECTOR_WIRE_FORMAT: str = _get_env("VECTOR_WIRE_FORMAT", "binary")
 
 # -----------------------------
 # Supabase (lifespan services; optional at import for embedder)
@@ -115,6 +118,20 @@ MINIO_ACCESS_KEY = _get_env("MINIO_ACCESS_KEY", "")
 MINIO_SECRET_KEY = _get_env("MINIO_SECRET_KEY", "")
 MINIO_BUCKET_NAME = _get_env("MINIO_BUCKET_NAME", "")
 MINIO_USE_SSL = _get_env("MINIO_USE_SSL", "false").lower() == "true"
+# MinioDB.download_to_path / iter_file read objects in chunks of this size, so
+# a download never holds more than one chunk in memory.
+MINIO_DOWNLOAD_CHUNK_BYTES: int = _get_int("MINIO_DOWNLOAD_CHUNK_BYTES", 1024 * 1024)
+# MinioDB.upload_many (frame JPEGs): PUTs in flight at once, extra attempts per
+# object after a failed PUT, and the first retry delay (doubled per attempt).
+MINIO_UPLOAD_CONCURRENCY: int = _get_int("MINIO_UPLOAD_CONCURRENCY", 16)
+MINIO_UPLOAD_RETRIES: int = _get_int("MINIO_UPLOAD_RETRIES", 2)
+MINIO_UPLOAD_RETRY_BACKOFF: float = _get_float("MINIO_UPLOAD_RETRY_BACKOFF", 0.2)
+# Node-local cache of source videos (exports.video_cache). Point it at a volume
+# shared by media_processor, transcribe and caption so each object is
+# downloaded once per node; least-recently-used entries are evicted past
+# VIDEO_CACHE_MAX_BYTES (0 disables eviction).
+VIDEO_CACHE_DIR: str = _get_env("VIDEO_CACHE_DIR", "/tmp/videos/cache")
+VIDEO_CACHE_MAX_BYTES: int = _get_int("VIDEO_CACHE_MAX_BYTES", 20 * 1024 * 1024 * 1024)
 
 # -----------------------------
 # Pipeline tunables (typed, with safe defaults)
@@ -128,11 +145,70 @@ PHASH_MULTIPLIER: float = _get_float("PHASH_MULTIPLIER", 1.5)
 FLOOR_INTERVAL: float = _get_float("FLOOR_INTERVAL", 5.0)
 MIN_SAMPLE_GAP: float = _get_float("MIN_SAMPLE_GAP", 1.0)
 # Default number of nearest neighbours for search; also the maximum ``top_k``
-# allowed per request (API and indexer both clamp to this value).
+# (page size) allowed per API search request.
 DEFAULT_TOP_K: int = _get_int("DEFAULT_TOP_K", 25)
+# Most neighbours the indexer returns per modality for one query.
+INDEXER_MAX_TOP_K: int = _get_int("INDEXER_MAX_TOP_K", 200)
 # When ``vector_type`` filtering is active, the API over-fetches this many FAISS
 # candidates before filtering so image hits are not crowded out by transcripts.
 FILTERED_SEARCH_MAX_K: int = _get_int("FILTERED_SEARCH_MAX_K", 500)
+# Media whose sorted frame timelines the API keeps in memory for nearest-frame
+# lookups (LRU; one entry per media).
+FRAME_TIMELINE_CACHE_SIZE: int = _get_int("FRAME_TIMELINE_CACHE_SIZE", 512)
+# Query text -> CLIP embedding cache in the API's embedder client (LRU + TTL).
+# Set QUERY_EMBEDDING_CACHE_PATH to a SQLite file to keep entries across restarts.
+QUERY_EMBEDDING_CACHE_SIZE: int = _get_int("QUERY_EMBEDDING_CACHE_SIZE", 2048)
+QUERY_EMBEDDING_CACHE_TTL: float = _get_float("QUERY_EMBEDDING_CACHE_TTL", 24 * 3600.0)
+QUERY_EMBEDDING_CACHE_PATH: str = _get_env("QUERY_EMBEDDING_CACHE_PATH", "")
+# Finished /search/text responses cached per (query, filter, top_k, index
+# generation). New vectors invalidate entries via the generation and ingest
+# clears the cache on every media status change; the TTL bounds staleness
+# from other database-side changes (frames, edits made outside ingest).
+SEARCH_RESULT_CACHE_SIZE: int = _get_int("SEARCH_RESULT_CACHE_SIZE", 512)
+SEARCH_RESULT_CACHE_TTL: float = _get_float("SEARCH_RESULT_CACHE_TTL", 300.0)
+# How long the API reuses the index generation it last read from the indexer
+# instead of asking again per search; vectors added within this window may be
+# missing from cached results until it passes.
+SEARCH_GENERATION_TTL: float = _get_float("SEARCH_GENERATION_TTL", 1.0)
+# Paginated search: ranked results reachable through cursors (the candidate
+# set is retrieved this deep up front), and how long / how many candidate
+# sets the API keeps for GET /search/page.
+SEARCH_PAGE_MAX_DEPTH: int = _get_int("SEARCH_PAGE_MAX_DEPTH", 200)
+SEARCH_CURSOR_TTL: float = _get_float("SEARCH_CURSOR_TTL", 120.0)
+SEARCH_CURSOR_CACHE_SIZE: int = _get_int("SEARCH_CURSOR_CACHE_SIZE", 256)
+# Largest query image accepted by /search/image (and the embedder's raw route).
+SEARCH_IMAGE_MAX_BYTES: int = _get_int("SEARCH_IMAGE_MAX_BYTES", 20 * 1024 * 1024)
+# Query image content hash -> CLIP embedding entries kept by the API (LRU + TTL).
+IMAGE_EMBEDDING_CACHE_SIZE: int = _get_int("IMAGE_EMBEDDING_CACHE_SIZE", 256)
+# /search/video: largest accepted clip, and the most representative frames
+# (from hybrid sampling) embedded per clip, which bounds query latency.
+SEARCH_VIDEO_MAX_BYTES: int = _get_int("SEARCH_VIDEO_MAX_BYTES", 200 * 1024 * 1024)
+SEARCH_VIDEO_MAX_FRAMES: int = _get_int("SEARCH_VIDEO_MAX_FRAMES", 8)
+# Search query log: rows are buffered in the API and inserted in batches of up
+# to SEARCH_LOG_BATCH_SIZE, at least every SEARCH_LOG_FLUSH_SECONDS. Rows that
+# arrive while SEARCH_LOG_QUEUE_SIZE are already waiting are dropped.
+SEARCH_LOG_BATCH_SIZE: int = _get_int("SEARCH_LOG_BATCH_SIZE", 100)
+SEARCH_LOG_FLUSH_SECONDS: float = _get_float("SEARCH_LOG_FLUSH_SECONDS", 2.0)
+SEARCH_LOG_QUEUE_SIZE: int = _get_int("SEARCH_LOG_QUEUE_SIZE", 10000)
+# Ingest job queue (API): /upload/video enqueues into a SQLite file at
+# INGEST_JOB_DB_PATH and INGEST_WORKERS jobs run at once. A failed job is
+# retried from the start until it has used INGEST_JOB_MAX_ATTEMPTS; idle
+# workers re-check the queue every INGEST_POLL_SECONDS.
+INGEST_JOB_DB_PATH: str = _get_env("INGEST_JOB_DB_PATH", "/app/data/ingest_jobs.sqlite")
+INGEST_WORKERS: int = _get_int("INGEST_WORKERS", 2)
+INGEST_JOB_MAX_ATTEMPTS: int = _get_int("INGEST_JOB_MAX_ATTEMPTS", 2)
+INGEST_POLL_SECONDS: float = _get_float("INGEST_POLL_SECONDS", 5.0)
+# Concurrent downstream calls per ingest stage across all running jobs; keeps
+# the GPU-heavy embedder, transcriber and captioner from being oversubscribed.
+INGEST_EXTRACT_CONCURRENCY: int = _get_int("INGEST_EXTRACT_CONCURRENCY", 2)
+INGEST_EMBED_CONCURRENCY: int = _get_int("INGEST_EMBED_CONCURRENCY", 1)
+INGEST_INDEX_CONCURRENCY: int = _get_int("INGEST_INDEX_CONCURRENCY", 2)
+INGEST_TRANSCRIBE_CONCURRENCY: int = _get_int("INGEST_TRANSCRIBE_CONCURRENCY", 1)
+INGEST_CAPTION_CONCURRENCY: int = _get_int("INGEST_CAPTION_CONCURRENCY", 1)
+# /health/all: downstream services are probed concurrently in the background
+# every HEALTH_REFRESH_SECONDS, each probe cut off after HEALTH_PROBE_TIMEOUT.
+HEALTH_PROBE_TIMEOUT: float = _get_float("HEALTH_PROBE_TIMEOUT", 2.0)
+HEALTH_REFRESH_SECONDS: float = _get_float("HEALTH_REFRESH_SECONDS", 10.0)
 
 # Temporal signal fusion (Step 5 text search)
 FUSION_PRIMARY_CANDIDATES: int = _get_int("FUSION_PRIMARY_CANDIDATES", 20)
@@ -142,6 +218,12 @@ FUSION_TRANSCRIPT_PROXIMITY: float = _get_float("FUSION_TRANSCRIPT_PROXIMITY", 6
 FUSION_INTERSECTION_MULTIPLIER_1: float = _get_float("FUSION_INTERSECTION_MULTIPLIER_1", 1.0)
 FUSION_INTERSECTION_MULTIPLIER_2: float = _get_float("FUSION_INTERSECTION_MULTIPLIER_2", 1.3)
 FUSION_INTERSECTION_MULTIPLIER_3: float = _get_float("FUSION_INTERSECTION_MULTIPLIER_3", 1.6)
+# Video-clip queries: hits whose (match time - query frame time) offsets agree
+# within FUSION_ALIGNMENT_TOLERANCE seconds support the same alignment; a
+# moment's fused score gets FUSION_ALIGNMENT_WEIGHT * (fraction of query frames
+# supporting its best offset) added to it.
+FUSION_ALIGNMENT_TOLERANCE: float = _get_float("FUSION_ALIGNMENT_TOLERANCE", 2.0)
+FUSION_ALIGNMENT_WEIGHT: float = _get_float("FUSION_ALIGNMENT_WEIGHT", 0.5)
 
 # -----------------------------
 # Embedding model (embedder service)
@@ -222,3 +304,39 @@ EXPORTS_LIFESPAN_FAISS: bool = _get_bool("EXPORTS_LIFESPAN_FAISS", False)
 # Set to a directory (e.g. /app/data/faiss) or a legacy single-file path
 # (e.g. /app/data/embeddings.faiss) — the parent directory is used in that case.
 FAISS_INDEX_PATH = _get_env("FAISS_INDEX_PATH", "")
+# Index structure per modality: "flat" (exact), "hnsw" or "ivf_flat" (approximate),
+# or a compressed mode: "ivf_pq", "sq8" or "sq_fp16".
+# The per-modality variables fall back to FAISS_INDEX_TYPE.
+FAISS_INDEX_TYPE: str = _get_env("FAISS_INDEX_TYPE", "flat")
+FAISS_IMAGE_INDEX_TYPE: str = _get_env("FAISS_IMAGE_INDEX_TYPE", FAISS_INDEX_TYPE)
+FAISS_TEXT_INDEX_TYPE: str = _get_env("FAISS_TEXT_INDEX_TYPE", FAISS_INDEX_TYPE)
+FAISS_CAPTION_INDEX_TYPE: str = _get_env("FAISS_CAPTION_INDEX_TYPE", FAISS_INDEX_TYPE)
+# HNSW graph degree, build-time beam width, and default query-time beam width.
+FAISS_HNSW_M: int = _get_int("FAISS_HNSW_M", 32)
+FAISS_HNSW_EF_CONSTRUCTION: int = _get_int("FAISS_HNSW_EF_CONSTRUCTION", 200)
+FAISS_HNSW_EF_SEARCH: int = _get_int("FAISS_HNSW_EF_SEARCH", 64)
+# IVF coarse centroids and default number of lists probed per query.
+FAISS_IVF_NLIST: int = _get_int("FAISS_IVF_NLIST", 1024)
+FAISS_IVF_NPROBE: int = _get_int("FAISS_IVF_NPROBE", 16)
+# IVF indexes stay exact (flat) until nlist * this many vectors exist to train on.
+FAISS_IVF_TRAIN_POINTS_PER_LIST: int = _get_int("FAISS_IVF_TRAIN_POINTS_PER_LIST", 39)
+# IVF-PQ code size: FAISS_PQ_M sub-quantizers (must divide CLIP_DIMENSION) of
+# FAISS_PQ_NBITS bits each, i.e. 48 bytes per 768-dim vector by default.
+FAISS_PQ_M: int = _get_int("FAISS_PQ_M", 48)
+FAISS_PQ_NBITS: int = _get_int("FAISS_PQ_NBITS", 8)
+# SQ8 stays flat until this many vectors exist to estimate per-dimension ranges.
+FAISS_SQ8_MIN_TRAIN: int = _get_int("FAISS_SQ8_MIN_TRAIN", 1000)
+# Compressed modes over-fetch top_k * this many candidates and re-score them
+# exactly against the raw float32 sidecar file. 0 or 1 disables re-ranking.
+FAISS_RERANK_FACTOR: int = _get_int("FAISS_RERANK_FACTOR", 4)
+# Adds are fsynced to a per-index vector log; once a log reaches this size the
+# indexer folds it into a full index snapshot in the background.
+FAISS_WAL_COMPACT_BYTES: int = _get_int("FAISS_WAL_COMPACT_BYTES", 256 * 1024 * 1024)
+# Memory-map index snapshots read-only instead of reading them into the heap:
+# startup is near-instant and replicas on one host share the page cache. Only
+# useful for read-only replicas: the first add (or a non-empty log at startup)
+# copies the index into memory for the rest of the process.
+FAISS_MMAP_LOAD: bool = _get_bool("FAISS_MMAP_LOAD", False)
+# Transcript/caption text kept per vector in the hit-metadata sidecar is cut to
+# this many characters (long enough for a whole segment in practice).
+FAISS_META_TEXT_CHARS: int = _get_int("FAISS_META_TEXT_CHARS", 1024)
@@ -14,11 +14,20 @@ attribute name here uses the same spelling.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 from uuid import UUID
 
+import numpy as np
 from fastapi import UploadFile
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    PlainSerializer,
+    WrapValidator,
+    model_validator,
+)
 
 from .constants import (
     ContentType,
@@ -58,6 +67,14 @@ class FrameRow(BaseModel):
     created_at: datetime
 
 
+class FrameTimestampRow(BaseModel):
+    """Narrow `public.frames` projection used for nearest-frame lookups."""
+    id: UUID
+    media_id: UUID
+    timestamp: float
+    frame_url: str
+
+
 class EmbeddingRow(BaseModel):
     """Row in `public.embeddings`. Vectors live in FAISS, not here."""
     id: UUID
@@ -94,6 +111,8 @@ class SearchQueryRow(BaseModel):
     id: UUID
     query_text: Optional[str] = None
     query_type: QueryType
+    latency_ms: Optional[float] = None
+    result_count: Optional[int] = None
     created_at: datetime
 
 
@@ -177,6 +196,9 @@ class CaptionCreate(BaseModel):
 class SearchQueryCreate(BaseModel):
     query_type: QueryType
     query_text: Optional[str] = None
+    # Server-side request latency and number of results returned.
+    latency_ms: Optional[float] = None
+    result_count: Optional[int] = None
 
 
 class IncidentCreate(BaseModel):
@@ -239,6 +261,29 @@ class TextSearchRequest(BaseModel):
     text: str
     top_k: Optional[int] = None
     vector_type: Optional[VectorType] = None
+    # Return a ``next_cursor`` for paging past the first ``top_k`` results.
+    paginate: bool = False
+
+
+class SimilarSearchRequest(BaseModel):
+    """JSON body for ``POST /search/similar`` ("more like this" an indexed item)."""
+    frame_id: Optional[UUID] = None
+    caption_id: Optional[UUID] = None
+    transcript_id: Optional[UUID] = None
+    top_k: Optional[int] = None
+    paginate: bool = False
+
+    @model_validator(mode="after")
+    def exactly_one_source(self) -> "SimilarSearchRequest":
+        source_count = sum(
+            value is not None
+            for value in (self.frame_id, self.caption_id, self.transcript_id)
+        )
+        if source_count != 1:
+            raise ValueError(
+                "Exactly one of frame_id, caption_id, or transcript_id must be set"
+            )
+        return self
 
 
 # ============================================================
@@ -270,6 +315,18 @@ class ExtractFramesResponse(BaseModel):
     duration: float
 
 
+class QueryFrame(BaseModel):
+    """One representative frame of a query clip (not persisted anywhere)."""
+    timestamp: float
+    frame_data: str  # base64-encoded JPEG
+
+
+class QueryFramesResponse(BaseModel):
+    """``POST /extract/query`` — frames picked from a search clip, in time order."""
+    frames: List[QueryFrame]
+    duration: float
+
+
 # ---- embedder I/O ----
 class EmbedImageItem(BaseModel):
     frame_id: UUID
@@ -285,6 +342,11 @@ class EmbeddingResult(BaseModel):
     embedding: List[float]
 
 
+class EmbedImageResponse(BaseModel):
+    """One query image posted raw to ``/embed/images/raw``."""
+    embedding: List[float]
+
+
 class EmbedImagesResponse(BaseModel):
     embeddings: List[EmbeddingResult]
 
@@ -374,12 +436,57 @@ class CaptionResponse(BaseModel):
 
 
 # ---- indexer I/O ----
+def _keep_float32_rows(value: Any, handler: Any) -> Any:
+    # Binary bodies (exports.utils.vector_wire) decode to float32 views of
+    # the request buffer; keep them instead of building a float per element.
+    if isinstance(value, np.ndarray):
+        if value.ndim != 1:
+            raise ValueError("vector must be one-dimensional")
+        return value.astype(np.float32, copy=False)
+    return handler(value)
+
+
+# A list of floats, or a float32 numpy row when decoded from a binary body.
+Vector = Annotated[
+    List[float],
+    WrapValidator(_keep_float32_rows),
+    PlainSerializer(
+        lambda value: value.tolist() if isinstance(value, np.ndarray) else value,
+        return_type=List[float],
+    ),
+]
+
+
+class VectorMetadata(BaseModel):
+    """Search-time display fields the indexer keeps next to a vector.
+
+    ``frame_id`` / ``frame_url`` are the frame itself for image vectors and
+    the preview frame nearest the segment midpoint for transcript/caption
+    vectors.
+    """
+    timestamp: float
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    frame_id: Optional[UUID] = None
+    frame_url: Optional[str] = None
+    text: Optional[str] = None
+
+
+class IndexedMedia(BaseModel):
+    """Media fields denormalized into the indexer's hit-metadata sidecar."""
+    media_type: MediaType
+    file_name: str
+    file_url: str
+
+
 class AddVectorItem(BaseModel):
     frame_id: Optional[UUID] = None
     transcript_id: Optional[UUID] = None
     caption_id: Optional[UUID] = None
-    embedding: List[float]
+    embedding: Vector
     vector_type: VectorType = VectorType.IMAGE
+    # Optional; lets search responses come back pre-hydrated.
+    metadata: Optional[VectorMetadata] = None
 
     @model_validator(mode="after")
     def exactly_one_source(self) -> "AddVectorItem":
@@ -397,6 +504,7 @@ class AddVectorItem(BaseModel):
 class AddVectorsRequest(BaseModel):
     media_id: UUID
     vectors: List[AddVectorItem]
+    media: Optional[IndexedMedia] = None
 
 
 class AddVectorsResponse(BaseModel):
@@ -404,9 +512,30 @@ class AddVectorsResponse(BaseModel):
 
 
 class SearchVectorsRequest(BaseModel):
-    embedding: List[float]
+    embedding: Vector
     top_k: int
     vector_type: Optional[VectorType] = None
+    # ANN recall/latency knobs; ignored by flat indexes, ``None`` = server default.
+    nprobe: Optional[int] = None
+    ef_search: Optional[int] = None
+    # Exact re-rank over-fetch factor for compressed indexes (1 disables).
+    rerank_factor: Optional[int] = None
+    # Attach the sidecar ``metadata`` to each hit where the indexer has it.
+    include_metadata: bool = False
+
+
+class IndexedHitMetadata(BaseModel):
+    """Pre-hydrated hit fields from the indexer's sidecar (see ``VectorMetadata``)."""
+
+    media_id: UUID
+    row_id: UUID  # frame, transcript or caption id, by vector type
+    timestamp: float
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    frame_id: Optional[UUID] = None
+    frame_url: Optional[str] = None
+    text: Optional[str] = None
+    media: Optional[IndexedMedia] = None
 
 
 class IndexerVectorHit(BaseModel):
@@ -415,7 +544,43 @@ class IndexerVectorHit(BaseModel):
     faiss_index_id: int
     similarity_score: float
     vector_type: VectorType
+    metadata: Optional[IndexedHitMetadata] = None
 
 
 class SearchVectorsResponse(BaseModel):
     hits: List[IndexerVectorHit]
+
+
+class BatchSearchVectorsRequest(BaseModel):
+    """N query vectors searched against each modality in ``top_k`` (one round trip)."""
+
+    embeddings: List[Vector]
+    # Neighbours per modality; modalities left out are not searched.
+    top_k: Dict[VectorType, int]
+    nprobe: Optional[int] = None
+    ef_search: Optional[int] = None
+    rerank_factor: Optional[int] = None
+    include_metadata: bool = False
+
+
+class SimilarVectorsRequest(BaseModel):
+    """Search seeded with an indexed vector, reconstructed inside the indexer."""
+
+    vector_type: VectorType
+    faiss_index_id: int
+    top_k: Dict[VectorType, int]
+    nprobe: Optional[int] = None
+    ef_search: Optional[int] = None
+    rerank_factor: Optional[int] = None
+    include_metadata: bool = False
+
+
+class BatchSearchVectorsResponse(BaseModel):
+    # ``results[i]`` holds the hits for ``embeddings[i]``, grouped by modality.
+    results: List[List[IndexerVectorHit]]
+
+
+class IndexGenerationResponse(BaseModel):
+    """Grows whenever vectors are added; unchanged generation = unchanged results."""
+
+    generation: int
@@ -0,0 +1,190 @@
+"""Negotiated binary encoding for request/response bodies that carry vectors.
+
+JSON spells each 768-dim vector as ~15 KB of decimal text. The binary form
+keeps every non-vector field as JSON but moves vectors into one packed
+little-endian float32 block::
+
+    header_len  u32   byte length of the JSON header
+    header      JSON  {"body": <payload>, "lengths": [<floats per vector>]}
+    data        f32   all vectors back to back, in ``lengths`` order
+
+Inside ``body`` each vector is replaced by ``{"$row": i}``. Only values
+under the keys in ``_VECTOR_KEYS`` are packed.
+
+Senders set ``Content-Type: application/x-mefid-vectors``; receivers ask
+for it with ``Accept``. Plain JSON keeps working everywhere (set
+``VECTOR_WIRE_FORMAT=json`` to force it for debugging).
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import TYPE_CHECKING, Any, Callable, List, Sequence, Type, TypeVar
+
+import numpy as np
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+if TYPE_CHECKING:
+    import httpx
+
+VECTOR_MEDIA_TYPE = "application/x-mefid-vectors"
+JSON_MEDIA_TYPE = "application/json"
+
+_VECTOR_KEYS = frozenset({"embedding", "embeddings"})
+_ROW = "$row"
+_HEADER_LEN = struct.Struct("<I")
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def encode(payload: Any) -> bytes:
+    """Pack a JSON-compatible payload (e.g. ``model_dump(mode="json")``)."""
+    rows: List[List[float]] = []
+    body = _lift(payload, rows)
+    header = json.dumps(
+        {"body": body, "lengths": [len(row) for row in rows]},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    data = (
+        np.concatenate([np.asarray(row, dtype="<f4") for row in rows]).tobytes()
+        if rows
+        else b""
+    )
+    return _HEADER_LEN.pack(len(header)) + header + data
+
+
+def decode(raw: bytes, *, arrays: bool = False) -> Any:
+    """Inverse of ``encode``; vectors come back as lists of floats.
+
+    With ``arrays`` they are read-only float32 views of ``raw`` instead, for
+    models whose vector fields accept them (``exports.schema.models.Vector``).
+    """
+    if len(raw) < _HEADER_LEN.size:
+        raise ValueError("vector body is shorter than its header length prefix")
+    (header_len,) = _HEADER_LEN.unpack_from(raw)
+    header_end = _HEADER_LEN.size + header_len
+    header = json.loads(raw[_HEADER_LEN.size:header_end].decode("utf-8"))
+    lengths: List[int] = header["lengths"]
+    data = np.frombuffer(raw, dtype="<f4", offset=header_end)
+    if int(data.shape[0]) != sum(lengths):
+        raise ValueError(
+            f"vector body holds {data.shape[0]} floats, header declares {sum(lengths)}"
+        )
+    offsets = np.cumsum([0, *lengths])
+    rows = [data[offsets[i]:offsets[i + 1]] for i in range(len(lengths))]
+    if not arrays:
+        rows = [row.tolist() for row in rows]
+    return _restore(header["body"], rows)
+
+
+def is_vector_media_type(content_type: str | None) -> bool:
+    return bool(content_type) and content_type.split(";")[0].strip() == VECTOR_MEDIA_TYPE
+
+
+def accepts_vector_media_type(request: Request) -> bool:
+    return VECTOR_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def vector_body(model: Type[ModelT]) -> Callable[[Request], Any]:
+    """FastAPI dependency that parses ``model`` from a JSON or binary body.
+
+    Use as ``body: Model = Depends(vector_body(Model))``. Validation errors
+    surface as the usual 422 response either way.
+    """
+
+    async def parse(request: Request) -> ModelT:
+        raw = await request.body()
+        binary = is_vector_media_type(request.headers.get("content-type"))
+        try:
+            if binary:
+                return model.model_validate(decode(raw, arrays=True))
+            return model.model_validate_json(raw)
+        except ValidationError as e:
+            # Binary inputs may hold numpy rows, which the 422 body cannot encode.
+            raise RequestValidationError(e.errors(include_input=not binary)) from e
+        except (ValueError, KeyError, TypeError) as e:
+            raise RequestValidationError(
+                [{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}]
+            ) from e
+
+    return parse
+
+
+def vector_response(request: Request, model: ModelT) -> ModelT | Response:
+    """Return ``model`` binary-encoded when the caller accepts it, else as-is (JSON)."""
+    if not accepts_vector_media_type(request):
+        return model
+    return Response(
+        content=encode(model.model_dump(mode="json")),
+        media_type=VECTOR_MEDIA_TYPE,
+    )
+
+
+def accept_headers(*, binary: bool) -> dict:
+    """Headers asking for a binary response when ``binary`` is set."""
+    if not binary:
+        return {}
+    return {"accept": f"{VECTOR_MEDIA_TYPE}, {JSON_MEDIA_TYPE}"}
+
+
+def request_kwargs(payload: Any, *, binary: bool) -> dict:
+    """``httpx`` keyword arguments for posting a vector ``payload`` in the chosen format."""
+    if not binary:
+        return {"json": payload}
+    return {
+        "content": encode(payload),
+        "headers": {"content-type": VECTOR_MEDIA_TYPE, **accept_headers(binary=True)},
+    }
+
+
+def response_payload(response: "httpx.Response") -> Any:
+    """Decode an ``httpx`` response in whichever format the server chose."""
+    if is_vector_media_type(response.headers.get("content-type")):
+        return decode(response.content)
+    return response.json()
+
+
+def _is_vector(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(isinstance(x, (int, float)) and not isinstance(x, bool) for x in value)
+    )
+
+
+def _lift(node: Any, rows: List[List[float]], key: str | None = None) -> Any:
+    if key in _VECTOR_KEYS:
+        if _is_vector(node):
+            rows.append(node)
+            return {_ROW: len(rows) - 1}
+        if isinstance(node, list) and node and all(_is_vector(item) for item in node):
+            lifted = []
+            for item in node:
+                rows.append(item)
+                lifted.append({_ROW: len(rows) - 1})
+            return lifted
+    if isinstance(node, dict):
+        return {k: _lift(v, rows, k) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_lift(item, rows) for item in node]
+    return node
+
+
+def _restore(node: Any, rows: Sequence[Any]) -> Any:
+    if isinstance(node, dict):
+        if len(node) == 1 and _ROW in node:
+            index = node[_ROW]
+            if not isinstance(index, int) or isinstance(index, bool):
+                raise ValueError(f"vector reference {index!r} is not a row number")
+            if not 0 <= index < len(rows):
+                raise ValueError(
+                    f"vector reference {index} is out of range for {len(rows)} rows"
+                )
+            return rows[index]
+        return {k: _restore(v, rows) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_restore(item, rows) for item in node]
+    return node
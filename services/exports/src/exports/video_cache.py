@@ -0,0 +1,227 @@
+"""Node-local, content-addressed cache of source videos fetched from MinIO.
+
+media_processor, transcribe and caption all read the same uploaded video.
+With ``VIDEO_CACHE_DIR`` on a volume shared by those containers, the first
+service to ask for an object downloads it and the others reuse the file.
+
+Entries are named ``sha256(bucket/object + etag)`` plus the object's
+extension, so a re-uploaded object never serves stale bytes. Each entry has
+a ``.lock`` file next to it:
+
+* readers hold a shared ``flock`` for as long as they use the path, so an
+  entry in use is never evicted;
+* a miss is streamed under the exclusive lock (``MinioDB.download_to_path``)
+  into a ``.part`` file that is fsynced and renamed into place, so a crash
+  never leaves a truncated entry.
+
+Whenever a reader releases an entry, least-recently-used unpinned entries
+(by mtime, refreshed on every hit) are evicted until the cache fits
+``VIDEO_CACHE_MAX_BYTES``. Eviction removes the entry and its ``.lock``
+file under the exclusive lock; a reader that opened the old lock file sees
+it is gone once locked and retries on a new one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import glob
+import hashlib
+import os
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Tuple
+
+from exports.db_clients.minioDB import MinioDB
+from exports.schema.constants import (
+    MINIO_BUCKET_NAME,
+    VIDEO_CACHE_DIR,
+    VIDEO_CACHE_MAX_BYTES,
+)
+from exports.utils.logger import get_logger
+
+logger = get_logger()
+
+_LOCK_SUFFIX = ".lock"
+_PART_MARKER = ".part."
+
+
+class VideoCache:
+    """``async with cache.open(minio, key) as path`` yields a local copy of ``key``."""
+
+    def __init__(
+        self,
+        root: str = VIDEO_CACHE_DIR,
+        *,
+        max_bytes: int = VIDEO_CACHE_MAX_BYTES,
+    ) -> None:
+        self.root = root
+        self.max_bytes = max(0, max_bytes)
+        # Serializes same-entry lookups within this process so concurrent
+        # requests wait on one fill instead of each blocking a thread on flock.
+        self._key_locks: Dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.fills = 0
+        self.evictions = 0
+
+    def entry_path(self, object_name: str, etag: str) -> str:
+        digest = hashlib.sha256(
+            f"{MINIO_BUCKET_NAME}/{object_name}\0{etag}".encode("utf-8")
+        ).hexdigest()
+        suffix = os.path.splitext(object_name)[1] or ".mp4"
+        return os.path.join(self.root, digest + suffix)
+
+    @asynccontextmanager
+    async def open(self, minio: MinioDB, object_name: str) -> AsyncIterator[str]:
+        """Path to a complete local copy of ``object_name``, pinned until exit."""
+        etag = await minio.object_etag(object_name)
+        path = self.entry_path(object_name, etag)
+        lock = self._key_locks.setdefault(path, asyncio.Lock())
+        async with lock:
+            lock_fd = await asyncio.to_thread(self._open_lock, path)
+            try:
+                filled = False
+                while True:
+                    await asyncio.to_thread(fcntl.flock, lock_fd, fcntl.LOCK_SH)
+                    if not self._lock_is_current(lock_fd, path):
+                        lock_fd = await self._reopen_lock(lock_fd, path)
+                        continue
+                    if os.path.exists(path):
+                        break
+                    # Missing (or evicted between fill and re-lock): fill it
+                    # under the exclusive lock, then go back to shared.
+                    fcntl.flock(lock_fd, fcntl.LOCK_UN)
+                    await asyncio.to_thread(fcntl.flock, lock_fd, fcntl.LOCK_EX)
+                    if not self._lock_is_current(lock_fd, path):
+                        lock_fd = await self._reopen_lock(lock_fd, path)
+                        continue
+                    if not os.path.exists(path):
+                        await self._fill(minio, object_name, path)
+                        filled = True
+                    fcntl.flock(lock_fd, fcntl.LOCK_UN)
+                if not filled:
+                    os.utime(path)
+                    self.hits += 1
+            except BaseException:
+                os.close(lock_fd)
+                raise
+        if not lock.locked():
+            self._key_locks.pop(path, None)
+        try:
+            yield path
+        finally:
+            os.close(lock_fd)  # closing the descriptor releases the flock
+        if self.max_bytes:
+            await asyncio.to_thread(self.evict)
+
+    def stats(self) -> Dict[str, object]:
+        entries = self._entries()
+        return {
+            "root": self.root,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "fills": self.fills,
+            "evictions": self.evictions,
+        }
+
+    def evict(self) -> int:
+        """Drop least-recently-used, unpinned entries until under ``max_bytes``."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            lock_fd = self._open_lock(path)
+            try:
+                try:
+                    fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue  # in use by some reader
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    continue
+                # Still under the exclusive flock; anyone who opened the old
+                # lock file notices and reopens (``_lock_is_current``).
+                try:
+                    os.unlink(path + _LOCK_SUFFIX)
+                except FileNotFoundError:
+                    pass
+            finally:
+                os.close(lock_fd)
+            total -= size
+            removed += 1
+        if removed:
+            self.evictions += removed
+            logger.info(
+                "Video cache evicted %s entries; %s bytes remain (budget %s)",
+                removed,
+                total,
+                self.max_bytes,
+            )
+        return removed
+
+    async def _fill(self, minio: MinioDB, object_name: str, path: str) -> None:
+        # Only the exclusive-lock holder gets here, so any part file is a
+        # leftover from a crashed fill.
+        for stale in glob.glob(glob.escape(path) + _PART_MARKER + "*"):
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass
+        part = f"{path}{_PART_MARKER}{uuid.uuid4().hex}"
+        try:
+            size = await minio.download_to_path(object_name, part)
+            os.replace(part, path)
+        except BaseException:
+            try:
+                os.unlink(part)
+            except OSError:
+                pass
+            raise
+        self.fills += 1
+        logger.info(
+            "Video cache filled %s (%s bytes) -> %s", object_name, size, path
+        )
+
+    def _open_lock(self, path: str) -> int:
+        os.makedirs(self.root, exist_ok=True)
+        return os.open(path + _LOCK_SUFFIX, os.O_RDWR | os.O_CREAT, 0o644)
+
+    async def _reopen_lock(self, lock_fd: int, path: str) -> int:
+        # Eviction unlinked the lock file we were waiting on; a lock on the
+        # orphaned inode excludes nobody, so start over on a fresh file.
+        fresh = await asyncio.to_thread(self._open_lock, path)
+        os.close(lock_fd)
+        return fresh
+
+    @staticmethod
+    def _lock_is_current(lock_fd: int, path: str) -> bool:
+        """True if ``lock_fd`` is still the lock file at ``path``'s lock path."""
+        try:
+            st = os.stat(path + _LOCK_SUFFIX)
+        except FileNotFoundError:
+            return False
+        held = os.fstat(lock_fd)
+        return (held.st_dev, held.st_ino) == (st.st_dev, st.st_ino)
+
+    def _entries(self) -> List[Tuple[str, int, float]]:
+        """(path, size, mtime) of every complete entry."""
+        entries: List[Tuple[str, int, float]] = []
+        try:
+            names = os.listdir(self.root)
+        except FileNotFoundError:
+            return entries
+        for name in names:
+            if name.endswith(_LOCK_SUFFIX) or _PART_MARKER in name:
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, st.st_size, st.st_mtime))
+        return entries
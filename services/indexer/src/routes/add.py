@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from typing import DefaultDict, List
+from typing import DefaultDict, List, Optional
+from uuid import UUID
 
 import numpy as np
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 
+from exports.faiss_meta import HitMetadata, MediaInfo
 from exports.schema.constants import CLIP_DIMENSION, VectorType
 from exports.schema.models import (
     AddVectorItem,
@@ -15,13 +17,56 @@ from exports.schema.models import (
     EmbeddingCreate,
 )
 from exports.utils.logger import get_logger
+from exports.utils.vector_wire import vector_body
 
 router = APIRouter()
 logger = get_logger()
 
 
+def _hit_metadata(media_id: UUID, item: AddVectorItem) -> Optional[HitMetadata]:
+    if item.metadata is None:
+        return None
+    meta = item.metadata
+    row_id = item.frame_id or item.transcript_id or item.caption_id
+    return HitMetadata(
+        media_id=media_id,
+        row_id=row_id,
+        timestamp=meta.timestamp,
+        start_time=meta.start_time,
+        end_time=meta.end_time,
+        frame_id=meta.frame_id or item.frame_id,
+        frame_url=meta.frame_url,
+        text=meta.text,
+    )
+
+
+def _schedule_compaction(app, faiss_registry) -> None:
+    """Fold oversized vector logs into snapshots without blocking the request.
+
+    At most one compaction runs at a time; the task handle lives on
+    ``app.state.faiss_compaction_task``.
+    """
+    task = getattr(app.state, "faiss_compaction_task", None)
+    if task is not None and not task.done():
+        return
+
+    async def _compact() -> None:
+        try:
+            await asyncio.to_thread(faiss_registry.compact)
+        except Exception:
+            logger.exception(
+                "FAISS background compaction failed (path=%s)",
+                faiss_registry.base_dir,
+            )
+
+    app.state.faiss_compaction_task = asyncio.create_task(_compact())
+
+
 @router.post("/", response_model=AddVectorsResponse)
-async def add_vectors(request: Request, body: AddVectorsRequest) -> AddVectorsResponse:
+async def add_vectors(
+    request: Request,
+    body: AddVectorsRequest = Depends(vector_body(AddVectorsRequest)),
+) -> AddVectorsResponse:
     """Add normalized vectors to FAISS and insert matching `embeddings` rows."""
     if not body.vectors:
         return AddVectorsResponse(count=0)
@@ -46,18 +91,46 @@ async def add_vectors(request: Request, body: AddVectorsRequest) -> AddVectorsRe
 
     rows: List[EmbeddingCreate] = []
 
+    # Serializes ingest batches so FAISS ids and `embeddings` rows stay in
+    # step. Searches never take this lock; they only wait on the registry's
+    # internal write lock for the in-memory add itself. Each add is fsynced
+    # to the vector log, so no full index write happens per request.
     async with lock:
+        if body.media is not None:
+            await asyncio.to_thread(
+                faiss_registry.put_media,
+                MediaInfo(
+                    media_id=body.media_id,
+                    media_type=body.media.media_type.value,
+                    file_name=body.media.file_name,
+                    file_url=body.media.file_url,
+                ),
+            )
         for vector_type, items in by_type.items():
             matrix = np.asarray(
                 [item.embedding for item in items],
                 dtype=np.float32,
             )
+            metadata = [_hit_metadata(body.media_id, item) for item in items]
             try:
                 faiss_ids = await asyncio.to_thread(
-                    faiss_registry.add, vector_type, matrix
+                    faiss_registry.add,
+                    vector_type,
+                    matrix,
+                    metadata if any(metadata) else None,
                 )
             except ValueError as e:
                 raise HTTPException(status_code=400, detail=str(e)) from e
+            except OSError:
+                logger.exception(
+                    "FAISS vector log append failed (path=%s, vector_type=%s)",
+                    faiss_registry.base_dir,
+                    vector_type.value,
+                )
+                raise HTTPException(
+                    status_code=500,
+                    detail="Persisting vectors to the FAISS vector log failed.",
+                ) from None
 
             for item, faiss_index_id in zip(items, faiss_ids, strict=True):
                 rows.append(
@@ -85,17 +158,7 @@ async def add_vectors(request: Request, body: AddVectorsRequest) -> AddVectorsRe
                 detail="Failed to persist embedding metadata after indexing vectors.",
             ) from None
 
-        try:
-            await asyncio.to_thread(faiss_registry.save)
-        except Exception:
-            logger.exception(
-                "FAISS save failed after successful DB write (path=%s)",
-                faiss_registry.base_dir,
-            )
-            raise HTTPException(
-                status_code=500,
-                detail="Vectors were indexed and saved to the database, "
-                "but persisting the FAISS index to disk failed.",
-            ) from None
+    if faiss_registry.needs_compaction:
+        _schedule_compaction(request.app, faiss_registry)
 
     return AddVectorsResponse(count=len(rows))
@@ -1,25 +1,101 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
+from typing import DefaultDict, Dict, List
 
 import numpy as np
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 
-from exports.schema.constants import CLIP_DIMENSION, DEFAULT_TOP_K, VectorType
+from exports.faiss_store import FaissIndexRegistry, SearchParams
+from exports.schema.constants import CLIP_DIMENSION, INDEXER_MAX_TOP_K, VectorType
 from exports.schema.models import (
+    BatchSearchVectorsRequest,
+    BatchSearchVectorsResponse,
+    IndexedHitMetadata,
+    IndexedMedia,
     IndexerVectorHit,
     SearchVectorsRequest,
     SearchVectorsResponse,
+    SimilarVectorsRequest,
 )
 from exports.utils.logger import get_logger
+from exports.utils.vector_wire import vector_body
 
 router = APIRouter()
 logger = get_logger()
 
 
+def _search_params(
+    body: SearchVectorsRequest | BatchSearchVectorsRequest | SimilarVectorsRequest,
+) -> SearchParams:
+    for name, value in (
+        ("nprobe", body.nprobe),
+        ("ef_search", body.ef_search),
+        ("rerank_factor", body.rerank_factor),
+    ):
+        if value is not None and value < 1:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{name} must be at least 1",
+            )
+    return SearchParams(
+        nprobe=body.nprobe,
+        ef_search=body.ef_search,
+        rerank_factor=body.rerank_factor,
+    )
+
+
+def _faiss_registry(request: Request):
+    faiss_registry = getattr(request.app.state, "faiss", None)
+    if faiss_registry is None:
+        raise HTTPException(
+            status_code=503,
+            detail="FAISS index is not available (check FAISS_INDEX_PATH and startup logs).",
+        )
+    return faiss_registry
+
+
+def _attach_metadata(
+    faiss_registry: FaissIndexRegistry, hits: List[IndexerVectorHit]
+) -> None:
+    """Fill ``hit.metadata`` from the sidecar; hits without a row stay bare."""
+    by_type: DefaultDict[VectorType, List[IndexerVectorHit]] = defaultdict(list)
+    for hit in hits:
+        by_type[hit.vector_type].append(hit)
+    for vector_type, typed_hits in by_type.items():
+        rows = faiss_registry.hit_metadata(
+            vector_type, [hit.faiss_index_id for hit in typed_hits]
+        )
+        for hit, row in zip(typed_hits, rows, strict=True):
+            if row is None:
+                continue
+            media = faiss_registry.media_info(row.media_id)
+            hit.metadata = IndexedHitMetadata(
+                media_id=row.media_id,
+                row_id=row.row_id,
+                timestamp=row.timestamp,
+                start_time=row.start_time,
+                end_time=row.end_time,
+                frame_id=row.frame_id,
+                frame_url=row.frame_url,
+                text=row.text,
+                media=(
+                    IndexedMedia(
+                        media_type=media.media_type,
+                        file_name=media.file_name,
+                        file_url=media.file_url,
+                    )
+                    if media is not None
+                    else None
+                ),
+            )
+
+
 @router.post("/", response_model=SearchVectorsResponse)
 async def search_vectors(
-    request: Request, body: SearchVectorsRequest
+    request: Request,
+    body: SearchVectorsRequest = Depends(vector_body(SearchVectorsRequest)),
 ) -> SearchVectorsResponse:
     """Nearest-neighbour search; returns FAISS ids, scores, and vector type."""
     if len(body.embedding) != CLIP_DIMENSION:
@@ -35,44 +111,44 @@ async def search_vectors(
             status_code=400,
             detail="top_k must be at least 1",
         )
-    top_k = min(body.top_k, DEFAULT_TOP_K)
+    top_k = min(body.top_k, INDEXER_MAX_TOP_K)
+    params = _search_params(body)
 
-    faiss_registry = getattr(request.app.state, "faiss", None)
-    lock: asyncio.Lock | None = getattr(request.app.state, "indexer_write_lock", None)
-    if faiss_registry is None or lock is None:
-        raise HTTPException(
-            status_code=503,
-            detail="FAISS index is not available (check FAISS_INDEX_PATH and startup logs).",
-        )
+    # No route-level lock: the registry's readers-writer lock lets searches
+    # run in parallel on the thread pool and only excludes in-memory adds.
+    faiss_registry = _faiss_registry(request)
 
     q = np.asarray(body.embedding, dtype=np.float32)
 
-    async with lock:
-        try:
-            if body.vector_type is None:
-                raw = await asyncio.to_thread(faiss_registry.search_all, q, top_k)
-                hits = [
-                    IndexerVectorHit(
-                        faiss_index_id=faiss_index_id,
-                        similarity_score=score,
-                        vector_type=vector_type,
-                    )
-                    for vector_type, faiss_index_id, score in raw
-                ]
-            else:
-                raw = await asyncio.to_thread(
-                    faiss_registry.search, body.vector_type, q, top_k
+    try:
+        if body.vector_type is None:
+            raw = await asyncio.to_thread(
+                faiss_registry.search_all, q, top_k, params
+            )
+            hits = [
+                IndexerVectorHit(
+                    faiss_index_id=faiss_index_id,
+                    similarity_score=score,
+                    vector_type=vector_type,
                 )
-                hits = [
-                    IndexerVectorHit(
-                        faiss_index_id=faiss_index_id,
-                        similarity_score=score,
-                        vector_type=body.vector_type,
-                    )
-                    for faiss_index_id, score in raw
-                ]
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e)) from e
+                for vector_type, faiss_index_id, score in raw
+            ]
+        else:
+            raw = await asyncio.to_thread(
+                faiss_registry.search, body.vector_type, q, top_k, params
+            )
+            hits = [
+                IndexerVectorHit(
+                    faiss_index_id=faiss_index_id,
+                    similarity_score=score,
+                    vector_type=body.vector_type,
+                )
+                for faiss_index_id, score in raw
+            ]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if body.include_metadata:
+        _attach_metadata(faiss_registry, hits)
 
     logger.info(
         "vectors/search top_k=%s vector_type=%s returned=%s",
@@ -81,3 +157,111 @@ async def search_vectors(
         len(hits),
     )
     return SearchVectorsResponse(hits=hits)
+
+
+def _top_k_by_type(top_k: Dict[VectorType, int]) -> Dict[VectorType, int]:
+    top_k_by_type = {}
+    for vector_type, k in top_k.items():
+        if k < 1:
+            raise HTTPException(
+                status_code=400,
+                detail=f"top_k[{vector_type.value}] must be at least 1",
+            )
+        top_k_by_type[vector_type] = min(k, INDEXER_MAX_TOP_K)
+    return top_k_by_type
+
+
+@router.post("/batch", response_model=BatchSearchVectorsResponse)
+async def search_vectors_batch(
+    request: Request,
+    body: BatchSearchVectorsRequest = Depends(vector_body(BatchSearchVectorsRequest)),
+) -> BatchSearchVectorsResponse:
+    """Search N queries against each modality in ``top_k`` with one FAISS call per index."""
+    if not body.embeddings:
+        return BatchSearchVectorsResponse(results=[])
+    for i, embedding in enumerate(body.embeddings):
+        if len(embedding) != CLIP_DIMENSION:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"embeddings[{i}] has length {len(embedding)}, "
+                    f"expected CLIP_DIMENSION={CLIP_DIMENSION}"
+                ),
+            )
+    top_k_by_type = _top_k_by_type(body.top_k)
+    params = _search_params(body)
+    faiss_registry = _faiss_registry(request)
+
+    queries = np.asarray(body.embeddings, dtype=np.float32)
+
+    try:
+        raw = await asyncio.to_thread(
+            faiss_registry.search_batch, queries, top_k_by_type, params
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    results = [
+        [
+            IndexerVectorHit(
+                faiss_index_id=faiss_index_id,
+                similarity_score=score,
+                vector_type=vector_type,
+            )
+            for vector_type, faiss_index_id, score in row
+        ]
+        for row in raw
+    ]
+    if body.include_metadata:
+        _attach_metadata(faiss_registry, [hit for row in results for hit in row])
+    logger.info(
+        "vectors/search/batch queries=%s top_k=%s returned=%s",
+        len(body.embeddings),
+        {vt.value: k for vt, k in top_k_by_type.items()},
+        sum(len(row) for row in results),
+    )
+    return BatchSearchVectorsResponse(results=results)
+
+
+@router.post("/similar", response_model=SearchVectorsResponse)
+async def search_similar(
+    request: Request, body: SimilarVectorsRequest
+) -> SearchVectorsResponse:
+    """Search each modality in ``top_k`` with an already-indexed vector as the query.
+
+    The vector is reconstructed from its FAISS store, so nothing is re-embedded
+    and no vector crosses the wire. The seed itself is not returned.
+    """
+    top_k_by_type = _top_k_by_type(body.top_k)
+    params = _search_params(body)
+    faiss_registry = _faiss_registry(request)
+
+    try:
+        raw = await asyncio.to_thread(
+            faiss_registry.search_similar,
+            body.vector_type,
+            body.faiss_index_id,
+            top_k_by_type,
+            params,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    hits = [
+        IndexerVectorHit(
+            faiss_index_id=faiss_index_id,
+            similarity_score=score,
+            vector_type=vector_type,
+        )
+        for vector_type, faiss_index_id, score in raw
+    ]
+    if body.include_metadata:
+        _attach_metadata(faiss_registry, hits)
+    logger.info(
+        "vectors/search/similar seed=%s:%s top_k=%s returned=%s",
+        body.vector_type.value,
+        body.faiss_index_id,
+        {vt.value: k for vt, k in top_k_by_type.items()},
+        len(hits),
+    )
+    return SearchVectorsResponse(hits=hits)
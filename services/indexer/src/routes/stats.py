@@ -1,30 +1,31 @@
 from __future__ import annotations
 
 import asyncio
-import os
 from typing import Dict
 
-import faiss
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Request
 
-from exports.faiss_store import FaissIndexRegistry
+from exports.faiss_store import FaissIndexRegistry, FaissVectorStore, IndexManifest
 from exports.schema.constants import VectorType
+from exports.schema.models import IndexGenerationResponse
 
 router = APIRouter()
 
 
-def _disk_ntotal(index_path: str) -> int:
-    """Get the number of vectors on disk."""
-    if not index_path or not os.path.exists(index_path):
-        return 0
-    disk_index = faiss.read_index(index_path)
-    return int(disk_index.ntotal)
+def _disk_ntotal(store: FaissVectorStore, manifest: IndexManifest | None) -> int:
+    """Vectors on disk: the snapshot manifest's count, extended by the vector log."""
+    snapshot = manifest.ntotal if manifest is not None else 0
+    return max(snapshot, store.log.end_id())
 
 
 def _collect_stats(faiss_registry: FaissIndexRegistry) -> dict:
     ntotal: Dict[str, int] = {}
     max_id: Dict[str, int | None] = {}
     disk_ntotal: Dict[str, int] = {}
+    index_type: Dict[str, str] = {}
+    index_mmapped: Dict[str, bool] = {}
+    raw_rows_missing: Dict[str, int] = {}
+    last_saved_at: Dict[str, str | None] = {}
 
     for vector_type in VectorType:
         store = faiss_registry.store_for(vector_type)
@@ -32,7 +33,13 @@ def _collect_stats(faiss_registry: FaissIndexRegistry) -> dict:
         key = vector_type.value
         ntotal[key] = count
         max_id[key] = count - 1 if count > 0 else None
-        disk_ntotal[key] = _disk_ntotal(store.path)
+        manifest = store.manifest()
+        disk_ntotal[key] = _disk_ntotal(store, manifest)
+        last_saved_at[key] = manifest.saved_at if manifest is not None else None
+        index_type[key] = store.kind.value
+        index_mmapped[key] = store.is_mapped
+        # Non-zero means the raw sidecar lags the index: no exact re-ranking.
+        raw_rows_missing[key] = store.raw_rows_missing
 
     # check if the number of vectors on disk is different from the number of vectors in memory
     memory_disk_drift = any(
@@ -45,9 +52,14 @@ def _collect_stats(faiss_registry: FaissIndexRegistry) -> dict:
         "ready": True,
         "ntotal": ntotal,
         "ntotal_sum": sum(ntotal.values()),
+        "generation": faiss_registry.generation,
         "max_id": max_id,
         "disk_ntotal": disk_ntotal,
         "memory_disk_drift": memory_disk_drift,
+        "index_type": index_type,
+        "index_mmapped": index_mmapped,
+        "raw_rows_missing": raw_rows_missing,
+        "last_saved_at": last_saved_at,
         "index_path": faiss_registry.base_dir,
     }
 
@@ -65,11 +77,30 @@ async def index_stats(request: Request) -> dict:
             "ready": False,
             "ntotal": {vt.value: 0 for vt in VectorType},
             "ntotal_sum": 0,
+            "generation": None,
             "max_id": {vt.value: None for vt in VectorType},
             "disk_ntotal": {vt.value: 0 for vt in VectorType},
             "memory_disk_drift": False,
+            "index_type": {vt.value: None for vt in VectorType},
+            "index_mmapped": {vt.value: False for vt in VectorType},
+            "raw_rows_missing": {vt.value: 0 for vt in VectorType},
+            "last_saved_at": {vt.value: None for vt in VectorType},
             "index_path": None,
         }
 
     # collect stats in a separate thread to avoid blocking the main thread
     return await asyncio.to_thread(_collect_stats, faiss_registry)
+
+
+@router.get("/generation", response_model=IndexGenerationResponse)
+async def index_generation(request: Request) -> IndexGenerationResponse:
+    """Cheap change counter for API-side result caches (bumped on every add)."""
+    faiss_registry: FaissIndexRegistry | None = getattr(
+        request.app.state, "faiss", None
+    )
+    if faiss_registry is None:
+        raise HTTPException(
+            status_code=503,
+            detail="FAISS index is not available (check FAISS_INDEX_PATH and startup logs).",
+        )
+    return IndexGenerationResponse(generation=faiss_registry.generation)
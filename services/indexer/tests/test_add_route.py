@@ -0,0 +1,51 @@
+"""POST /vectors/add handler against a real registry and a fake Supabase."""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from exports.faiss_store import FaissIndexRegistry
+from exports.schema.constants import CLIP_DIMENSION, VectorType
+from exports.schema.models import AddVectorItem, AddVectorsRequest
+
+from src.routes.add import add_vectors
+
+
+class _Supabase:
+    def __init__(self) -> None:
+        self.rows = []
+
+    async def insert_embeddings_batch(self, rows) -> None:
+        self.rows.extend(rows)
+
+
+def test_add_reports_the_number_of_indexed_vectors(tmp_path) -> None:
+    registry = FaissIndexRegistry(str(tmp_path))
+    registry.load()
+    supabase = _Supabase()
+    vector = [1.0] + [0.0] * (CLIP_DIMENSION - 1)
+    body = AddVectorsRequest(
+        media_id=uuid4(),
+        vectors=[
+            AddVectorItem(frame_id=uuid4(), embedding=vector),
+            AddVectorItem(frame_id=uuid4(), embedding=vector),
+            AddVectorItem(
+                transcript_id=uuid4(), embedding=vector, vector_type=VectorType.TEXT
+            ),
+        ],
+    )
+
+    async def run():
+        state = SimpleNamespace(
+            faiss=registry,
+            supabase=supabase,
+            indexer_write_lock=asyncio.Lock(),
+            faiss_compaction_task=None,
+        )
+        request = SimpleNamespace(app=SimpleNamespace(state=state))
+        return await add_vectors(request, body)
+
+    response = asyncio.run(run())
+    assert response.count == 3
+    assert len(supabase.rows) == 3
+    assert registry.ntotal == 3
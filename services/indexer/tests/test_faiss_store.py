@@ -0,0 +1,444 @@
+"""Unit tests for the per-modality FAISS stores (small dimension, no service)."""
+
+import hashlib
+import threading
+
+import numpy as np
+import pytest
+
+from exports.faiss_store import (
+    FaissIndexRegistry,
+    FaissVectorStore,
+    IndexKind,
+    IndexSpec,
+    SearchParams,
+)
+from exports.schema.constants import VectorType
+
+DIM = 8
+
+
+def _unit_vectors(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _store(tmp_path, spec: IndexSpec) -> FaissVectorStore:
+    store = FaissVectorStore(str(tmp_path / "image.index"), dimension=DIM, spec=spec)
+    store.load()
+    return store
+
+
+def test_flat_store_returns_exact_neighbour(tmp_path) -> None:
+    store = _store(tmp_path, IndexSpec())
+    vectors = _unit_vectors(20)
+    assert store.add(vectors) == list(range(20))
+    hits = store.search(vectors[7], 3)
+    assert hits[0][0] == 7
+    assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_hnsw_store_is_built_immediately(tmp_path) -> None:
+    store = _store(tmp_path, IndexSpec(kind=IndexKind.HNSW, hnsw_m=8))
+    assert store.kind == IndexKind.HNSW
+    vectors = _unit_vectors(50)
+    store.add(vectors)
+    hits = store.search(vectors[11], 5, SearchParams(ef_search=1))
+    assert len(hits) == 5
+    assert hits[0][0] == 11
+
+
+def test_ivf_store_stays_flat_until_trainable(tmp_path) -> None:
+    spec = IndexSpec(kind=IndexKind.IVF_FLAT, ivf_nlist=4, ivf_train_points_per_list=10)
+    store = _store(tmp_path, spec)
+    store.add(_unit_vectors(39))
+    assert store.kind == IndexKind.FLAT
+    assert not store.needs_rebuild
+
+    store.add(_unit_vectors(1, seed=1))
+    assert store.needs_rebuild
+
+
+def test_rebuild_preserves_ids(tmp_path) -> None:
+    spec = IndexSpec(kind=IndexKind.IVF_FLAT, ivf_nlist=4, ivf_train_points_per_list=10)
+    store = _store(tmp_path, spec)
+    vectors = _unit_vectors(60)
+    store.add(vectors)
+    store.rebuild()
+    assert store.kind == IndexKind.IVF_FLAT
+    assert store.ntotal == 60
+    for i in (0, 25, 59):
+        hits = store.search(vectors[i], 1, SearchParams(nprobe=4))
+        assert hits[0][0] == i
+
+
+def test_registry_add_trains_ivf_and_persists_kind(tmp_path) -> None:
+    specs = {
+        VectorType.IMAGE: IndexSpec(
+            kind=IndexKind.IVF_FLAT, ivf_nlist=2, ivf_train_points_per_list=10
+        ),
+    }
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM, specs=specs)
+    registry.load()
+    registry.add(VectorType.IMAGE, _unit_vectors(25))
+    assert registry.store_for(VectorType.IMAGE).kind == IndexKind.IVF_FLAT
+    assert registry.store_for(VectorType.TEXT).kind == IndexKind.FLAT
+    registry.save()
+
+    reloaded = FaissIndexRegistry(str(tmp_path), dimension=DIM, specs=specs)
+    reloaded.load()
+    assert reloaded.store_for(VectorType.IMAGE).kind == IndexKind.IVF_FLAT
+    assert reloaded.ntotal == 25
+
+
+def test_search_finishes_while_a_rebuild_trains(tmp_path) -> None:
+    specs = {
+        VectorType.IMAGE: IndexSpec(
+            kind=IndexKind.IVF_FLAT, ivf_nlist=2, ivf_train_points_per_list=10
+        ),
+    }
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM, specs=specs)
+    registry.load()
+    store = registry.store_for(VectorType.IMAGE)
+    vectors = _unit_vectors(25)
+    registry.add(VectorType.IMAGE, vectors[:19])
+
+    building, release = threading.Event(), threading.Event()
+    build_index = store.build_index
+
+    def slow_build_index(source):
+        building.set()
+        assert release.wait(5)
+        return build_index(source)
+
+    store.build_index = slow_build_index
+    adder = threading.Thread(
+        target=registry.add, args=(VectorType.IMAGE, vectors[19:20])
+    )
+    adder.start()
+    assert building.wait(5)
+
+    hits = []
+    searcher = threading.Thread(
+        target=lambda: hits.extend(registry.search(VectorType.IMAGE, vectors[3], 1))
+    )
+    searcher.start()
+    searcher.join(5)
+    assert not searcher.is_alive()
+    assert hits[0][0] == 3
+    # Adds are not blocked either; the rebuild catches them up before the swap.
+    registry.add(VectorType.IMAGE, vectors[20:])
+
+    release.set()
+    adder.join(5)
+    assert store.kind == IndexKind.IVF_FLAT
+    assert store.ntotal == 25
+    assert registry.search(VectorType.IMAGE, vectors[24], 1, SearchParams(nprobe=2))[0][0] == 24
+
+
+def test_sq_fp16_store_keeps_raw_sidecar(tmp_path) -> None:
+    store = _store(tmp_path, IndexSpec(kind=IndexKind.SQ_FP16))
+    assert store.kind == IndexKind.SQ_FP16
+    vectors = _unit_vectors(30)
+    store.add(vectors)
+    assert (tmp_path / "image.index.vectors").stat().st_size == 30 * DIM * 4
+    hits = store.search(vectors[3], 2)
+    assert hits[0][0] == 3
+    # Re-ranked scores are exact inner products, not fp16 approximations.
+    assert hits[0][1] == pytest.approx(float(vectors[3] @ vectors[3]), abs=1e-6)
+
+
+def test_ivf_pq_rerank_restores_exact_top_hit(tmp_path) -> None:
+    spec = IndexSpec(
+        kind=IndexKind.IVF_PQ,
+        ivf_nlist=2,
+        ivf_train_points_per_list=4,
+        pq_m=2,
+        pq_nbits=4,
+    )
+    store = _store(tmp_path, spec)
+    vectors = _unit_vectors(200)
+    store.add(vectors)
+    store.rebuild()
+    assert store.kind == IndexKind.IVF_PQ
+
+    hits = store.search(vectors[42], 5, SearchParams(nprobe=2, rerank_factor=10))
+    assert hits[0][0] == 42
+    assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+    scores = [score for _, score in hits]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_load_truncates_unsaved_raw_rows(tmp_path) -> None:
+    store = _store(tmp_path, IndexSpec(kind=IndexKind.SQ_FP16))
+    store.add(_unit_vectors(5))
+    store.save()
+    store.add(_unit_vectors(3, seed=1))  # never saved
+
+    reloaded = _store(tmp_path, IndexSpec(kind=IndexKind.SQ_FP16))
+    assert reloaded.ntotal == 5
+    assert (tmp_path / "image.index.vectors").stat().st_size == 5 * DIM * 4
+
+
+def test_rebuild_refills_raw_sidecar_only_from_exact_vectors(tmp_path) -> None:
+    vectors = _unit_vectors(30)
+    flat = _store(tmp_path, IndexSpec())
+    flat.add(vectors)
+    flat.save()
+
+    # Switching a flat index to fp16: the flat index still holds exact vectors.
+    fp16 = _store(tmp_path, IndexSpec(kind=IndexKind.SQ_FP16))
+    assert fp16.raw_rows_missing == 30
+    fp16.rebuild()
+    assert fp16.kind == IndexKind.SQ_FP16
+    assert fp16.raw_rows_missing == 0
+    raw = np.fromfile(tmp_path / "image.index.vectors", dtype="<f4").reshape(-1, DIM)
+    np.testing.assert_array_equal(raw, vectors)
+    fp16.save()
+
+    # A short sidecar next to a compressed index cannot be refilled exactly.
+    with open(tmp_path / "image.index.vectors", "r+b") as f:
+        f.truncate(10 * DIM * 4)
+    reloaded = _store(tmp_path, IndexSpec(kind=IndexKind.SQ_FP16))
+    reloaded.rebuild()
+    assert reloaded.raw_rows_missing == 20
+    assert (tmp_path / "image.index.vectors").stat().st_size == 10 * DIM * 4
+
+
+def test_mmap_load_searches_then_unmaps_on_add(tmp_path) -> None:
+    spec = IndexSpec(kind=IndexKind.IVF_FLAT, ivf_nlist=2, ivf_train_points_per_list=10)
+    store = _store(tmp_path, spec)
+    vectors = _unit_vectors(40)
+    store.add(vectors)
+    store.rebuild()
+    store.save()
+
+    mapped = FaissVectorStore(
+        str(tmp_path / "image.index"), dimension=DIM, spec=spec, mmap=True
+    )
+    mapped.load()
+    assert mapped.is_mapped
+    assert mapped.search(vectors[9], 1, SearchParams(nprobe=2))[0][0] == 9
+
+    assert mapped.add(_unit_vectors(2, seed=1)) == [40, 41]
+    assert not mapped.is_mapped
+    mapped.save()
+    assert mapped.kind == IndexKind.IVF_FLAT
+    assert mapped.search(vectors[30], 1, SearchParams(nprobe=2))[0][0] == 30
+
+
+def test_registry_copies_mapped_index_while_searches_run(tmp_path) -> None:
+    vectors = _unit_vectors(20)
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    registry.load()
+    registry.add(VectorType.IMAGE, vectors)
+    registry.save()
+
+    mapped = FaissIndexRegistry(str(tmp_path), dimension=DIM, mmap=True)
+    mapped.load()
+    store = mapped.store_for(VectorType.IMAGE)
+    assert store.is_mapped
+
+    copying, release = threading.Event(), threading.Event()
+    unmapped_copy = store.unmapped_copy
+
+    def slow_unmapped_copy():
+        copying.set()
+        assert release.wait(5)
+        return unmapped_copy()
+
+    store.unmapped_copy = slow_unmapped_copy
+    adder = threading.Thread(
+        target=mapped.add, args=(VectorType.IMAGE, _unit_vectors(2, seed=1))
+    )
+    adder.start()
+    assert copying.wait(5)
+    assert mapped.search(VectorType.IMAGE, vectors[4], 1)[0][0] == 4
+    release.set()
+    adder.join(5)
+    assert not store.is_mapped
+    assert store.ntotal == 22
+
+
+def test_mmap_load_with_pending_log_reads_the_index_owned(tmp_path) -> None:
+    store = _store(tmp_path, IndexSpec())
+    store.add(_unit_vectors(5))
+    store.save()
+    extra = _unit_vectors(2, seed=1)
+    store.append_log(5, extra)
+
+    mapped = FaissVectorStore(
+        str(tmp_path / "image.index"), dimension=DIM, spec=IndexSpec(), mmap=True
+    )
+    mapped.load()
+    assert not mapped.is_mapped
+    assert mapped.ntotal == 7
+    assert mapped.search(extra[1], 1)[0][0] == 6
+
+
+def test_save_writes_manifest(tmp_path) -> None:
+    store = _store(tmp_path, IndexSpec())
+    assert store.manifest() is None
+    store.add(_unit_vectors(7))
+    store.save()
+
+    manifest = store.manifest()
+    assert manifest is not None
+    assert manifest.ntotal == 7
+    assert manifest.dimension == DIM
+    assert manifest.index_type == IndexKind.FLAT.value
+    on_disk = (tmp_path / "image.index").read_bytes()
+    assert manifest.sha256 == hashlib.sha256(on_disk).hexdigest()
+
+
+def test_load_backfills_missing_manifest(tmp_path) -> None:
+    store = _store(tmp_path, IndexSpec())
+    store.add(_unit_vectors(4))
+    store.save()
+    (tmp_path / "image.index.manifest.json").unlink()
+
+    reloaded = _store(tmp_path, IndexSpec())
+    assert reloaded.manifest().ntotal == 4
+
+
+def test_registry_search_batch_matches_single_searches(tmp_path) -> None:
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    registry.load()
+    images, captions = _unit_vectors(30), _unit_vectors(20, seed=1)
+    registry.add(VectorType.IMAGE, images)
+    registry.add(VectorType.CAPTION, captions)
+    queries = np.stack([images[4], captions[9]])
+
+    results = registry.search_batch(
+        queries, {VectorType.IMAGE: 3, VectorType.CAPTION: 2}
+    )
+    assert len(results) == 2
+    for query, row in zip(queries, results):
+        expected = [
+            (VectorType.IMAGE, i, s) for i, s in registry.search(VectorType.IMAGE, query, 3)
+        ] + [
+            (VectorType.CAPTION, i, s)
+            for i, s in registry.search(VectorType.CAPTION, query, 2)
+        ]
+        assert [(vt, i) for vt, i, _ in row] == [(vt, i) for vt, i, _ in expected]
+    assert results[0][0][:2] == (VectorType.IMAGE, 4)
+    assert results[1][3][:2] == (VectorType.CAPTION, 9)
+
+
+def test_registry_search_similar_reconstructs_seed_and_skips_it(tmp_path) -> None:
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    registry.load()
+    images, captions = _unit_vectors(30), _unit_vectors(20, seed=1)
+    registry.add(VectorType.IMAGE, images)
+    registry.add(VectorType.CAPTION, captions)
+    np.testing.assert_allclose(
+        registry.store_for(VectorType.IMAGE).reconstruct(4), images[4], atol=1e-6
+    )
+
+    hits = registry.search_similar(
+        VectorType.IMAGE, 4, {VectorType.IMAGE: 3, VectorType.CAPTION: 2}
+    )
+    expected = registry.search_batch(
+        images[4:5], {VectorType.IMAGE: 4, VectorType.CAPTION: 2}
+    )[0]
+    assert [(vt, i) for vt, i, _ in hits] == [
+        (vt, i) for vt, i, _ in expected if (vt, i) != (VectorType.IMAGE, 4)
+    ]
+    with pytest.raises(ValueError):
+        registry.search_similar(VectorType.CAPTION, 20, {VectorType.IMAGE: 3})
+
+
+def test_hit_metadata_sidecar_survives_reload(tmp_path) -> None:
+    from uuid import uuid4
+
+    from exports.faiss_meta import HitMetadata, MediaInfo
+
+    media_id = uuid4()
+    rows = [
+        HitMetadata(media_id=media_id, row_id=uuid4(), timestamp=float(i), text=f"t{i}")
+        for i in range(3)
+    ]
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    registry.load()
+    registry.put_media(MediaInfo(media_id, "video", "clip.mp4", "http://x/clip.mp4"))
+    registry.add(VectorType.TEXT, _unit_vectors(2))  # legacy rows, no metadata
+    ids = registry.add(VectorType.TEXT, _unit_vectors(3, seed=1), rows)
+    assert ids == [2, 3, 4]
+
+    reloaded = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    reloaded.load()
+    got = reloaded.hit_metadata(VectorType.TEXT, [0, 3, 9])
+    assert got[0] is None and got[2] is None
+    assert got[1] == rows[1]
+    assert reloaded.media_info(media_id).file_name == "clip.mp4"
+
+
+def test_hit_metadata_row_is_invisible_until_fully_written(tmp_path) -> None:
+    from uuid import uuid4
+
+    from exports.faiss_meta import HitMetadata, HitMetadataColumns
+
+    columns = HitMetadataColumns(str(tmp_path / "text.index.meta.jsonl"))
+    columns.load()
+    seen = []
+
+    class _Spy(list):
+        # The text column is written late in ``_put``; a concurrent reader
+        # polling ``get`` at that moment must not see a half-written row.
+        def append(self, value):
+            super().append(value)
+            seen.append(columns.get(len(self) - 1))
+
+        def __setitem__(self, i, value):
+            super().__setitem__(i, value)
+            seen.append(columns.get(i))
+
+    columns._texts = _Spy()
+    row = HitMetadata(media_id=uuid4(), row_id=uuid4(), timestamp=1.0, text="hi")
+    columns.append(1, [row])
+
+    assert seen and all(got is None for got in seen)
+    assert columns.get(1) == row
+
+
+def test_hit_metadata_truncate_and_compact_write_one_line_per_row(tmp_path) -> None:
+    from uuid import uuid4
+
+    from exports.faiss_meta import HitMetadata, HitMetadataColumns
+
+    path = tmp_path / "text.index.meta.jsonl"
+    columns = HitMetadataColumns(str(path))
+    columns.load()
+    rows = [
+        HitMetadata(media_id=uuid4(), row_id=uuid4(), timestamp=float(i)) for i in range(4)
+    ]
+    columns.append(0, rows[:3])
+    columns.append(2, [rows[2], rows[3]])  # re-applied batch overlaps id 2
+    assert len(path.read_text().splitlines()) == 2
+
+    columns.compact()
+    assert len(path.read_text().splitlines()) == 4
+    columns.compact()  # nothing left to drop: the file is untouched
+    assert len(path.read_text().splitlines()) == 4
+
+    columns.truncate(3)
+    assert len(path.read_text().splitlines()) == 3
+    reloaded = HitMetadataColumns(str(path))
+    reloaded.load()
+    assert reloaded.count == 3
+    assert reloaded.get_many(range(4)) == [*rows[:3], None]
+
+
+def test_registry_generation_grows_on_add_and_survives_reload(tmp_path) -> None:
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    registry.load()
+    assert registry.generation == 0
+    registry.add(VectorType.IMAGE, _unit_vectors(3))
+    after_first = registry.generation
+    registry.add(VectorType.CAPTION, _unit_vectors(2, seed=1))
+    assert 0 < after_first < registry.generation
+
+    reloaded = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    reloaded.load()
+    assert reloaded.generation == registry.generation
@@ -0,0 +1,188 @@
+"""Vector log durability: replay, torn tails and snapshot reset."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from exports.faiss_store import FaissIndexRegistry, FaissVectorStore, IndexKind, IndexSpec
+from exports.faiss_wal import VectorLog
+from exports.schema.constants import VectorType
+
+DIM = 8
+
+
+def _unit_vectors(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_replay_skips_covered_and_slices_partial_records(tmp_path) -> None:
+    log = VectorLog(str(tmp_path / "x.wal"), DIM)
+    first, second = _unit_vectors(4), _unit_vectors(3, seed=1)
+    log.append(0, first)
+    log.append(4, second)
+
+    records = log.replay_from(5)
+    assert [r.start_id for r in records] == [5]
+    np.testing.assert_array_equal(records[0].vectors, second[1:])
+    assert log.end_id() == 7
+    assert log.replay_from(7) == []
+
+
+def test_repair_cuts_torn_tail(tmp_path) -> None:
+    path = tmp_path / "x.wal"
+    log = VectorLog(str(path), DIM)
+    log.append(0, _unit_vectors(2))
+    intact = path.stat().st_size
+    log.append(2, _unit_vectors(2, seed=1))
+    with open(path, "r+b") as f:
+        f.truncate(path.stat().st_size - 5)
+
+    assert [r.end_id for r in log.records()] == [2]
+    log.repair()
+    assert path.stat().st_size == intact
+    log.append(2, _unit_vectors(1, seed=2))
+    assert [r.end_id for r in log.records()] == [2, 3]
+
+
+def test_registry_add_survives_crash_without_save(tmp_path) -> None:
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    registry.load()
+    vectors = _unit_vectors(10)
+    registry.add(VectorType.IMAGE, vectors[:6])
+    registry.add(VectorType.IMAGE, vectors[6:])
+    # No save(): simulate a crash by reloading from disk.
+
+    reloaded = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    reloaded.load()
+    assert reloaded.store_for(VectorType.IMAGE).ntotal == 10
+    hits = reloaded.search(VectorType.IMAGE, vectors[8], 1)
+    assert hits[0][0] == 8
+
+
+def test_failed_log_append_leaves_index_and_later_ids_consistent(
+    tmp_path, monkeypatch
+) -> None:
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    registry.load()
+    vectors = _unit_vectors(10)
+    registry.add(VectorType.IMAGE, vectors[:4])
+    log = registry.store_for(VectorType.IMAGE).log
+    real_append = log.append
+
+    def disk_full(start_id, batch):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(log, "append", disk_full)
+    with pytest.raises(OSError):
+        registry.add(VectorType.IMAGE, vectors[4:7])
+    # Never logged, so never searchable and its ids are not used up.
+    assert registry.store_for(VectorType.IMAGE).ntotal == 4
+    assert registry.generation == 4
+
+    monkeypatch.setattr(log, "append", real_append)
+    assert registry.add(VectorType.IMAGE, vectors[7:]) == [4, 5, 6]
+
+    reloaded = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    reloaded.load()
+    assert reloaded.store_for(VectorType.IMAGE).ntotal == 7
+    assert reloaded.search(VectorType.IMAGE, vectors[9], 1)[0][0] == 6
+
+
+def test_failed_in_memory_add_is_cut_from_the_log(tmp_path) -> None:
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    registry.load()
+    registry.add(VectorType.IMAGE, _unit_vectors(3))
+    size = registry.store_for(VectorType.IMAGE).log.size_bytes
+    with pytest.raises(ValueError):
+        registry.add(VectorType.IMAGE, np.ones((2, DIM + 1), dtype=np.float32))
+    assert registry.store_for(VectorType.IMAGE).log.size_bytes == size
+
+
+def test_save_writes_snapshot_and_resets_log(tmp_path) -> None:
+    spec = IndexSpec(kind=IndexKind.SQ_FP16)
+    store = FaissVectorStore(str(tmp_path / "image.index"), dimension=DIM, spec=spec)
+    store.load()
+    vectors = _unit_vectors(5)
+    store.append_log(store.add(vectors)[0], vectors)
+    assert store.log.size_bytes > 0
+
+    store.save()
+    assert store.log.size_bytes == 0
+    assert not (tmp_path / "image.index.tmp").exists()
+
+    reloaded = FaissVectorStore(str(tmp_path / "image.index"), dimension=DIM, spec=spec)
+    reloaded.load()
+    assert reloaded.ntotal == 5
+
+
+def test_snapshot_file_write_does_not_hold_the_search_lock(tmp_path, monkeypatch) -> None:
+    registry = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    registry.load()
+    vectors = _unit_vectors(10)
+    registry.add(VectorType.IMAGE, vectors[:6])
+    store = registry.store_for(VectorType.IMAGE)
+    real_write = store.write_snapshot
+    writer_got_lock = []
+
+    def slow_write(snapshot):
+        # Another modality's add (a writer) must not queue behind the disk write.
+        def take_write_lock():
+            with registry._lock.write():
+                writer_got_lock.append(True)
+
+        thread = threading.Thread(target=take_write_lock)
+        thread.start()
+        thread.join(timeout=2.0)
+        real_write(snapshot)
+
+    monkeypatch.setattr(store, "write_snapshot", slow_write)
+    registry.save()
+    assert writer_got_lock == [True]
+
+    registry.add(VectorType.IMAGE, vectors[6:])
+    reloaded = FaissIndexRegistry(str(tmp_path), dimension=DIM)
+    reloaded.load()
+    assert reloaded.store_for(VectorType.IMAGE).manifest().ntotal == 6
+    assert reloaded.store_for(VectorType.IMAGE).ntotal == 10
+
+
+def _fp16_registry(tmp_path) -> FaissIndexRegistry:
+    registry = FaissIndexRegistry(
+        str(tmp_path),
+        dimension=DIM,
+        specs={VectorType.IMAGE: IndexSpec(kind=IndexKind.SQ_FP16)},
+    )
+    registry.load()
+    return registry
+
+
+def test_raw_sidecar_tail_is_rebuilt_from_the_log(tmp_path) -> None:
+    registry = _fp16_registry(tmp_path)
+    vectors = _unit_vectors(8)
+    registry.add(VectorType.IMAGE, vectors[:5])
+    registry.add(VectorType.IMAGE, vectors[5:])
+    raw_path = tmp_path / "image.index.vectors"
+    # Crash mid-append: the sidecar lost a batch and ends in a torn row.
+    with open(raw_path, "r+b") as f:
+        f.truncate(5 * DIM * 4 + 7)
+
+    reloaded = _fp16_registry(tmp_path)
+    store = reloaded.store_for(VectorType.IMAGE)
+    assert store.raw_rows_missing == 0
+    assert raw_path.stat().st_size == 8 * DIM * 4
+    hits = reloaded.search(VectorType.IMAGE, vectors[6], 1)
+    assert hits[0] == (6, pytest.approx(float(vectors[6] @ vectors[6]), abs=1e-6))
+
+
+def test_raw_sidecar_behind_the_snapshot_is_reported(tmp_path) -> None:
+    registry = _fp16_registry(tmp_path)
+    registry.add(VectorType.IMAGE, _unit_vectors(5))
+    registry.save()
+    with open(tmp_path / "image.index.vectors", "r+b") as f:
+        f.truncate(3 * DIM * 4)
+
+    reloaded = _fp16_registry(tmp_path)
+    assert reloaded.store_for(VectorType.IMAGE).raw_rows_missing == 2
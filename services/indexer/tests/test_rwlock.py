@@ -0,0 +1,81 @@
+"""Unit tests for the thread readers-writer lock guarding the FAISS registry."""
+
+import threading
+import time
+
+from exports.utils.rwlock import ReadWriteLock
+
+
+def test_readers_share_the_lock() -> None:
+    lock = ReadWriteLock()
+    inside = threading.Barrier(2, timeout=2)
+
+    def reader() -> None:
+        with lock.read():
+            inside.wait()  # only passes if both readers hold the lock at once
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=2)
+    assert not inside.broken
+
+
+def test_writer_excludes_readers() -> None:
+    lock = ReadWriteLock()
+    events: list[str] = []
+    writer_in = threading.Event()
+
+    def writer() -> None:
+        with lock.write():
+            writer_in.set()
+            time.sleep(0.05)
+            events.append("write-done")
+
+    def reader() -> None:
+        writer_in.wait(timeout=2)
+        with lock.read():
+            events.append("read")
+
+    threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=2)
+    assert events == ["write-done", "read"]
+
+
+def test_waiting_writer_blocks_new_readers() -> None:
+    lock = ReadWriteLock()
+    events: list[str] = []
+    release_first_reader = threading.Event()
+    first_reader_in = threading.Event()
+
+    def first_reader() -> None:
+        with lock.read():
+            first_reader_in.set()
+            release_first_reader.wait(timeout=2)
+        events.append("reader1-out")
+
+    def writer() -> None:
+        with lock.write():
+            events.append("write")
+
+    def late_reader() -> None:
+        with lock.read():
+            events.append("reader2")
+
+    t1 = threading.Thread(target=first_reader)
+    t1.start()
+    first_reader_in.wait(timeout=2)
+    tw = threading.Thread(target=writer)
+    tw.start()
+    time.sleep(0.05)  # writer is now queued behind reader 1
+    t2 = threading.Thread(target=late_reader)
+    t2.start()
+    time.sleep(0.05)
+    release_first_reader.set()
+    for t in (t1, tw, t2):
+        t.join(timeout=2)
+    assert events.index("write") < events.index("reader2")
@@ -0,0 +1,101 @@
+"""Binary vector encoding: codec round trip and negotiated indexer routes."""
+
+import json
+import struct
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from exports.faiss_store import FaissIndexRegistry
+from exports.schema.constants import CLIP_DIMENSION, VectorType
+from exports.utils.vector_wire import (
+    VECTOR_MEDIA_TYPE,
+    decode,
+    encode,
+    request_kwargs,
+)
+from src.routes.search import router as search_router
+
+
+def test_codec_round_trips_nested_vectors() -> None:
+    payload = {
+        "media_id": "m",
+        "vectors": [
+            {"frame_id": "a", "embedding": [0.5, -1.0, 2.0]},
+            {"frame_id": "b", "embedding": [1.0, 0.25, 0.0]},
+        ],
+        "embeddings": [[1.0, 2.0], [3.0, 4.0]],
+        "top_k": {"image": 3},
+    }
+    raw = encode(payload)
+    assert b"0.25" not in raw  # vectors travel packed, not as text
+    assert decode(raw) == payload
+
+    rows = decode(raw, arrays=True)["embeddings"]
+    assert all(isinstance(row, np.ndarray) and row.dtype == np.float32 for row in rows)
+    np.testing.assert_array_equal(rows[1], [3.0, 4.0])
+
+
+def _client(tmp_path) -> tuple[TestClient, np.ndarray]:
+    registry = FaissIndexRegistry(str(tmp_path))
+    registry.load()
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((5, CLIP_DIMENSION)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    registry.add(VectorType.IMAGE, vectors)
+
+    app = FastAPI()
+    app.state.faiss = registry
+    app.include_router(search_router, prefix="/vectors/search")
+    return TestClient(app), vectors
+
+
+def test_search_accepts_binary_and_json_bodies(tmp_path) -> None:
+    client, vectors = _client(tmp_path)
+    payload = {"embedding": vectors[2].tolist(), "top_k": 1, "vector_type": "image"}
+
+    binary = client.post("/vectors/search/", **request_kwargs(payload, binary=True))
+    plain = client.post("/vectors/search/", json=payload)
+    assert binary.status_code == plain.status_code == 200
+    assert binary.json() == plain.json()
+    assert binary.json()["hits"][0]["faiss_index_id"] == 2
+
+
+def test_binary_body_validation_is_422(tmp_path) -> None:
+    client, _ = _client(tmp_path)
+    r = client.post(
+        "/vectors/search/",
+        content=b"\x01\x00",
+        headers={"content-type": VECTOR_MEDIA_TYPE},
+    )
+    assert r.status_code == 422
+    r = client.post(
+        "/vectors/search/", **request_kwargs({"embedding": [1.0]}, binary=True)
+    )
+    assert r.status_code == 422
+
+
+def test_binary_body_with_bad_row_reference_is_422(tmp_path) -> None:
+    client, vectors = _client(tmp_path)
+    data = vectors[0].astype("<f4").tobytes()
+    for row in (5, -1, "0"):
+        header = json.dumps(
+            {"body": {"embedding": {"$row": row}, "top_k": 1}, "lengths": [CLIP_DIMENSION]}
+        ).encode("utf-8")
+        r = client.post(
+            "/vectors/search/",
+            content=struct.pack("<I", len(header)) + header + data,
+            headers={"content-type": VECTOR_MEDIA_TYPE},
+        )
+        assert r.status_code == 422, row
+
+
+def test_binary_batch_search_matches_json(tmp_path) -> None:
+    client, vectors = _client(tmp_path)
+    payload = {"embeddings": [vectors[1].tolist(), vectors[4].tolist()], "top_k": {"image": 1}}
+
+    binary = client.post("/vectors/search/batch", **request_kwargs(payload, binary=True))
+    plain = client.post("/vectors/search/batch", json=payload)
+    assert binary.status_code == plain.status_code == 200
+    assert binary.json() == plain.json()
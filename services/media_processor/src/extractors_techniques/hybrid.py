@@ -4,7 +4,7 @@ import cv2
 
 from exports.utils.logger import get_logger
 
-from ..sampling.hybrid_sampler import hybrid_sample_video
+from ..sampling.hybrid_sampler import hybrid_sample_video, sample_evenly_spaced
 from ..utils.video_utils import get_video_metadata
 
 logger = get_logger()
@@ -44,3 +44,38 @@ def extract_frames_hybrid(video_path: str, threshold: int) -> dict:
 
     logger.info(f"Hybrid extracted {len(frames)} frames")
     return {"duration": metadata["duration"], "frames": frames}
+
+
+def extract_query_frames(video_path: str, max_frames: int) -> dict:
+    """
+    Pick up to ``max_frames`` representative frames of a search clip.
+
+    Seeks straight to evenly spaced frames instead of running the ingest
+    sampler, so decoding (and so query latency) is bounded by ``max_frames``
+    regardless of clip length.
+
+    Returns:
+        {"duration": float, "frames": list of (timestamp, base64_jpeg)}
+    """
+    metadata = get_video_metadata(video_path)
+    sampled = sample_evenly_spaced(video_path, max_frames)
+
+    if not sampled:
+        cap = cv2.VideoCapture(video_path)
+        ret, frame = cap.read()
+        cap.release()
+        if not ret:
+            raise ValueError("Could not read any frames from video")
+        _, buffer = cv2.imencode(".jpg", frame)
+        return {
+            "duration": metadata["duration"],
+            "frames": [(0.0, base64.b64encode(buffer).decode("utf-8"))],
+        }
+
+    frames = []
+    for sf in sampled:
+        _, buffer = cv2.imencode(".jpg", sf.frame)
+        frames.append((sf.timestamp, base64.b64encode(buffer).decode("utf-8")))
+
+    logger.info(f"Query clip: {len(frames)} representative frames")
+    return {"duration": metadata["duration"], "frames": frames}
@@ -1,13 +1,15 @@
 """Frame extraction endpoint.
 
 Pipeline (per request):
-    1. Download the source video from MinIO into a temp file.
+    1. Get a local copy of the source video from the shared video cache
+       (``exports.video_cache``), downloading it from MinIO on a miss.
     2. Run the chosen extractor → list of (timestamp, base64) frames + duration.
     3. Insert a `media` row (status=processing) so the rest of the pipeline
        has a stable id to attach to.
-    4. Upload each extracted frame as a JPEG to MinIO under
-       ``frames/<media_id>/<sequence>.jpg`` and insert one ``frames`` row
-       per upload (batched).
+    4. Upload the extracted frames as JPEGs to MinIO under
+       ``frames/<media_id>/<sequence>.jpg`` (concurrently, see
+       ``MinioDB.upload_many``) and insert one ``frames`` row per upload
+       (batched).
     5. Return ``ExtractFramesResponse`` with both the persisted identity
        (``frame_id``, ``frame_url``) and the in-memory base64 payload
        so the embedder can read pixels without re-downloading from MinIO.
@@ -16,8 +18,8 @@ If anything fails after the media row is inserted, we mark it as
 ``failed`` before re-raising so the orchestrator (API) sees the state.
 """
 
+import asyncio
 import base64
-import io
 import os
 import tempfile
 
@@ -26,17 +28,26 @@ from pydantic import BaseModel
 
 from exports.db_clients.minioDB import MinioDB
 from exports.db_clients.supabaseDB import SupabaseDB
-from exports.schema.constants import ExtractionStrategy, MediaStatus, MediaType
+from exports.schema.constants import (
+    SEARCH_VIDEO_MAX_BYTES,
+    SEARCH_VIDEO_MAX_FRAMES,
+    ExtractionStrategy,
+    MediaStatus,
+    MediaType,
+)
 from exports.schema.models import (
     ExtractFramesResponse,
     FrameCreate,
     FrameData,
     MediaCreate,
     MediaUpdate,
+    QueryFrame,
+    QueryFramesResponse,
 )
 from exports.utils.logger import get_logger
+from exports.video_cache import VideoCache
 
-from ..extractors_techniques.hybrid import extract_frames_hybrid
+from ..extractors_techniques.hybrid import extract_frames_hybrid, extract_query_frames
 
 router = APIRouter()
 logger = get_logger()
@@ -90,18 +101,17 @@ async def extract_frames(
         f"(strategy={strategy.value})"
     )
 
-    # ---- 1. Download video to a temp file ------------------------------
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as temp_file:
-        temp_path = temp_file.name
-        temp_file.write(await minio.download_file(extract_req.video_object_key))
-
+    video_cache: VideoCache = request.app.state.video_cache
     media_id: str | None = None
     try:
-        # ---- 2. Extract frames in-memory -------------------------------
-        extraction = extract_frames_hybrid(
-            video_path=temp_path,
-            threshold=threshold,
-        )
+        # ---- 1+2. Fetch via the node-local cache, extract frames in-memory
+        async with video_cache.open(
+            minio, extract_req.video_object_key
+        ) as video_path:
+            extraction = extract_frames_hybrid(
+                video_path=video_path,
+                threshold=threshold,
+            )
 
         duration = float(extraction["duration"])
         raw_frames = extraction["frames"]
@@ -121,28 +131,27 @@ async def extract_frames(
         media_id = str(media_row.id)
         logger.info(f"Inserted media row id={media_id}")
 
-        # ---- 4. Upload each frame to MinIO + collect FrameCreate ------
-        frame_creates: list[FrameCreate] = []
-        frame_urls: list[str] = []
-        for seq, frame_item in enumerate(raw_frames):
-            timestamp, frame_b64, phash = _unpack_frame(frame_item)
-            object_key = _frame_object_key(media_id, seq)
-            jpeg_bytes = base64.b64decode(frame_b64)
-            frame_url = await minio.upload_file(
-                object_name=object_key,
-                file_data=io.BytesIO(jpeg_bytes),
-                content_type="image/jpeg",
+        # ---- 4. Upload all frames to MinIO concurrently ---------------
+        unpacked = [_unpack_frame(frame_item) for frame_item in raw_frames]
+        frame_urls = await minio.upload_many(
+            [
+                (_frame_object_key(media_id, seq), base64.b64decode(frame_b64))
+                for seq, (_, frame_b64, _) in enumerate(unpacked)
+            ],
+            content_type="image/jpeg",
+        )
+        frame_creates = [
+            FrameCreate(
+                media_id=media_row.id,
+                timestamp=timestamp,
+                frame_url=frame_url,
+                sequence_number=seq,
+                phash=phash,
             )
-            frame_urls.append(frame_url)
-            frame_creates.append(
-                FrameCreate(
-                    media_id=media_row.id,
-                    timestamp=timestamp,
-                    frame_url=frame_url,
-                    sequence_number=seq,
-                    phash=phash,
-                )
+            for seq, ((timestamp, _, phash), frame_url) in enumerate(
+                zip(unpacked, frame_urls)
             )
+        ]
 
         # ---- 5. Insert frames rows in one batch ------------------------
         frame_rows = await supabase.insert_frames_batch(frame_creates)
@@ -186,8 +195,45 @@ async def extract_frames(
             except Exception:
                 logger.exception("Failed to mark media row as 'failed'")
         raise HTTPException(500, str(e))
+
+
+@router.post("/query", response_model=QueryFramesResponse)
+async def extract_query_clip_frames(
+    request: Request,
+    max_frames: int = Query(SEARCH_VIDEO_MAX_FRAMES, ge=1),
+):
+    """Representative frames of a search clip sent as the raw request body.
+
+    Nothing is persisted: no media row, no MinIO objects. ``max_frames`` is
+    clamped to ``SEARCH_VIDEO_MAX_FRAMES``.
+    """
+    data = await request.body()
+    if not data:
+        raise HTTPException(422, "video body must not be empty")
+    if len(data) > SEARCH_VIDEO_MAX_BYTES:
+        raise HTTPException(413, "video body is too large")
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as temp_file:
+        temp_path = temp_file.name
+        temp_file.write(data)
+    try:
+        extraction = await asyncio.to_thread(
+            extract_query_frames,
+            temp_path,
+            min(max_frames, SEARCH_VIDEO_MAX_FRAMES),
+        )
+    except (ValueError, RuntimeError) as e:
+        raise HTTPException(400, str(e)) from e
     finally:
         try:
             os.unlink(temp_path)
         except OSError:
             pass
+
+    return QueryFramesResponse(
+        frames=[
+            QueryFrame(timestamp=timestamp, frame_data=frame_b64)
+            for timestamp, frame_b64 in extraction["frames"]
+        ],
+        duration=float(extraction["duration"]),
+    )
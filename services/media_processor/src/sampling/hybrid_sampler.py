@@ -26,8 +26,8 @@ class SampledFrame:
     frame_index: int
     timestamp: float
     frame: np.ndarray
-    phash: str
-    trigger: str  # scene_boundary | phash_change | floor
+    phash: Optional[str]  # None for even_spacing frames (not deduplicated)
+    trigger: str  # scene_boundary | phash_change | floor | even_spacing
 
 
 def hybrid_sample_video(video_path: str, scene_threshold: int) -> List[SampledFrame]:
@@ -74,6 +74,53 @@ def hybrid_sample_video(video_path: str, scene_threshold: int) -> List[SampledFr
     return sampled
 
 
+def sample_evenly_spaced(video_path: str, max_frames: int) -> List[SampledFrame]:
+    """Seek to and decode at most ``max_frames`` frames spread evenly over the video.
+
+    Unlike ``hybrid_sample_video`` nothing else is decoded, so the cost is
+    bounded by ``max_frames`` regardless of clip length.
+    """
+    if max_frames <= 0:
+        return []
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Cannot open video: {video_path}")
+
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    if fps <= 0:
+        cap.release()
+        raise ValueError(f"Invalid FPS for video: {video_path}")
+
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    if total_frames <= max_frames:
+        indices = list(range(max(total_frames, 0)))
+    else:
+        # Centre of each of ``max_frames`` equal slices of the clip.
+        indices = [
+            (2 * k + 1) * total_frames // (2 * max_frames) for k in range(max_frames)
+        ]
+
+    sampled: List[SampledFrame] = []
+    for frame_idx in indices:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+        ret, frame = cap.read()
+        if not ret:
+            logger.warning("Failed to read frame %d", frame_idx)
+            continue
+        sampled.append(
+            SampledFrame(
+                frame_index=frame_idx,
+                timestamp=frame_idx / fps,
+                frame=frame.copy(),
+                phash=None,
+                trigger="even_spacing",
+            )
+        )
+
+    cap.release()
+    return sampled
+
+
 def _build_scene_bounds(scene_list, total_frames: int) -> List[Tuple[int, int]]:
     if not scene_list:
         return [(0, max(total_frames - 1, 0))]
@@ -6,7 +6,11 @@ import cv2
 import numpy as np
 
 from sampling.deduplication import SampleGuard
-from sampling.hybrid_sampler import SampledFrame, _process_scene
+from sampling.hybrid_sampler import (
+    SampledFrame,
+    _process_scene,
+    sample_evenly_spaced,
+)
 
 
 class _FakeTimecode:
@@ -133,3 +137,30 @@ def test_hybrid_sample_video_no_scenes_falls_back_to_whole_video(
     args = mock_process.call_args.kwargs
     assert args["scene_start"] == 0
     assert args["scene_end"] == 3
+
+
+@patch("sampling.hybrid_sampler.cv2.VideoCapture")
+def test_sample_evenly_spaced_decodes_only_the_picked_frames(
+    mock_capture_cls: MagicMock,
+) -> None:
+    frames = [_make_frame(i) for i in range(20)]
+    cap = _make_cap(frames)
+    cap.isOpened.return_value = True
+    cap.get.side_effect = lambda prop: {
+        cv2.CAP_PROP_FPS: 2.0,
+        cv2.CAP_PROP_FRAME_COUNT: len(frames),
+    }.get(prop, 0)
+    mock_capture_cls.return_value = cap
+
+    picked = sample_evenly_spaced("clip.mp4", 4)
+    assert [f.frame_index for f in picked] == [2, 7, 12, 17]
+    assert [f.timestamp for f in picked] == [1.0, 3.5, 6.0, 8.5]
+    assert {(f.trigger, f.phash) for f in picked} == {("even_spacing", None)}
+    assert cap.read.call_count == 4
+
+    cap.read.reset_mock()
+    cap.get.side_effect = lambda prop: {
+        cv2.CAP_PROP_FPS: 2.0,
+        cv2.CAP_PROP_FRAME_COUNT: 3,
+    }.get(prop, 0)
+    assert [f.frame_index for f in sample_evenly_spaced("clip.mp4", 4)] == [0, 1, 2]
@@ -0,0 +1,86 @@
+"""Chunked MinIO downloads (MinioDB.iter_file / download_to_path)."""
+
+import asyncio
+
+from exports.db_clients.minioDB import MinioDB
+
+
+class _Content:
+    def __init__(self, data: bytes, events: list | None = None) -> None:
+        self.data = data
+        self.requested: list[int] = []
+        self.events = events if events is not None else []
+
+    async def iter_chunked(self, n: int):
+        self.requested.append(n)
+        for start in range(0, len(self.data), n):
+            self.events.append(("read", start // n))
+            yield self.data[start : start + n]
+
+
+class _Response:
+    def __init__(self, data: bytes, events: list | None = None) -> None:
+        self.content = _Content(data, events)
+        self.released = False
+
+    async def release(self) -> None:
+        self.released = True
+
+
+class _Client:
+    def __init__(self, data: bytes, events: list | None = None) -> None:
+        self.response = _Response(data, events)
+
+    async def get_object(self, bucket_name: str, object_name: str) -> _Response:
+        return self.response
+
+
+def test_download_to_path_streams_in_bounded_chunks(tmp_path) -> None:
+    data = bytes(range(256)) * 40
+    client = _Client(data)
+    path = tmp_path / "video.mp4"
+
+    size = asyncio.run(MinioDB(client).download_to_path("v.mp4", str(path), chunk_size=1000))
+
+    assert size == len(data)
+    assert path.read_bytes() == data
+    assert client.response.content.requested == [1000]
+    assert client.response.released
+
+
+def test_download_to_path_reads_next_chunk_while_writing(tmp_path, monkeypatch) -> None:
+    events: list = []
+    client = _Client(b"abcdefghij", events)
+    path = tmp_path / "video.mp4"
+    writes = 0
+
+    async def slow_to_thread(fn, *args):
+        nonlocal writes
+        if fn.__name__ == "write":
+            index = writes
+            writes += 1
+            await asyncio.sleep(0.01)
+            events.append(("written", index))
+        return fn(*args)
+
+    monkeypatch.setattr(asyncio, "to_thread", slow_to_thread)
+    size = asyncio.run(MinioDB(client).download_to_path("v.mp4", str(path), chunk_size=4))
+
+    assert size == 10
+    assert path.read_bytes() == b"abcdefghij"
+    assert events.index(("read", 1)) < events.index(("written", 0))
+    # Never more than one write in flight.
+    assert events.index(("written", 0)) < events.index(("read", 2))
+
+
+def test_iter_file_releases_connection_when_abandoned() -> None:
+    client = _Client(b"x" * 10)
+
+    async def first_chunk() -> bytes:
+        chunks = MinioDB(client).iter_file("v.mp4", chunk_size=4)
+        chunk = await anext(chunks)
+        await chunks.aclose()
+        return chunk
+
+    assert asyncio.run(first_chunk()) == b"xxxx"
+    assert client.response.released
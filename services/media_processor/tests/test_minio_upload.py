@@ -0,0 +1,67 @@
+"""Concurrent, retried bulk uploads (MinioDB.upload_many)."""
+
+import asyncio
+import random
+
+import pytest
+
+from exports.db_clients import minioDB
+from exports.db_clients.minioDB import MinioDB
+
+
+class _Client:
+    def __init__(self, *, failures: dict | None = None) -> None:
+        self.failures = dict(failures or {})
+        self.in_flight = 0
+        self.peak = 0
+        self.stored: dict[str, bytes] = {}
+        self.attempts: dict[str, int] = {}
+
+    async def put_object(self, bucket_name, object_name, data, length, content_type):
+        self.attempts[object_name] = self.attempts.get(object_name, 0) + 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(random.uniform(0.001, 0.01))
+            if self.failures.get(object_name, 0) > 0:
+                self.failures[object_name] -= 1
+                raise ConnectionError("reset by peer")
+            payload = data.read()
+            assert len(payload) == length
+            self.stored[object_name] = payload
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch) -> None:
+    monkeypatch.setattr(minioDB, "MINIO_UPLOAD_RETRY_BACKOFF", 0.0)
+
+
+def test_uploads_are_bounded_retried_and_returned_in_order() -> None:
+    client = _Client(failures={"frames/0003.jpg": 2})
+    objects = [(f"frames/{i:04d}.jpg", bytes([i]) * 10) for i in range(40)]
+
+    urls = asyncio.run(
+        MinioDB(client).upload_many(objects, "image/jpeg", concurrency=4, retries=2)
+    )
+
+    assert [url.rsplit("/", 2)[-2:] for url in urls] == [
+        name.split("/") for name, _ in objects
+    ]
+    assert client.peak == 4
+    assert client.attempts["frames/0003.jpg"] == 3
+    assert client.stored == dict(objects)
+
+
+def test_exhausted_retries_raise_and_cancel_the_rest() -> None:
+    client = _Client(failures={"frames/0000.jpg": 5})
+    objects = [(f"frames/{i:04d}.jpg", b"x") for i in range(20)]
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(
+            MinioDB(client).upload_many(objects, "image/jpeg", concurrency=2, retries=1)
+        )
+
+    assert client.attempts["frames/0000.jpg"] == 2
+    assert len(client.stored) < len(objects) - 1
@@ -0,0 +1,109 @@
+"""Shared, content-addressed source-video cache."""
+
+import asyncio
+import os
+
+from exports.video_cache import VideoCache
+
+
+class _FakeMinio:
+    def __init__(self, objects: dict) -> None:
+        self.objects = objects
+        self.downloads: list[str] = []
+
+    async def object_etag(self, object_name: str) -> str:
+        return str(hash(self.objects[object_name]))
+
+    async def download_to_path(self, object_name: str, path: str) -> int:
+        self.downloads.append(object_name)
+        await asyncio.sleep(0.01)
+        with open(path, "wb") as fh:
+            return fh.write(self.objects[object_name])
+
+
+async def _read(cache: VideoCache, minio: _FakeMinio, key: str) -> bytes:
+    async with cache.open(minio, key) as path:
+        with open(path, "rb") as fh:
+            return fh.read()
+
+
+def test_concurrent_readers_share_one_download(tmp_path) -> None:
+    minio = _FakeMinio({"videos/a.mp4": b"a" * 100})
+    cache = VideoCache(str(tmp_path), max_bytes=0)
+
+    def read(on: VideoCache = cache) -> bytes:
+        return asyncio.run(_read(on, minio, "videos/a.mp4"))
+
+    async def run():
+        return await asyncio.gather(*(_read(cache, minio, "videos/a.mp4") for _ in range(3)))
+
+    assert asyncio.run(run()) == [b"a" * 100] * 3
+    # Another service (its own cache object) on the same volume also hits.
+    assert read(VideoCache(str(tmp_path), max_bytes=0)) == b"a" * 100
+    assert minio.downloads == ["videos/a.mp4"]
+    assert not [name for name in os.listdir(tmp_path) if ".part." in name]
+
+    # New content under the same key is a different entry.
+    minio.objects["videos/a.mp4"] = b"b" * 100
+    assert read() == b"b" * 100
+    assert len(minio.downloads) == 2
+
+
+def test_lru_eviction_skips_pinned_entries(tmp_path) -> None:
+    minio = _FakeMinio({f"{name}.mp4": name.encode() * 40 for name in "abc"})
+    cache = VideoCache(str(tmp_path), max_bytes=100)
+
+    async def touch(key: str) -> None:
+        async with cache.open(minio, key):
+            pass
+
+    async def run():
+        await touch("a.mp4")
+        await asyncio.sleep(0.02)
+        await touch("b.mp4")  # 80 bytes, under budget
+        await asyncio.sleep(0.02)
+        await touch("a.mp4")  # hit: a is now most recent
+        await asyncio.sleep(0.02)
+        async with cache.open(minio, "c.mp4") as pinned:
+            # 120 bytes; b is least recent and unpinned, c is in use.
+            assert cache.evict() == 1
+            assert os.path.exists(pinned)
+        return cache.stats()
+
+    stats = asyncio.run(run())
+    assert stats["entries"] == 2
+    assert stats["bytes"] == 80
+    assert stats["hits"] == 1
+    assert stats["fills"] == 3
+    assert os.path.exists(cache.entry_path("a.mp4", str(hash(b"a" * 40))))
+    evicted = cache.entry_path("b.mp4", str(hash(b"b" * 40)))
+    assert not os.path.exists(evicted)
+    assert not os.path.exists(evicted + ".lock")
+    assert len([name for name in os.listdir(tmp_path) if name.endswith(".lock")]) == 2
+
+
+def test_reader_retries_on_a_lock_file_evicted_before_it_locked(tmp_path) -> None:
+    minio = _FakeMinio({"a.mp4": b"a" * 40})
+    cache = VideoCache(str(tmp_path), max_bytes=0)
+    path = cache.entry_path("a.mp4", str(hash(b"a" * 40)))
+    open_lock = cache._open_lock
+    opened = []
+
+    def open_then_evicted(entry: str) -> int:
+        fd = open_lock(entry)
+        if not opened:
+            # Eviction unlinks the lock file between this open and the flock.
+            os.unlink(entry + ".lock")
+        opened.append(fd)
+        return fd
+
+    cache._open_lock = open_then_evicted
+
+    async def run() -> bytes:
+        async with cache.open(minio, "a.mp4") as local:
+            assert os.path.exists(path + ".lock")
+            with open(local, "rb") as fh:
+                return fh.read()
+
+    assert asyncio.run(run()) == b"a" * 40
+    assert len(opened) == 2
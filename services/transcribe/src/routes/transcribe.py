@@ -1,8 +1,6 @@
 """Transcription endpoint: download video, run Whisper, persist transcript chunks."""
 
 import asyncio
-import os
-import tempfile
 
 from fastapi import APIRouter, HTTPException, Request
 
@@ -15,6 +13,7 @@ from exports.schema.models import (
     TranscriptSegmentData,
 )
 from exports.utils.logger import get_logger
+from exports.video_cache import VideoCache
 
 from ..whisper_service import WhisperEngine
 
@@ -33,7 +32,7 @@ def _get_engine(request: Request) -> WhisperEngine:
 async def transcribe_video(
     request: Request, body: TranscribeRequest
 ) -> TranscribeResponse:
-    """Download a video from MinIO, transcribe it, and store CLIP-safe chunks."""
+    """Transcribe a cached copy of a MinIO video and store CLIP-safe chunks."""
     minio: MinioDB = request.app.state.minio
     supabase: SupabaseDB = request.app.state.supabase
     engine = _get_engine(request)
@@ -44,12 +43,10 @@ async def transcribe_video(
         body.video_object_key,
     )
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as temp_file:
-        temp_path = temp_file.name
-        temp_file.write(await minio.download_file(body.video_object_key))
-
+    video_cache: VideoCache = request.app.state.video_cache
     try:
-        chunks = await asyncio.to_thread(engine.transcribe_to_chunks, temp_path)
+        async with video_cache.open(minio, body.video_object_key) as video_path:
+            chunks = await asyncio.to_thread(engine.transcribe_to_chunks, video_path)
         if not chunks:
             logger.info("No speech detected for media_id=%s", body.media_id)
             return TranscribeResponse(
@@ -92,8 +89,3 @@ async def transcribe_video(
     except Exception as exc:
         logger.error("Transcription failed for media_id=%s: %s", body.media_id, exc, exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
-    finally:
-        try:
-            os.unlink(temp_path)
-        except OSError:
-            pass